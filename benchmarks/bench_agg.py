@@ -0,0 +1,149 @@
+"""Benchmark faster paths of aggregators against the paths they replace.
+
+Run with::
+
+    python benchmarks/bench_agg.py
+
+Composite aggregators compute each of their parts (``count``, ``sum``, and
+``sum_of_squares``) with a separate reduction before finalizing.  Aggregators
+with ``fused=`` compute all parts in one pass over the values instead.  The
+composite path is timed with copies of the aggregators that don't have ``fused=``.
+
+Semiring aggregators, such as ``agg.sum_of_squares`` and ``agg.L1norm``, reduce a
+Matrix to a Scalar directly (or from ``nvals`` for ``agg.count``) for most shapes
+instead of reducing rows to a Vector first.  The two-step path is timed by
+patching ``grblas._agg._reduces_directly``.
+
+``agg.argmin`` and ``agg.argmax`` find the index of the min or max value in one
+pass over the values instead of with several GraphBLAS operations.  The GraphBLAS
+recipe is timed by patching ``grblas._agg._can_fuse``.
+
+``Vector.groupby(labels).agg(...)`` aggregates every group with sparse products
+with an assignment Matrix.  It is timed against reducing each group in a loop.
+"""
+import timeit
+
+import numpy as np
+
+import grblas as gb
+from grblas import Matrix, Vector, _agg, agg
+
+
+def composite(aggregator):
+    return agg.Aggregator(
+        f"{aggregator.name}_composite",
+        composite=aggregator._composite,
+        finalize=aggregator._finalize,
+        types=aggregator._types_orig,
+    )
+
+
+def bench(label, func, number):
+    func()  # warm up (and compile numba functions)
+    best = min(timeit.repeat(func, number=number, repeat=5))
+    print(f"{label:<40} {1e3 * best / number:>10.3f} ms")
+
+
+def random_matrix(nrows, ncols, nvals, rng):
+    return Matrix.from_values(
+        rng.integers(0, nrows, nvals),
+        rng.integers(0, ncols, nvals),
+        rng.random(nvals),
+        nrows=nrows,
+        ncols=ncols,
+        dup_op=gb.binary.plus,
+    )
+
+
+def bench_fused(A, number):
+    print(f"\n{A.nrows}x{A.ncols} FP64 Matrix with {A.nvals} values")
+    for aggregator in [agg.varp, agg.vars, agg.stdp, agg.stds]:
+        slow = composite(aggregator)
+        for method in ["reduce_rowwise", "reduce_columnwise", "reduce_scalar"]:
+            bench(
+                f"{method}({aggregator.name}) composite",
+                lambda: getattr(A, method)(slow).new(),
+                number,
+            )
+            bench(
+                f"{method}({aggregator.name}) fused",
+                lambda: getattr(A, method)(aggregator).new(),
+                number,
+            )
+
+
+def bench_reduce_scalar(A, number):
+    print(f"\n{A.nrows}x{A.ncols} FP64 Matrix with {A.nvals} values")
+    reduces_directly = _agg._reduces_directly
+    for aggregator in [agg.count, agg.sum_of_squares, agg.L1norm]:
+        _agg._reduces_directly = lambda *args: False
+        try:
+            bench(
+                f"reduce_scalar({aggregator.name}) two-step",
+                lambda: A.reduce_scalar(aggregator).new(),
+                number,
+            )
+        finally:
+            _agg._reduces_directly = reduces_directly
+        bench(
+            f"reduce_scalar({aggregator.name}) direct",
+            lambda: A.reduce_scalar(aggregator).new(),
+            number,
+        )
+
+
+def bench_argminmax(A, number):
+    print(f"\n{A.nrows}x{A.ncols} FP64 Matrix with {A.nvals} values")
+    can_fuse = _agg._can_fuse
+    for aggregator in [agg.argmin, agg.argmax]:
+        for method in ["reduce_rowwise", "reduce_columnwise"]:
+            _agg._can_fuse = lambda *args: False
+            try:
+                bench(
+                    f"{method}({aggregator.name}) GraphBLAS",
+                    lambda: getattr(A, method)(aggregator).new(),
+                    number,
+                )
+            finally:
+                _agg._can_fuse = can_fuse
+            bench(
+                f"{method}({aggregator.name}) one pass",
+                lambda: getattr(A, method)(aggregator).new(),
+                number,
+            )
+
+
+def bench_groupby(size, ngroups, number, rng):
+    v = Vector.from_values(np.arange(size), rng.random(size))
+    labels = rng.integers(0, ngroups, size)
+    print(f"\nFP64 Vector with {size} values in {ngroups} groups")
+    members = [np.flatnonzero(labels == group) for group in range(ngroups)]
+    for aggregator in [agg.sum, agg.count, agg.mean, agg.varp]:
+        bench(
+            f"groupby({aggregator.name}) loop",
+            lambda: [v[indices].new().reduce(aggregator).new() for indices in members],
+            number,
+        )
+        bench(
+            f"groupby({aggregator.name})",
+            lambda: v.groupby(labels, ngroups=ngroups).agg(aggregator),
+            number,
+        )
+
+
+def main(number=5):
+    rng = np.random.default_rng(42)
+    print(f"grblas {gb.__version__}")
+    A = random_matrix(100_000, 100_000, 2_000_000, rng)
+    bench_fused(A, number)
+    bench_reduce_scalar(A, number)
+    bench_reduce_scalar(random_matrix(1_000_000, 10, 1_000_000, rng), number)
+    bench_reduce_scalar(random_matrix(1_000_000, 1_000_000, 1_000, rng), number * 100)
+    bench_reduce_scalar(random_matrix(1_000, 1_000, 1_000, rng), number * 100)
+    bench_argminmax(A, number)
+    bench_argminmax(random_matrix(1_000, 1_000, 1_000, rng), number * 100)
+    bench_groupby(1_000_000, 1_000, number, rng)
+
+
+if __name__ == "__main__":
+    main()
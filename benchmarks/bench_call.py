@@ -0,0 +1,66 @@
+"""Measure the Python overhead of dispatching GraphBLAS C calls through ``grblas.base.call``.
+
+Run with::
+
+    python benchmarks/bench_call.py
+
+Several ways of calling ``GrB_Vector_nvals`` are timed:
+
+- directly via cffi, which is the lower bound;
+- via ``uncached_call`` below, which dispatches the way ``base.call`` used to
+  (``libget`` on every call and a recorder lookup even if none was started);
+- via ``base.call`` with no recorder ever started (the fast path);
+- via ``base.call`` while a ``Recorder`` is active;
+- via ``v.nvals`` and a tiny ``w << A.mxv(v)`` for end-to-end context.
+"""
+import timeit
+
+import grblas as gb
+from grblas import Matrix, Recorder, Vector, base, ffi, lib
+from grblas.exceptions import check_status
+from grblas.utils import _Pointer, libget
+
+
+def uncached_call(cfunc_name, args):
+    call_args = [getattr(x, "_carg", x) if x is not None else base.NULL for x in args]
+    cfunc = libget(cfunc_name)
+    err_code = cfunc(*call_args)
+    rv = check_status(err_code, args)
+    rec = base._recorder.get(base._prev_recorder)
+    if rec is not None:
+        rec.record(cfunc_name, args)
+    return rv
+
+
+def bench(label, stmt, number):
+    best = min(timeit.repeat(stmt, number=number, repeat=5))
+    print(f"{label:<40} {1e9 * best / number:>10.1f} ns/call")
+
+
+def main(number=200_000):
+    v = Vector.from_values([0, 2], [1, 2], size=4)
+    A = Matrix.from_values([0, 1, 3], [1, 2, 0], [1, 2, 3], nrows=4, ncols=4)
+    w = Vector.new(v.dtype, size=4)
+    n = ffi.new("GrB_Index*")
+    scalar = gb.Scalar(n, gb.dtypes._INDEX, name="s_nvals", is_cscalar=True, empty=True)
+    args = [_Pointer(scalar), v]
+    gb_obj = v.gb_obj[0]
+
+    print(f"grblas {gb.__version__}")
+    bench("cffi: lib.GrB_Vector_nvals", lambda: lib.GrB_Vector_nvals(n, gb_obj), number)
+    bench("uncached_call (before)", lambda: uncached_call("GrB_Vector_nvals", args), number)
+    assert not base._recorder_started, "a Recorder was started before the fast path benchmark"
+    bench("base.call (fast path, after)", lambda: base.call("GrB_Vector_nvals", args), number)
+    bench("v.nvals (fast path)", lambda: v.nvals, number // 4)
+    bench("w << A.mxv(v) (fast path)", lambda: w.update(A.mxv(v)), number // 20)
+    with Recorder(max_rows=0) as rec:
+        bench("base.call (recorder active)", lambda: base.call("GrB_Vector_nvals", args), number)
+        rec.clear()
+        bench("v.nvals (recorder active)", lambda: v.nvals, number // 4)
+        rec.clear()
+        bench("w << A.mxv(v) (recorder active)", lambda: w.update(A.mxv(v)), number // 20)
+        rec.clear()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Measure how long it takes to import grblas in a new process.
+
+Run with::
+
+    python benchmarks/bench_import.py [--repeat N] [--max-seconds SECONDS]
+
+Each measurement runs a new Python process, so nothing is cached between runs
+except by the operating system.  The following are timed:
+
+- ``import numba``, which grblas always imports and is a lower bound;
+- ``import grblas`` followed by ``from grblas import Matrix, Vector``, which
+  creates the builtin unary ops, binary ops, and monoids;
+- the above followed by ``grblas.semiring.plus_times``, which also creates
+  the builtin semirings (they are created the first time they are used).
+
+If ``--max-seconds`` is given, exit with an error if importing grblas is slower,
+which can be used to catch regressions in startup time.
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = {
+    "import numba": "import numba",
+    "import grblas; Matrix, Vector": "import grblas; from grblas import Matrix, Vector",
+    "... + semiring.plus_times": (
+        "import grblas; from grblas import Matrix, Vector; grblas.semiring.plus_times"
+    ),
+}
+TIMER = """\
+import time
+start = time.perf_counter()
+{}
+print(time.perf_counter() - start)
+"""
+
+
+def time_statement(stmt, repeat):
+    code = TIMER.format(stmt.replace("; ", "\n"))
+    return [
+        float(subprocess.check_output([sys.executable, "-c", code], text=True))
+        for _ in range(repeat)
+    ]
+
+
+def main(repeat=10, max_seconds=None):
+    results = {}
+    for label, stmt in STATEMENTS.items():
+        times = time_statement(stmt, repeat)
+        results[label] = times
+        print(
+            f"{label:<32} min {1e3 * min(times):8.1f} ms   "
+            f"median {1e3 * statistics.median(times):8.1f} ms"
+        )
+    if max_seconds is not None:
+        median = statistics.median(results["import grblas; Matrix, Vector"])
+        if median > max_seconds:
+            print(f"\nImporting grblas took {median:.3f} s, which exceeds {max_seconds} s")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--max-seconds", type=float, default=None)
+    args = parser.parse_args()
+    sys.exit(main(args.repeat, args.max_seconds))
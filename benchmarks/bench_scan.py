@@ -0,0 +1,55 @@
+"""Benchmark prefix scans of Matrix rows with and without numba.
+
+Run with::
+
+    python benchmarks/bench_scan.py
+
+Scans with builtin monoids (plus, times, min, max, land, lor) scan the exported
+values of each row in one parallel pass.  Other monoids use a sequence of
+GraphBLAS ``mxm`` calls, which is timed by patching
+``grblas._ss.prefix_scan._can_scan_values``.
+"""
+import timeit
+
+import numpy as np
+
+import grblas as gb
+from grblas import Matrix, monoid
+from grblas._ss import prefix_scan
+
+
+def bench(label, func, number):
+    func()  # warm up (and compile numba functions)
+    best = min(timeit.repeat(func, number=number, repeat=5))
+    print(f"{label:<40} {1e3 * best / number:>10.3f} ms")
+
+
+def bench_scan(nrows, ncols, nvals, number, rng):
+    A = Matrix.from_values(
+        rng.integers(0, nrows, nvals),
+        rng.integers(0, ncols, nvals),
+        rng.random(nvals),
+        nrows=nrows,
+        ncols=ncols,
+        dup_op=gb.binary.plus,
+    )
+    print(f"\n{A.nrows}x{A.ncols} FP64 Matrix with {A.nvals} values")
+    can_scan_values = prefix_scan._can_scan_values
+    for op in [monoid.plus, monoid.max]:
+        prefix_scan._can_scan_values = lambda monoid: False
+        try:
+            bench(f"scan_rowwise({op.name}) GraphBLAS", lambda: A.ss.scan_rowwise(op), number)
+        finally:
+            prefix_scan._can_scan_values = can_scan_values
+        bench(f"scan_rowwise({op.name}) numba", lambda: A.ss.scan_rowwise(op), number)
+
+
+def main(number=5):
+    rng = np.random.default_rng(42)
+    print(f"grblas {gb.__version__}")
+    bench_scan(100, 1_000_000, 2_000_000, number, rng)
+    bench_scan(100_000, 100_000, 2_000_000, number, rng)
+
+
+if __name__ == "__main__":
+    main()
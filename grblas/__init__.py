@@ -44,6 +44,7 @@ del get_config
 backend = None
 _init_params = None
 _SPECIAL_ATTRS = {
+    "ExpressionCache",
     "Matrix",
     "Recorder",
     "Scalar",
@@ -51,8 +52,11 @@ _SPECIAL_ATTRS = {
     "_agg",
     "_ss",
     "agg",
+    "autotune",
     "base",
     "binary",
+    "cache",
+    "concurrent",
     "descriptor",
     "dtypes",
     "exceptions",
@@ -63,9 +67,11 @@ _SPECIAL_ATTRS = {
     "io",
     "lib",
     "matrix",
+    "metrics",
     "monoid",
     "op",
     "operator",
+    "profiler",
     "recorder",
     "scalar",
     "semiring",
@@ -152,9 +158,14 @@ def _init(backend_arg, blocking, automatic=False):
 _NEEDS_OPERATOR = {
     "grblas._agg",
     "grblas.agg",
+    "grblas.autotune",
     "grblas.base",
+    "grblas.cache",
+    "grblas.concurrent",
     "grblas.io",
     "grblas.matrix",
+    "grblas.metrics",
+    "grblas.profiler",
     "grblas.scalar",
     "grblas.vector",
     "grblas.recorder",
@@ -163,8 +174,8 @@ _NEEDS_OPERATOR = {
 
 
 def _load(name):
-    if name in {"Matrix", "Vector", "Scalar", "Recorder"}:
-        module_name = name.lower()
+    if name in {"Matrix", "Vector", "Scalar", "Recorder", "ExpressionCache"}:
+        module_name = "cache" if name == "ExpressionCache" else name.lower()
         if module_name not in globals():
             _load(module_name)
         module = globals()[module_name]
@@ -1,9 +1,10 @@
 from functools import partial
 from operator import getitem
 
+import numba
 import numpy as np
 
-from . import agg, binary, monoid, semiring, unary
+from . import agg, base, binary, monoid, semiring, unary
 from .dtypes import INT64, lookup_dtype
 from .operator import get_typed_op
 from .scalar import Scalar
@@ -41,6 +42,7 @@ class Aggregator:
         semiring2=None,
         finalize=None,
         composite=None,
+        fused=None,
         custom=None,
         types=None,
         any_dtype=None,
@@ -55,6 +57,7 @@ class Aggregator:
         self._switch = switch
         self._finalize = finalize
         self._composite = composite
+        self._fused = fused
         self._custom = custom
         if types is None:
             if monoid is not None:
@@ -74,10 +77,14 @@ class Aggregator:
     @property
     def types(self):
         if self._types is None:
+            # Semirings may be given by name so they are only created when needed
             if type(self._semiring) is str:
                 self._semiring = semiring.from_string(self._semiring)
-                if type(self._types_orig[0]) is str:  # pragma: no branch
-                    self._types_orig[0] = semiring.from_string(self._types_orig[0])
+            if type(self._semiring2) is str:
+                self._semiring2 = semiring.from_string(self._semiring2)
+            self._types_orig = [
+                semiring.from_string(op) if type(op) is str else op for op in self._types_orig
+            ]
             self._types = _get_types(
                 self._types_orig, None if self._initval_orig is None else self._initdtype
             )
@@ -136,6 +143,10 @@ class TypedAggregator:
                 return parent._as_vector()
             return
 
+        if agg._fused is not None and not in_composite and _can_fuse(self.type, expr):
+            if self._new_fused(updater, expr):
+                return
+
         if agg._composite is not None:
             # Masks are applied throughout the aggregation, including composite aggregations.
             # Aggregations done while `in_composite is True` should return the updater parent
@@ -210,21 +221,22 @@ class TypedAggregator:
         elif expr.cfunc_name.startswith("GrB_Matrix_reduce"):
             # Matrix -> Scalar
             A = expr.args[0]
-            # We need to compute in two steps: Matrix -> Vector -> Scalar.
-            # This has not been benchmarked or optimized.
-            # We may be able to intelligently choose the faster path.
-            init1 = expr._new_vector(agg._initdtype, size=A._ncols)
-            init1[...] = agg._initval  # O(1) dense vector in SuiteSparse 5
-            step1 = expr._new_vector(semiring.return_type, size=A._nrows)
-            if agg._switch:
-                step1 << semiring(init1 @ A.T)
-            else:
-                step1 << semiring(A @ init1)
-            init2 = expr._new_matrix(agg._initdtype, nrows=A._nrows, ncols=1)
-            init2[...] = agg._initval  # O(1) dense vector in SuiteSparse 5
             semiring2 = agg._semiring2[semiring.return_type]
-            step2 = expr._new_vector(semiring2.return_type, size=1)
-            step2 << semiring2(step1 @ init2)
+            if _reduces_directly(semiring, semiring2, A):
+                step2 = self._reduce_directly(expr, A, semiring, semiring2)
+            else:
+                # Compute in two steps: Matrix -> Vector -> Scalar
+                init1 = expr._new_vector(agg._initdtype, size=A._ncols)
+                init1[...] = agg._initval  # O(1) dense vector in SuiteSparse 5
+                step1 = expr._new_vector(semiring.return_type, size=A._nrows)
+                if agg._switch:
+                    step1 << semiring(init1 @ A.T)
+                else:
+                    step1 << semiring(A @ init1)
+                init2 = expr._new_matrix(agg._initdtype, nrows=A._nrows, ncols=1)
+                init2[...] = agg._initval  # O(1) dense vector in SuiteSparse 5
+                step2 = expr._new_vector(semiring2.return_type, size=1)
+                step2 << semiring2(step1 @ init2)
             if agg._finalize is not None:
                 finalize = agg._finalize[semiring2.return_type]
                 if step2.dtype == finalize.return_type:
@@ -237,10 +249,228 @@ class TypedAggregator:
         else:
             raise NotImplementedError(f"{agg.name} with {expr.cfunc_name}")
 
+    def _reduce_directly(self, expr, A, semiring, semiring2):
+        """Reduce all values of A to a Vector of size 1 without reducing rows first"""
+        agg = self.parent
+        monoid = semiring2.monoid
+        if semiring.binaryop.name == "pair":
+            # Every product is 1, so only the number of values matters
+            nvals = A._nvals
+            if monoid.name == "plus":
+                step2 = expr._new_vector(INT64, size=1)
+            else:
+                step2 = expr._new_vector(semiring2.return_type, size=1)
+                nvals = min(nvals, 1)
+            if nvals:
+                step2[0] = nvals
+            return step2
+        if agg._switch:
+            B = A.apply(semiring.binaryop, left=agg._initval).new()
+        else:
+            B = A.apply(semiring.binaryop, right=agg._initval).new()
+        result = B.reduce_scalar(monoid).new()
+        step2 = expr._new_vector(semiring2.return_type, size=1)
+        if not result.is_empty:
+            step2[0] = result
+        return step2
+
+    def _new_fused(self, updater, expr):
+        """Compute the aggregation from moments that are computed in one pass over the values.
+
+        Returns False if the result should be computed the usual way instead.
+        """
+        x = expr.args[0]
+        is_transposed = x.ndim == 2 and x._is_transposed
+        if is_transposed:
+            x = x._matrix
+        if expr.cfunc_name == "GrB_Matrix_reduce_Aggregator":
+            rowwise = (expr.method_name == "reduce_rowwise") is not is_transposed
+            count, total, total_sq = _moments(x, rowwise)
+        else:
+            count, total, total_sq = _moments(x, None)
+            if count[0] == 0:
+                # Let the usual path decide between an empty result and an error
+                return False
+        # Cast sums to the types used by `agg.sum` and `agg.sum_of_squares`
+        total = total.astype(agg.sum[self.type].return_type.np_type, copy=False)
+        total_sq = total_sq.astype(agg.sum_of_squares[self.type].return_type.np_type, copy=False)
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            values = self.parent._fused(
+                count.astype(np.float64),
+                total.astype(np.float64, copy=False),
+                total_sq.astype(np.float64, copy=False),
+            )
+        if expr.output_type is Scalar:
+            updater << Scalar.from_value(values[0], dtype=self.return_type)
+        else:
+            indices = np.flatnonzero(count)
+            result = expr._new_vector(self.return_type, size=count.size)
+            result.build(indices, values[indices])
+            updater << result
+        return True
+
     def __reduce__(self):
         return (getitem, (self.parent, self.type))
 
 
+# Always reduce Matrix -> Scalar directly if there are at most this many values
+_DIRECT_MAX_NVALS = 1_000_000
+
+
+def _reduces_directly(semiring, semiring2, A):
+    """Whether a Matrix -> Scalar aggregation can reduce all values at once.
+
+    This is the case when reducing all rows with ``semiring2`` reduces the results
+    with the same monoid, so the values of all rows can be combined in one step.
+    """
+    from .matrix import Matrix, TransposedMatrix
+
+    if type(A) is not Matrix and type(A) is not TransposedMatrix:
+        return False
+    if semiring.monoid.name != semiring2.monoid.name:
+        return False
+    if semiring2.binaryop.name != "first" and (
+        semiring2.binaryop.name != "pair" or semiring2.monoid.name != "any"
+    ):
+        return False
+    return semiring.binaryop.name == "pair" or _prefers_direct(A)
+
+
+def _prefers_direct(A):
+    """Choose between the direct and two-step paths of Matrix -> Scalar aggregations.
+
+    The direct path makes a temporary copy of the (transformed) values, while the
+    two-step path makes a temporary vector of size ``A.nrows``.  Both take about the
+    same time for large matrices with many values per row, so use the two-step path
+    for those to use less memory.  Otherwise, the direct path is faster.
+    """
+    nvals = A._nvals
+    return nvals <= _DIRECT_MAX_NVALS or nvals <= 4 * A._nrows
+
+
+def _can_fuse(dtype, expr):
+    """Whether moments of the argument of ``expr`` can be computed by `_moments`"""
+    from .matrix import Matrix, TransposedMatrix
+    from .vector import Vector
+
+    if dtype._is_udt or dtype.np_type.kind not in "iuf":
+        return False
+    if type(expr.args[0]) not in {Matrix, TransposedMatrix, Vector}:
+        return False
+    # Exporting values can't be replayed, so use GraphBLAS calls while recording
+    return not base._recorder_started or base._recorder.get(base._prev_recorder) is None
+
+
+def _moments(x, rowwise):
+    """Count, sum, and sum of squares of the values of each row or column of x in one pass.
+
+    ``rowwise`` is True to compute per row, False per column, and None for all
+    values, in which case arrays of length 1 are returned.  Values are exported
+    from a copy of ``x`` in its current format, so ``x`` is not changed.
+    """
+    d = x.ss.export(raw=True)
+    fmt = d["format"]
+    kind = d["values"].dtype.kind
+    values = d["values"].astype(np.float64 if kind == "f" else np.dtype(f"{kind}8"), copy=False)
+    step = 0 if d["is_iso"] else 1
+    if x.ndim == 1:
+        nvec, vlen = 1, d["size"]
+    elif fmt[-1] == "r":
+        nvec, vlen = d["nrows"], d["ncols"]
+    else:
+        nvec, vlen = d["ncols"], d["nrows"]
+    if fmt.startswith(("bitmap", "full")):
+        if x.ndim == 1 or rowwise is None:
+            # Compute over all values as one vector
+            nvec, vlen, along = 1, nvec * vlen, True
+        else:
+            along = rowwise is (fmt[-1] == "r")
+        bitmap = d.get("bitmap")
+        if bitmap is not None:
+            bitmap = bitmap[: nvec * vlen]
+        return _moments_dense(bitmap, values, step, nvec, vlen, along)
+    if fmt == "sparse":
+        indptr = np.array([0, d["nvals"]], dtype=np.uint64)
+    else:
+        indptr = d["indptr"][: d.get("nvec", nvec) + 1]
+    if x.ndim == 1 or rowwise is None:
+        return _moments_sparse(indptr[[0, -1]], values, step)
+    if rowwise is not (fmt[-1] == "r"):
+        indices = d["col_indices" if fmt[-1] == "r" else "row_indices"]
+        return _moments_scatter(indices[: indptr[-1]], values, step, vlen)
+    rv = _moments_sparse(indptr, values, step)
+    if fmt.startswith("hyper"):
+        # Only non-empty vectors are stored, so put the results in place
+        vecs = d["rows" if fmt == "hypercsr" else "cols"][: d["nvec"]]
+        rv_full = tuple(np.zeros(nvec, dtype=moment.dtype) for moment in rv)
+        for moment, full in zip(rv, rv_full):
+            full[vecs] = moment
+        rv = rv_full
+    return rv
+
+
+@numba.njit(parallel=True, cache=True)
+def _moments_sparse(indptr, values, step):  # pragma: no cover
+    n = indptr.size - 1
+    count = np.empty(n, dtype=np.int64)
+    total = np.empty(n, dtype=values.dtype)
+    total_sq = np.empty(n, dtype=values.dtype)
+    for i in numba.prange(n):
+        start = np.int64(indptr[i])
+        end = np.int64(indptr[i + 1])
+        count[i] = end - start
+        cur = values.dtype.type(0)
+        cur_sq = values.dtype.type(0)
+        for k in range(start, end):
+            val = values[k * step]
+            cur += val
+            cur_sq += val * val
+        total[i] = cur
+        total_sq[i] = cur_sq
+    return count, total, total_sq
+
+
+@numba.njit(cache=True)
+def _moments_scatter(indices, values, step, n):  # pragma: no cover
+    count = np.zeros(n, dtype=np.int64)
+    total = np.zeros(n, dtype=values.dtype)
+    total_sq = np.zeros(n, dtype=values.dtype)
+    for k in range(indices.size):
+        i = indices[k]
+        val = values[k * step]
+        count[i] += 1
+        total[i] += val
+        total_sq[i] += val * val
+    return count, total, total_sq
+
+
+@numba.njit(parallel=True, cache=True)
+def _moments_dense(bitmap, values, step, nvec, vlen, along):  # pragma: no cover
+    # Values of vector i are at i * vlen + j; compute per vector if `along`, else per j
+    if along:
+        n, stride, inner, outer_stride = nvec, 1, vlen, vlen
+    else:
+        n, stride, inner, outer_stride = vlen, vlen, nvec, 1
+    count = np.empty(n, dtype=np.int64)
+    total = np.empty(n, dtype=values.dtype)
+    total_sq = np.empty(n, dtype=values.dtype)
+    for i in numba.prange(n):
+        cnt = 0
+        cur = values.dtype.type(0)
+        cur_sq = values.dtype.type(0)
+        for j in range(inner):
+            k = i * outer_stride + j * stride
+            if bitmap is None or bitmap[k]:
+                val = values[k * step]
+                cnt += 1
+                cur += val
+                cur_sq += val * val
+        count[i] = cnt
+        total[i] = cur
+        total_sq[i] = cur_sq
+    return count, total, total_sq
+
+
 # Monoid-only
 agg.sum = Aggregator("sum", monoid=monoid.plus)
 agg.prod = Aggregator("prod", monoid=monoid.times)
@@ -254,50 +484,42 @@ agg.bitwise_any = Aggregator("bitwise_any", monoid=monoid.bor)
 # Other monoids: bxnor bxor eq lxnor lxor
 
 # Semiring-only
-agg.count = Aggregator(
-    "count", semiring=semiring.plus_pair, semiring2=semiring.plus_first, any_dtype=INT64
-)
-agg.count_nonzero = Aggregator(
-    "count_nonzero", semiring=semiring.plus_isne, semiring2=semiring.plus_first
-)
-agg.count_zero = Aggregator(
-    "count_zero", semiring=semiring.plus_iseq, semiring2=semiring.plus_first
-)
+agg.count = Aggregator("count", semiring="plus_pair", semiring2="plus_first", any_dtype=INT64)
+agg.count_nonzero = Aggregator("count_nonzero", semiring="plus_isne", semiring2="plus_first")
+agg.count_zero = Aggregator("count_zero", semiring="plus_iseq", semiring2="plus_first")
 agg.sum_of_squares = Aggregator(
-    "sum_of_squares", initval=2, semiring=semiring.plus_pow, semiring2=semiring.plus_first
+    "sum_of_squares", initval=2, semiring="plus_pow", semiring2="plus_first"
 )
 agg.sum_of_inverses = Aggregator(
     "sum_of_inverses",
     initval=-1.0,
-    semiring=semiring.plus_pow,
-    semiring2=semiring.plus_first,
-)
-agg.exists = Aggregator(
-    "exists", semiring=semiring.any_pair, semiring2=semiring.any_pair, any_dtype=INT64
+    semiring="plus_pow",
+    semiring2="plus_first",
 )
+agg.exists = Aggregator("exists", semiring="any_pair", semiring2="any_pair", any_dtype=INT64)
 
 # Semiring and finalize
 agg.hypot = Aggregator(
     "hypot",
     initval=2,
-    semiring=semiring.plus_pow,
-    semiring2=semiring.plus_first,
+    semiring="plus_pow",
+    semiring2="plus_first",
     finalize=unary.sqrt,
 )
 agg.logaddexp = Aggregator(
     "logaddexp",
     initval=np.e,
-    semiring=semiring.plus_pow,
+    semiring="plus_pow",
     switch=True,
-    semiring2=semiring.plus_first,
+    semiring2="plus_first",
     finalize=unary.log,
 )
 agg.logaddexp2 = Aggregator(
     "logaddexp2",
     initval=2,
-    semiring=semiring.plus_pow,
+    semiring="plus_pow",
     switch=True,
-    semiring2=semiring.plus_first,
+    semiring2="plus_first",
     finalize=unary.log2,
 )
 # Alternatives
@@ -307,9 +529,9 @@ agg.logaddexp2 = Aggregator(
 # hypot = Aggregator('hypot', monoid=semiring.numpy.hypot)
 
 agg.L0norm = agg.count_nonzero
-agg.L1norm = Aggregator("L1norm", semiring="plus_absfirst", semiring2=semiring.plus_first)
+agg.L1norm = Aggregator("L1norm", semiring="plus_absfirst", semiring2="plus_first")
 agg.L2norm = agg.hypot
-agg.Linfnorm = Aggregator("Linfnorm", semiring="max_absfirst", semiring2=semiring.max_first)
+agg.Linfnorm = Aggregator("Linfnorm", semiring="max_absfirst", semiring2="max_first")
 
 
 # Composite
@@ -363,6 +585,24 @@ def _root_mean_square_finalize(c, x2):
     return unary.sqrt(val)
 
 
+# Fused versions of finalize that compute from arrays of count, sum, and sum of squares.
+# These are only worth it for aggregators of all three, since `count` and `sum` are fast.
+def _varp_fused(c, x, x2):
+    return x2 / c - (x / c) ** 2
+
+
+def _vars_fused(c, x, x2):
+    return x2 / (c - 1) - x**2 / c / (c - 1)
+
+
+def _stdp_fused(c, x, x2):
+    return np.sqrt(_varp_fused(c, x, x2))
+
+
+def _stds_fused(c, x, x2):
+    return np.sqrt(_vars_fused(c, x, x2))
+
+
 agg.mean = Aggregator(
     "mean",
     composite=[agg.count, agg.sum],
@@ -379,24 +619,28 @@ agg.varp = Aggregator(
     "varp",
     composite=[agg.count, agg.sum, agg.sum_of_squares],
     finalize=_varp_finalize,
+    fused=_varp_fused,
     types=[binary.truediv],
 )
 agg.vars = Aggregator(
     "vars",
     composite=[agg.count, agg.sum, agg.sum_of_squares],
     finalize=_vars_finalize,
+    fused=_vars_fused,
     types=[binary.truediv],
 )
 agg.stdp = Aggregator(
     "stdp",
     composite=[agg.count, agg.sum, agg.sum_of_squares],
     finalize=_stdp_finalize,
+    fused=_stdp_fused,
     types=[binary.truediv, unary.sqrt],
 )
 agg.stds = Aggregator(
     "stds",
     composite=[agg.count, agg.sum, agg.sum_of_squares],
     finalize=_stds_finalize,
+    fused=_stds_fused,
     types=[binary.truediv, unary.sqrt],
 )
 agg.geometric_mean = Aggregator(
@@ -472,6 +716,16 @@ def _argminmaxij(
 
 
 def _argminmax(agg, updater, expr, *, in_composite, monoid):
+    if (
+        not in_composite
+        and (
+            expr.cfunc_name == "GrB_Matrix_reduce_Aggregator"
+            or expr.cfunc_name.startswith("GrB_Vector_reduce")
+        )
+        and _can_fuse(agg.type, expr)
+        and _new_argminmax(agg, updater, expr, is_max=monoid.name == "max")
+    ):
+        return
     if expr.cfunc_name == "GrB_Matrix_reduce_Aggregator":
         if expr.method_name == "reduce_rowwise":
             return _argminmaxij(
@@ -508,20 +762,173 @@ def _argminmax(agg, updater, expr, *, in_composite, monoid):
         raise NotImplementedError(f"{agg.name} with {expr.cfunc_name}")
 
 
+def _new_argminmax(agg, updater, expr, *, is_max):
+    """Compute argmin or argmax in one pass over the values.
+
+    Returns False if the result should be computed with GraphBLAS instead.
+    """
+    x = expr.args[0]
+    is_transposed = x.ndim == 2 and x._is_transposed
+    if is_transposed:
+        x = x._matrix
+    if x.ss.is_iso:
+        # All values are equal, so the GraphBLAS recipe is fast
+        return False
+    if expr.cfunc_name == "GrB_Matrix_reduce_Aggregator":
+        rowwise = (expr.method_name == "reduce_rowwise") is not is_transposed
+        found, indices = _argminmax_values(x, rowwise, is_max)
+        result = expr._new_vector(agg.return_type, size=found.size)
+        result.build(np.flatnonzero(found), indices[found])
+        updater << result
+    else:
+        found, indices = _argminmax_values(x, None, is_max)
+        if not found[0]:
+            # Let the usual path handle empty vectors
+            return False
+        updater << Scalar.from_value(indices[0], dtype=agg.return_type)
+    return True
+
+
+def _argminmax_values(x, rowwise, is_max):
+    """Index of the min or max value of each row or column of x.
+
+    Ties go to the smallest index, and NaN are ignored.  Returns a boolean array of
+    whether each row or column has a (non-NaN) value and an array of the indices.
+    ``rowwise`` is None if x is a Vector.
+    """
+    d = x.ss.export(raw=True)
+    fmt = d["format"]
+    values = d["values"]
+    if x.ndim == 1:
+        nvec, vlen, along = 1, d["size"], True
+    else:
+        nvec, vlen = d["nrows"], d["ncols"]
+        if fmt[-1] == "c":
+            nvec, vlen = vlen, nvec
+        along = rowwise is (fmt[-1] == "r")
+    if fmt.startswith(("bitmap", "full")):
+        bitmap = d.get("bitmap")
+        if bitmap is not None:
+            bitmap = bitmap[: nvec * vlen]
+        return _argminmax_dense(bitmap, values, nvec, vlen, along, is_max)
+    if fmt == "sparse":
+        indptr = np.array([0, d["nvals"]], dtype=np.uint64)
+        indices = d["indices"]
+    else:
+        indptr = d["indptr"][: d.get("nvec", nvec) + 1]
+        indices = d["col_indices" if fmt[-1] == "r" else "row_indices"]
+    if fmt.startswith("hyper"):
+        vecs = d["rows" if fmt == "hypercsr" else "cols"][: d["nvec"]]
+    else:
+        vecs = np.arange(indptr.size - 1, dtype=np.uint64)
+    if not along:
+        return _argminmax_scatter(indptr, vecs, indices, values, vlen, is_max)
+    found, rv = _argminmax_sparse(indptr, indices, values, is_max)
+    if fmt.startswith("hyper"):
+        # Only non-empty vectors are stored, so put the results in place
+        found_full = np.zeros(nvec, dtype=bool)
+        found_full[vecs] = found
+        rv_full = np.zeros(nvec, dtype=np.int64)
+        rv_full[vecs] = rv
+        found, rv = found_full, rv_full
+    return found, rv
+
+
+@numba.njit(parallel=True, cache=True)
+def _argminmax_sparse(indptr, indices, values, is_max):  # pragma: no cover
+    n = indptr.size - 1
+    found = np.zeros(n, dtype=np.bool_)
+    rv = np.zeros(n, dtype=np.int64)
+    for i in numba.prange(n):
+        best_k = -1
+        for k in range(np.int64(indptr[i]), np.int64(indptr[i + 1])):
+            val = values[k]
+            if val != val:  # NaN
+                continue
+            if best_k < 0:
+                best_k = k
+                continue
+            best = values[best_k]
+            if (
+                (val > best if is_max else val < best)
+                or val == best
+                and indices[k] < indices[best_k]
+            ):
+                best_k = k
+        if best_k >= 0:
+            found[i] = True
+            rv[i] = indices[best_k]
+    return found, rv
+
+
+@numba.njit(cache=True)
+def _argminmax_scatter(indptr, vecs, indices, values, n, is_max):  # pragma: no cover
+    found = np.zeros(n, dtype=np.bool_)
+    rv = np.zeros(n, dtype=np.int64)
+    best = np.empty(n, dtype=values.dtype)
+    for v in range(indptr.size - 1):
+        j = np.int64(vecs[v])
+        for k in range(np.int64(indptr[v]), np.int64(indptr[v + 1])):
+            val = values[k]
+            if val != val:  # NaN
+                continue
+            i = indices[k]
+            if (
+                not found[i]
+                or (val > best[i] if is_max else val < best[i])
+                or val == best[i]
+                and j < rv[i]
+            ):
+                found[i] = True
+                best[i] = val
+                rv[i] = j
+    return found, rv
+
+
+@numba.njit(parallel=True, cache=True)
+def _argminmax_dense(bitmap, values, nvec, vlen, along, is_max):  # pragma: no cover
+    # Values of vector i are at i * vlen + j; compute per vector if `along`, else per j
+    if along:
+        n, stride, inner, outer_stride = nvec, 1, vlen, vlen
+    else:
+        n, stride, inner, outer_stride = vlen, vlen, nvec, 1
+    found = np.zeros(n, dtype=np.bool_)
+    rv = np.zeros(n, dtype=np.int64)
+    for i in numba.prange(n):
+        best_k = -1
+        best_j = -1
+        for j in range(inner):
+            k = i * outer_stride + j * stride
+            if bitmap is not None and not bitmap[k]:
+                continue
+            val = values[k]
+            if val != val:  # NaN
+                continue
+            # Indices increase, so ties keep the first index
+            if best_k < 0 or (val > values[best_k] if is_max else val < values[best_k]):
+                best_k = k
+                best_j = j
+        if best_k >= 0:
+            found[i] = True
+            rv[i] = best_j
+    return found, rv
+
+
 # These "do the right thing", but don't work with `reduce_scalar`
 agg.argmin = Aggregator(
     "argmin",
     custom=partial(_argminmax, monoid=monoid.min),
-    types=[semiring.min_firsti],
+    types=["min_firsti"],
 )
 agg.argmax = Aggregator(
     "argmax",
     custom=partial(_argminmax, monoid=monoid.max),
-    types=[semiring.min_firsti],
+    types=["min_firsti"],
 )
 
 
 def _first_last(agg, updater, expr, *, in_composite, semiring_):
+    semiring_ = semiring.from_string(semiring_)
     if expr.cfunc_name == "GrB_Matrix_reduce_Aggregator":
         A = expr.args[0]
         if expr.method_name == "reduce_columnwise":
@@ -572,26 +979,27 @@ def _first_last(agg, updater, expr, *, in_composite, semiring_):
 
 agg.first = Aggregator(
     "first",
-    custom=partial(_first_last, semiring_=semiring.min_secondi),
+    custom=partial(_first_last, semiring_="min_secondi"),
     types=[binary.first],
     any_dtype=True,
 )
 agg.last = Aggregator(
     "last",
-    custom=partial(_first_last, semiring_=semiring.max_secondi),
+    custom=partial(_first_last, semiring_="max_secondi"),
     types=[binary.second],
     any_dtype=True,
 )
 
 
-def _first_last_index(agg, updater, expr, *, in_composite, semiring):
+def _first_last_index(agg, updater, expr, *, in_composite, semiring_):
+    semiring_ = semiring.from_string(semiring_)
     if expr.cfunc_name == "GrB_Matrix_reduce_Aggregator":
         A = expr.args[0]
         if expr.method_name == "reduce_columnwise":
             A = A.T
         init = expr._new_vector(bool, size=A._ncols)
         init[...] = False  # O(1) dense vector in SuiteSparse 5
-        expr = semiring(A @ init)
+        expr = semiring_(A @ init)
         updater << expr
         if in_composite:
             return updater.parent
@@ -599,7 +1007,7 @@ def _first_last_index(agg, updater, expr, *, in_composite, semiring):
         v = expr.args[0]
         init = expr._new_matrix(bool, nrows=v._size, ncols=1)
         init[...] = False  # O(1) dense matrix in SuiteSparse 5
-        step1 = semiring(v @ init).new()
+        step1 = semiring_(v @ init).new()
         if in_composite:
             return step1
         updater << step1[0]
@@ -611,13 +1019,13 @@ def _first_last_index(agg, updater, expr, *, in_composite, semiring):
 
 agg.first_index = Aggregator(
     "first_index",
-    custom=partial(_first_last_index, semiring=semiring.min_secondi),
-    types=[semiring.min_secondi],
+    custom=partial(_first_last_index, semiring_="min_secondi"),
+    types=["min_secondi"],
     any_dtype=INT64,
 )
 agg.last_index = Aggregator(
     "last_index",
-    custom=partial(_first_last_index, semiring=semiring.max_secondi),
-    types=[semiring.min_secondi],
+    custom=partial(_first_last_index, semiring_="max_secondi"),
+    types=["min_secondi"],
     any_dtype=INT64,
 )
@@ -11,7 +11,14 @@ from . import config
 
 
 def _get_value(self, attr=None, default=None):
-    if config.get("autocompute"):
+    if config.get("lazy"):
+        from . import _lazy
+
+        if attr in _lazy._DELAYED_METHODS:
+            method = _lazy.delayed_method(self, attr)
+            if method is not None:
+                return method
+    if config.get("autocompute") or config.get("lazy"):
         if self._value is None:
             self._value = self.new()
         if attr is None:
@@ -174,6 +181,18 @@ def gb_obj(self):
     return self._get_value("gb_obj")
 
 
+def groupby(self):
+    return self._get_value("groupby")
+
+
+def groupby_columns(self):
+    return self._get_value("groupby_columns")
+
+
+def groupby_rows(self):
+    return self._get_value("groupby_rows")
+
+
 def inner(self):
     return self._get_value("inner")
 
@@ -354,6 +373,7 @@ if __name__ == "__main__":
     }
     vector = {
         "_as_matrix",
+        "groupby",
         "inner",
         "outer",
         "reduce",
@@ -361,6 +381,8 @@ if __name__ == "__main__":
     }
     matrix = {
         "T",
+        "groupby_columns",
+        "groupby_rows",
         "kronecker",
         "mxm",
         "mxv",
@@ -0,0 +1,245 @@
+"""Generate C source code from a `Program` recorded by ``Recorder(replayable=True)``."""
+import math
+import re
+
+from . import lib
+from .descriptor import Descriptor
+from .dtypes import DataType
+from .expr import AxisIndex, _AllIndices
+from .operator import TypedOpBase
+from .scalar import Scalar
+from .utils import _CArray, _Pointer
+
+_C_KEYWORDS = {
+    "auto",
+    "bool",
+    "break",
+    "case",
+    "char",
+    "const",
+    "continue",
+    "default",
+    "do",
+    "double",
+    "else",
+    "enum",
+    "extern",
+    "float",
+    "for",
+    "goto",
+    "if",
+    "info",
+    "inline",
+    "int",
+    "long",
+    "register",
+    "restrict",
+    "return",
+    "short",
+    "signed",
+    "sizeof",
+    "static",
+    "struct",
+    "switch",
+    "typedef",
+    "union",
+    "unsigned",
+    "void",
+    "volatile",
+    "while",
+}
+_DESCRIPTOR_FLAGS = [
+    ("output_replace", "GrB_OUTP", "GrB_REPLACE"),
+    ("mask_complement", "GrB_MASK", "GrB_COMP"),
+    ("mask_structure", "GrB_MASK", "GrB_STRUCTURE"),
+    ("transpose_first", "GrB_INP0", "GrB_TRAN"),
+    ("transpose_second", "GrB_INP1", "GrB_TRAN"),
+]
+_AXB_METHODS = {
+    "default": "GxB_DEFAULT",
+    "gustavson": "GxB_AxB_GUSTAVSON",
+    "hash": "GxB_AxB_HASH",
+    "saxpy": "GxB_AxB_SAXPY",
+    "dot": "GxB_AxB_DOT",
+}
+_TEMPLATE = """\
+/* Generated by grblas from a recorded program */
+#include <math.h>
+#include <stdbool.h>
+#include <stdint.h>
+#include "{header}"
+
+#define GRBLAS_TRY(method)                                   \\
+    {{                                                        \\
+        info = (method);                                     \\
+        if (info != GrB_SUCCESS && info != GrB_NO_VALUE) {{   \\
+            goto done;                                       \\
+        }}                                                    \\
+    }}
+
+GrB_Info {name}({params})
+{{
+    GrB_Info info = GrB_SUCCESS;
+{body}
+    info = GrB_SUCCESS;
+done:
+{frees}
+    return info;
+}}
+"""
+
+
+class _CodeGen:
+    def __init__(self):
+        self.used = set()
+        self.decls = []
+        self.setup = []
+        self.frees = []
+        self.constants = {}
+
+    def identifier(self, name):
+        ident = re.sub(r"\W", "_", name or "") or "x"
+        if ident[0].isdigit():
+            ident = f"_{ident}"
+        base = ident
+        i = 0
+        while ident in self.used or ident in _C_KEYWORDS:
+            i += 1
+            ident = f"{base}_{i}"
+        self.used.add(ident)
+        return ident
+
+    def constant(self, arg):
+        if arg is None:
+            return "NULL"
+        key = id(arg)
+        if key not in self.constants:
+            self.constants[key] = self._constant(arg)
+        return self.constants[key]
+
+    def _constant(self, arg):
+        typ = type(arg)
+        if typ is AxisIndex:
+            return self.constant(arg.index)
+        if typ is Descriptor:
+            if not arg.extensions and hasattr(lib, arg.name):
+                return arg.name
+            return self.descriptor(arg)
+        if isinstance(arg, TypedOpBase) or typ is DataType:
+            if arg.gb_name is None or not hasattr(lib, arg.gb_name):
+                raise ValueError(f"Unable to export user-defined {typ.__name__} {arg!r} to C")
+            return arg.gb_name
+        if typ is Scalar:
+            return _literal(arg.value, arg.dtype)
+        if typ is _Pointer:
+            # Output C scalar, such as from `GrB_Matrix_nvals`
+            scalar = arg.val
+            ident = self.identifier(scalar.name)
+            self.decls.append(f"    {_c_type(scalar.dtype)} {ident} = 0;")
+            return f"&{ident}"
+        if typ is _CArray:
+            ident = self.identifier(arg._name or "array")
+            values = ", ".join(_literal(x, arg.dtype) for x in arg.array.tolist()) or "0"
+            self.decls.append(
+                f"    static {_c_type(arg.dtype)} {ident}[{max(len(arg.array), 1)}] = {{{values}}};"
+            )
+            return ident
+        if typ is _AllIndices:
+            return "GrB_ALL"
+        if typ is bool:
+            return "true" if arg else "false"
+        if typ is int or typ is float:
+            return repr(arg)
+        raise ValueError(f"Unable to export argument of type {typ.__name__} to C")
+
+    def descriptor(self, desc):
+        ident = self.identifier("desc")
+        self.decls.append(f"    GrB_Descriptor {ident} = NULL;")
+        self.setup.append(f"    GRBLAS_TRY(GrB_Descriptor_new(&{ident}));")
+        for attr, field, value in _DESCRIPTOR_FLAGS:
+            if getattr(desc, attr):
+                self.setup.append(f"    GRBLAS_TRY(GrB_Descriptor_set({ident}, {field}, {value}));")
+        for key, value in sorted(desc.extensions.items()):
+            if key == "axb_method":
+                field, value = "GxB_AxB_METHOD", f"(int) {_AXB_METHODS[value]}"
+            elif key == "chunk":
+                field, value = "GxB_CHUNK", f"(double) {float(value)!r}"
+            else:
+                field, value = f"GxB_{key.upper()}", f"(int) {int(value)}"
+            self.setup.append(f"    GRBLAS_TRY(GxB_Desc_set({ident}, {field}, {value}));")
+        self.frees.append(f"    GrB_Descriptor_free(&{ident});")
+        return ident
+
+
+def _c_type(dtype):
+    if dtype._is_udt or dtype.name.startswith("FC"):
+        raise ValueError(f"Unable to export values of dtype {dtype} to C")
+    return dtype.c_type
+
+
+def _literal(value, dtype):
+    name = dtype.name
+    if name == "BOOL":
+        return "true" if value else "false"
+    if name.startswith("FP"):
+        value = float(value)
+        if math.isnan(value):
+            return "NAN"
+        if math.isinf(value):
+            return "INFINITY" if value > 0 else "-INFINITY"
+        return repr(value)
+    _c_type(dtype)
+    value = int(value)
+    if dtype.np_type.kind == "u":
+        return f"{value}ULL"
+    if name == "INT64":
+        # The most negative value can't be written as a literal
+        return "INT64_MIN" if value == -(2**63) else f"{value}LL"
+    return str(value)
+
+
+def to_c(program, name, header):
+    gen = _CodeGen()
+    name = re.sub(r"\W", "_", name)
+    gen.used.add(name)
+    outputs = set(program._outputs)
+    params = []
+    out_params = []
+    objects = []  # C expression of each object's handle
+    handles = []  # C expression of a pointer to each object's handle
+    cleanup = []
+    for index, slot in enumerate(program._slots):
+        ident = gen.identifier(slot.name)
+        if not slot.is_created:
+            params.append(f"{slot.ctype} {ident}")
+            objects.append(ident)
+            handles.append(f"&{ident}")
+        elif index in outputs:
+            out_params.append(f"{slot.ctype} *{ident}")
+            objects.append(f"(*{ident})")
+            handles.append(ident)
+            # Outputs are only returned if there are no errors
+            gen.setup.append(f"    *{ident} = NULL;")
+            cleanup.append(f"        {slot.ctype}_free({ident});")
+        else:
+            gen.decls.append(f"    {slot.ctype} {ident} = NULL;")
+            gen.frees.append(f"    {slot.ctype}_free(&{ident});")
+            objects.append(ident)
+            handles.append(f"&{ident}")
+    calls = []
+    for cfunc_name, _, specs in program._instructions:
+        args = [
+            objects[val] if kind == 0 else handles[val] if kind == 1 else gen.constant(arg)
+            for kind, val, arg in specs
+        ]
+        calls.append(f"    GRBLAS_TRY({cfunc_name}({', '.join(args)}));")
+    body = "\n".join(gen.decls + gen.setup + calls)
+    if cleanup:
+        cleanup = ["    if (info != GrB_SUCCESS) {", *cleanup, "    }"]
+    return _TEMPLATE.format(
+        header=header,
+        name=name,
+        params=", ".join(params + out_params) or "void",
+        body=body,
+        frees="\n".join(cleanup + gen.frees) or "    ;",
+    )
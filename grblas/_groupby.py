@@ -0,0 +1,152 @@
+"""Aggregate the values of a Vector or Matrix by group labels.
+
+The labels are turned into an iso-valued assignment Matrix ``P`` with one value
+``P[label, i]`` for each labeled index ``i``.  Every group is then aggregated at
+once with a sparse product, such as ``plus_second(P @ v)`` to sum the groups.
+``P`` is built as its transpose, because indices are already sorted and labels
+usually aren't, and used through ``P.T``.
+"""
+import numpy as np
+
+from . import binary, monoid, semiring
+from .dtypes import BOOL
+from .exceptions import DimensionMismatch
+from .matrix import Matrix
+from .operator import get_semiring, get_typed_op
+from .vector import Vector
+
+
+def _assignment_T(labels, size, ngroups):
+    """Create the size x ngroups transposed assignment Matrix from labels of 0..size-1"""
+    if type(labels) is Vector:
+        if labels._size != size:
+            raise DimensionMismatch(f"labels must have size {size}; got {labels._size}")
+        dtype = labels.dtype
+        kind = dtype.np_type.kind
+        indices, values = labels.to_values()
+    else:
+        values = np.asarray(labels)
+        if values.ndim != 1 or values.size != size:
+            raise DimensionMismatch(f"labels must have size {size}; got shape {values.shape}")
+        dtype = values.dtype
+        kind = dtype.kind
+        indices = np.arange(size, dtype=np.uint64)
+    if kind not in "iu":
+        raise TypeError(f"labels must be integers; got dtype {dtype}")
+    if values.size > 0 and values.min() < 0:
+        raise ValueError("labels must be nonnegative")
+    if ngroups is None:
+        ngroups = int(values.max()) + 1 if values.size > 0 else 0
+    elif values.size > 0 and values.max() >= ngroups:
+        raise ValueError(f"labels must be less than ngroups (={ngroups}); got {values.max()}")
+    P_T = Matrix.new(BOOL, size, ngroups, name="P_groupby")
+    P_T.ss.build_scalar(indices, values, True)
+    return P_T
+
+
+class _GroupBy:
+    """Base class of VectorGroupBy and MatrixGroupBy"""
+
+    def __init__(self, parent, labels, size, ngroups):
+        self._parent = parent
+        self._assignment_T = _assignment_T(labels, size, ngroups)
+
+    @property
+    def assignment(self):
+        """The ngroups x size iso-valued assignment Matrix (as a transposed view)"""
+        return self._assignment_T.T
+
+    @property
+    def ngroups(self):
+        return self._assignment_T._ncols
+
+    def agg(self, op=monoid.plus, *, name=None):
+        """Aggregate the values of each group with a Monoid or Aggregator.
+
+        Groups without values are empty in the result.
+        """
+        x = self._parent
+        op = get_typed_op(op, x.dtype, kind="binary|aggregator")
+        if op.opclass == "BinaryOp" and op.monoid is not None:
+            op = op.monoid
+        else:
+            x._expect_op(op, ("Monoid", "Aggregator"), within=self._method_name, argname="op")
+        if op.opclass == "Monoid":
+            return self._reduce(x, op).new(name=name)
+        return self._aggregate(x, op, name)
+
+    def _reduce(self, x, monoid, *, pair=False):
+        """Reduce the values of x in each group with a sparse product"""
+        return self._product(x, get_semiring(monoid, binary.pair if pair else self._mult))
+
+    def _aggregate(self, x, agg, name):
+        aggregator = agg.parent
+        if aggregator._monoid is not None:
+            return self._reduce(x, aggregator._monoid[agg.type]).new(name=name)
+        if aggregator._composite is not None:
+            results = [self._aggregate(x, part[agg.type], None) for part in aggregator._composite]
+            return aggregator._finalize(*results).new(agg.return_type, name=name)
+        if aggregator._custom is not None:
+            return self._custom(x, agg, name)
+        semiring_ = get_typed_op(aggregator._semiring, agg.type, aggregator._initdtype)
+        if semiring_.binaryop.name == "pair":
+            # Only the number of values in each group matters
+            result = self._reduce(x, semiring_.monoid, pair=True).new(name=name)
+        else:
+            if aggregator._switch:
+                y = x.apply(semiring_.binaryop, left=aggregator._initval).new()
+            else:
+                y = x.apply(semiring_.binaryop, right=aggregator._initval).new()
+            result = self._reduce(y, semiring_.monoid).new(name=name)
+        if aggregator._finalize is not None:
+            finalize = aggregator._finalize[semiring_.return_type]
+            if result.dtype == finalize.return_type:
+                result << finalize(result)
+            else:
+                result = finalize(result).new(finalize.return_type, name=name)
+        return result
+
+
+class VectorGroupBy(_GroupBy):
+    """Values of a Vector grouped by labels; created by ``Vector.groupby``"""
+
+    _method_name = "groupby"
+    _mult = binary.second
+
+    def __init__(self, parent, labels, ngroups=None):
+        super().__init__(parent, labels, parent._size, ngroups)
+
+    def _product(self, x, semiring_):
+        return self.assignment.mxv(x, semiring_)
+
+    def _custom(self, x, agg, name):
+        # Scatter the values into one row per group: M[label, i] = x[i]
+        M = self.assignment.mxm(x.diag(), semiring.any_second).new()
+        return M.reduce_rowwise(agg).new(name=name)
+
+
+class MatrixGroupBy(_GroupBy):
+    """Rows or columns of a Matrix grouped by labels.
+
+    Created by ``Matrix.groupby_rows`` and ``Matrix.groupby_columns``.
+    """
+
+    def __init__(self, parent, labels, ngroups=None, *, rowwise=True):
+        self._rowwise = rowwise
+        if rowwise:
+            self._method_name = "groupby_rows"
+            self._mult = binary.second
+            size = parent._nrows
+        else:
+            self._method_name = "groupby_columns"
+            self._mult = binary.first
+            size = parent._ncols
+        super().__init__(parent, labels, size, ngroups)
+
+    def _product(self, x, semiring_):
+        if self._rowwise:
+            return self.assignment.mxm(x, semiring_)
+        return x.mxm(self._assignment_T, semiring_)
+
+    def _custom(self, x, agg, name):
+        raise ValueError(f"Aggregator {agg.name} may not be used with Matrix.{self._method_name}.")
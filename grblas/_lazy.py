@@ -0,0 +1,367 @@
+"""Capture chains of delayed expressions and rewrite them before they are computed.
+
+This is enabled with ``grblas.config.set(lazy=True)``.  Delayed methods called on
+expressions, such as ``A.mxm(B).apply(unary.abs).reduce_rowwise()``, then return new
+expressions that use the previous expressions as arguments instead of computing them.
+Expressions may also be passed as the ``other`` argument of delayed methods.
+
+When the final expression is computed, the graph of expressions is rewritten:
+
+- ``reduce_rowwise`` or ``reduce_columnwise`` of ``mxm`` with the monoid of the semiring
+  is reassociated to avoid the matrix product, e.g. ``(A @ B).reduce_rowwise()`` becomes
+  ``A @ B.reduce_rowwise()``.  This is only done for semirings known to be distributive.
+- ``apply`` of an argument whose values are ignored by the multiply op (``first``,
+  ``second``, ``pair``, and positional ops such as ``firsti``) is skipped.
+- consecutive ``apply`` of some builtin unary ops are simplified, e.g. ``abs(ainv(x))``.
+- masks are pushed down through ``apply``, ``ewise_add``, ``ewise_mult``, and
+  ``ewise_union`` to the expressions that compute their arguments.
+
+Intermediate results are computed once, even if used by several expressions, and they
+are released as soon as the last expression that uses them has been computed.
+"""
+import copy
+from types import MethodType
+
+from . import base
+from .base import BaseExpression
+from .operator import (
+    TypedBuiltinBinaryOp,
+    TypedBuiltinMonoid,
+    TypedBuiltinSemiring,
+    TypedBuiltinUnaryOp,
+)
+
+# Methods of expressions that return expressions when lazy
+_DELAYED_METHODS = {
+    "apply",
+    "ewise_add",
+    "ewise_mult",
+    "ewise_union",
+    "kronecker",
+    "mxm",
+    "mxv",
+    "reduce",
+    "reduce_columnwise",
+    "reduce_rowwise",
+    "reduce_scalar",
+    "vxm",
+}
+# Delayed methods that may be given an expression for the `other` argument
+_DELAYED_OTHER = {"ewise_add", "ewise_mult", "ewise_union", "kronecker", "mxm", "mxv", "vxm"}
+_ELEMENTWISE = {"apply", "ewise_add", "ewise_mult", "ewise_union"}
+# Binary ops that ignore the values of the first or second argument
+_POSITIONAL = {
+    "firsti",
+    "firsti1",
+    "firstj",
+    "firstj1",
+    "secondi",
+    "secondi1",
+    "secondj",
+    "secondj1",
+}
+_IGNORES_FIRST = {"second", "pair"} | _POSITIONAL
+_IGNORES_SECOND = {"first", "pair"} | _POSITIONAL
+# (monoid, binaryop) names of semirings where the binaryop distributes over the monoid
+_DISTRIBUTIVE = {
+    ("lor", "land"),
+    ("max", "min"),
+    ("max", "plus"),
+    ("min", "max"),
+    ("min", "plus"),
+    ("plus", "times"),
+}
+
+
+def delayed_method(expr, attr):
+    """Get a method of ``expr`` that uses ``expr`` as an argument without computing it.
+
+    Returns None if the method can't be delayed.
+    """
+    if not isinstance(expr, BaseExpression):
+        return None
+    method = getattr(expr.output_type, attr, None)
+    if method is None:
+        return None
+    base._lazy_captured = True
+    return MethodType(method, expr)
+
+
+def compute_args(expr, mask):
+    """Rewrite ``expr`` and compute the expressions it uses as arguments.
+
+    ``mask`` is the mask used when ``expr`` is computed.  Returns a copy of
+    (the possibly rewritten) ``expr`` whose arguments are all computed.
+    """
+    counts = {}
+    _count_uses(expr, counts)
+    expr = _rewrite(expr, counts, {})
+    counts = {}
+    _count_uses(expr, counts)
+    masks = {}
+    if mask is not None:
+        _push_mask(expr, mask, counts, masks)
+    return _compute(expr, counts, masks, {})
+
+
+def _count_uses(expr, counts):
+    for arg in expr.args:
+        if isinstance(arg, BaseExpression) and arg._value is None:
+            key = id(arg)
+            if key in counts:
+                counts[key] += 1
+            else:
+                counts[key] = 1
+                _count_uses(arg, counts)
+
+
+def _with_args(expr, args, **attrs):
+    rv = copy.copy(expr)
+    rv.args = args
+    rv._value = None
+    for key, val in attrs.items():
+        setattr(rv, key, val)
+    return rv
+
+
+def _rewrite(expr, counts, rewritten):
+    key = id(expr)
+    if key in rewritten:
+        # Already rewritten via another path; reuse it so it is computed only once
+        return rewritten[key]
+    args = expr.args
+    new_args = [
+        _rewrite(arg, counts, rewritten)
+        if isinstance(arg, BaseExpression) and arg._value is None
+        else arg
+        for arg in args
+    ]
+    if any(new is not old for new, old in zip(new_args, args)):
+        rv = _with_args(expr, new_args)
+    else:
+        rv = expr
+    count = counts.get(key, 1)
+    changed = True
+    while changed:
+        # Every rule makes the graph smaller, so this terminates
+        changed = False
+        for rule in _RULES:
+            new_rv = rule(rv, counts)
+            if new_rv is not None:
+                rv = new_rv
+                changed = True
+    rewritten[key] = rv
+    counts[id(rv)] = count
+    return rv
+
+
+def _is_delayed(arg):
+    return isinstance(arg, BaseExpression) and arg._value is None
+
+
+def _apply_input(expr):
+    """The Matrix or Vector argument of an apply expression"""
+    if "BinaryOp1st" in expr.cfunc_name:
+        return expr.args[1]
+    return expr.args[0]
+
+
+def _unary_apply(x, op):
+    if x.ndim == 2:
+        from .matrix import MatrixExpression
+
+        return MatrixExpression(
+            "apply",
+            "GrB_Matrix_apply",
+            [x],
+            op=op,
+            nrows=x._nrows,
+            ncols=x._ncols,
+            at=x._is_transposed,
+            bt=x._is_transposed,
+        )
+    from .vector import VectorExpression
+
+    return VectorExpression("apply", "GrB_Vector_apply", [x], op=op, size=x._size)
+
+
+def _simplify_apply(expr, counts):
+    """abs(ainv(x)) -> abs(x), abs(abs(x)) -> abs(x), one(f(x)) -> one(x), etc."""
+    if expr.method_name != "apply" or not expr.cfunc_name.endswith("_apply"):
+        return
+    child = expr.args[0]
+    if not _is_delayed(child) or child.method_name != "apply":
+        return
+    op = expr.op
+    if type(op) is not TypedBuiltinUnaryOp:
+        return
+    x = _apply_input(child)
+    if x.dtype._is_udt:
+        return
+    if op.name == "one":
+        # Values of the child don't matter; only its structure, which is the same as x
+        return _unary_apply(x, op)
+    inner = child.op
+    if (
+        type(inner) is not TypedBuiltinUnaryOp
+        # Only for signed integers and floats; e.g. `abs(ainv(x)) != abs(x)` for unsigned
+        or x.dtype.np_type.kind not in "if"
+        or not (
+            x.dtype == inner.type == inner.return_type == op.type == op.return_type == expr.dtype
+        )
+    ):
+        return
+    if inner.name == "identity":
+        return _unary_apply(x, op)
+    if op.name == "identity":
+        return child
+    if op.name == "abs" and inner.name in {"abs", "ainv"}:
+        return _unary_apply(x, op)
+    if op.name == "ainv" and inner.name == "ainv":
+        from . import unary
+
+        return _unary_apply(x, unary.identity[op.type])
+
+
+def _skip_ignored_apply(expr, counts):
+    """Don't apply ops to arguments whose values are ignored by e.g. `first`, `pair`, etc."""
+    if expr.method_name in {"mxm", "mxv", "vxm"}:
+        if type(expr.op) is not TypedBuiltinSemiring:
+            return
+        binaryop = expr.op.binaryop
+    elif expr.method_name in {"ewise_mult", "kronecker"}:
+        if expr.op.opclass == "Monoid":
+            binaryop = expr.op.binaryop
+        else:
+            binaryop = expr.op
+    else:
+        return
+    if type(binaryop) is not TypedBuiltinBinaryOp:
+        return
+    args = list(expr.args)
+    attrs = {}
+    for i, (ignored, flag) in enumerate([(_IGNORES_FIRST, "at"), (_IGNORES_SECOND, "bt")]):
+        child = args[i]
+        if (
+            binaryop.name not in ignored
+            or not _is_delayed(child)
+            or child.method_name != "apply"
+            or child.dtype._is_udt
+        ):
+            continue
+        x = _apply_input(child)
+        if x.dtype._is_udt:
+            continue
+        # The values of x may need to be cast to the types of the op, which is fine
+        args[i] = x
+        if x.ndim == 2:
+            attrs[flag] = x._is_transposed
+    if attrs or any(new is not old for new, old in zip(args, expr.args)):
+        return _with_args(expr, args, **attrs)
+
+
+def _reassociate_reduce(expr, counts):
+    """(A @ B).reduce_rowwise() -> A @ B.reduce_rowwise() for distributive semirings"""
+    if expr.method_name not in {"reduce_rowwise", "reduce_columnwise"}:
+        return
+    child = expr.args[0]
+    if (
+        not _is_delayed(child)
+        or child.method_name != "mxm"
+        or counts.get(id(child), 1) != 1
+        or type(expr.op) is not TypedBuiltinMonoid
+        or type(child.op) is not TypedBuiltinSemiring
+    ):
+        return
+    semiring = child.op
+    monoid = expr.op
+    if (
+        monoid.name != semiring.monoid.name
+        or (semiring.monoid.name, semiring.binaryop.name) not in _DISTRIBUTIVE
+    ):
+        return
+    left, right = child.args
+    if not (left.dtype == right.dtype == semiring.type == semiring.return_type == monoid.type):
+        return
+    from .vector import VectorExpression
+
+    if expr.method_name == "reduce_rowwise":
+        reduced = VectorExpression(
+            "reduce_rowwise",
+            "GrB_Matrix_reduce_Monoid",
+            [right],
+            op=monoid,
+            size=right._nrows,
+            at=right._is_transposed,
+        )
+        return VectorExpression(
+            "mxv",
+            "GrB_mxv",
+            [left, reduced],
+            op=semiring,
+            size=left._nrows,
+            at=left._is_transposed,
+        )
+    reduced = VectorExpression(
+        "reduce_columnwise",
+        "GrB_Matrix_reduce_Monoid",
+        [left],
+        op=monoid,
+        size=left._ncols,
+        at=not left._is_transposed,
+    )
+    return VectorExpression(
+        "vxm",
+        "GrB_vxm",
+        [reduced, right],
+        op=semiring,
+        size=right._ncols,
+        bt=right._is_transposed,
+    )
+
+
+_RULES = [_simplify_apply, _skip_ignored_apply, _reassociate_reduce]
+
+
+def _push_mask(expr, mask, counts, masks):
+    """Use the mask of elementwise expressions to compute their arguments"""
+    if expr.method_name not in _ELEMENTWISE or expr.output_type._is_scalar:
+        return
+    for i, arg in enumerate(expr.args):
+        if (
+            _is_delayed(arg)
+            and counts[id(arg)] == 1
+            and not (expr.at if i == 0 else expr.bt)
+            and arg.output_type is expr.output_type
+            and arg.shape == expr.shape
+        ):
+            masks[id(arg)] = mask
+            _push_mask(arg, mask, counts, masks)
+
+
+def _compute(expr, counts, masks, values):
+    args = []
+    used = []
+    for arg in expr.args:
+        if isinstance(arg, BaseExpression):
+            if arg._value is not None:
+                arg = arg._value
+            else:
+                key = id(arg)
+                if key not in values:
+                    delayed = _compute(arg, counts, masks, values)
+                    mask = masks.get(key)
+                    if mask is None:
+                        values[key] = delayed.new()
+                    else:
+                        values[key] = delayed.new(mask=mask)
+                used.append(key)
+                arg = values[key]
+        args.append(arg)
+    # Release values as soon as they are no longer needed.  The returned expression
+    # holds references to its arguments until it has been computed by the caller.
+    for key in used:
+        counts[key] -= 1
+        if counts[key] == 0:
+            del values[key]
+    return _with_args(expr, args)
@@ -0,0 +1,218 @@
+from collections.abc import Mapping, Sequence
+
+from suitesparse_graphblas import vararg
+
+from .. import ffi, lib
+from ..exceptions import _error_code_lookup, check_status
+from ..utils import libget
+
+_ORIENTATIONS = {"rowwise": lib.GxB_BY_ROW, "columnwise": lib.GxB_BY_COL}
+_SPARSITIES = {
+    "hypersparse": lib.GxB_HYPERSPARSE,
+    "sparse": lib.GxB_SPARSE,
+    "bitmap": lib.GxB_BITMAP,
+    "full": lib.GxB_FULL,
+}
+
+
+def _orientation_to_c(value):
+    try:
+        return _ORIENTATIONS[value]
+    except KeyError:
+        raise ValueError(f'orientation must be "rowwise" or "columnwise"; got: {value!r}') from None
+
+
+def _orientation_to_python(value):
+    return "columnwise" if value == lib.GxB_BY_COL else "rowwise"
+
+
+def _sparsity_to_c(value):
+    if isinstance(value, str):
+        value = [value]
+    if "auto" in value:
+        return lib.GxB_AUTO_SPARSITY
+    rv = 0
+    for sparsity in value:
+        if sparsity not in _SPARSITIES:
+            raise ValueError(
+                'sparsity must be "auto" or one or more of "hypersparse", "sparse", '
+                f'"bitmap", or "full"; got: {sparsity!r}'
+            )
+        rv |= _SPARSITIES[sparsity]
+    return rv
+
+
+def _sparsity_to_python(value):
+    if value == lib.GxB_AUTO_SPARSITY:
+        return "auto"
+    rv = [sparsity for sparsity, bit in _SPARSITIES.items() if value & bit]
+    return rv[0] if len(rv) == 1 else rv
+
+
+def _bitmap_switch_to_c(value):
+    if not isinstance(value, Sequence):
+        return [value] * lib.GxB_NBITMAP_SWITCH
+    if len(value) != lib.GxB_NBITMAP_SWITCH:
+        raise ValueError(
+            f"bitmap_switch must be a number or a sequence of {lib.GxB_NBITMAP_SWITCH} "
+            f"numbers; got length {len(value)}"
+        )
+    return value
+
+
+# name: (field, C type, to C, to Python)
+_GLOBAL_OPTIONS = {
+    "nthreads": (lib.GxB_NTHREADS, "int", int, None),
+    "chunk": (lib.GxB_CHUNK, "double", float, None),
+    "hyper_switch": (lib.GxB_HYPER_SWITCH, "double", float, None),
+    "bitmap_switch": (
+        lib.GxB_BITMAP_SWITCH,
+        f"double[{lib.GxB_NBITMAP_SWITCH}]",
+        _bitmap_switch_to_c,
+        list,
+    ),
+    "orientation": (lib.GxB_FORMAT, "GxB_Format_Value", _orientation_to_c, _orientation_to_python),
+    "burble": (lib.GxB_BURBLE, "bool", bool, None),
+}
+_MATRIX_OPTIONS = {
+    "orientation": _GLOBAL_OPTIONS["orientation"],
+    "sparsity": (lib.GxB_SPARSITY_CONTROL, "int", _sparsity_to_c, _sparsity_to_python),
+    "hyper_switch": _GLOBAL_OPTIONS["hyper_switch"],
+    "bitmap_switch": (lib.GxB_BITMAP_SWITCH, "double", float, None),
+}
+_VECTOR_OPTIONS = {
+    "sparsity": _MATRIX_OPTIONS["sparsity"],
+    "bitmap_switch": _MATRIX_OPTIONS["bitmap_switch"],
+}
+
+
+def _get_option(getter, name, options, *args, obj=None):
+    field, ctype, to_c, to_python = options[name]
+    if ctype.endswith("]"):
+        value = ffi.new(ctype)
+    else:
+        value = ffi.new(f"{ctype}*")
+    info = getter(*args, field, vararg(value))
+    if obj is not None:
+        check_status(info, obj)
+    elif info != lib.GrB_SUCCESS:  # pragma: no cover
+        raise _error_code_lookup[info](f"Failed to get global option {name!r}")
+    value = list(value) if ctype.endswith("]") else value[0]
+    if to_python is not None:
+        value = to_python(value)
+    return value
+
+
+def _set_option(setter, name, value, options, *args, obj=None):
+    field, ctype, to_c, to_python = options[name]
+    value = to_c(value)
+    if ctype.endswith("]"):
+        value = ffi.new(ctype, value)
+    else:
+        # Variadic arguments are promoted to int or double
+        value = ffi.cast("double" if ctype == "double" else "int", value)
+    info = setter(*args, field, vararg(value))
+    if obj is not None:
+        check_status(info, obj)
+    elif info != lib.GrB_SUCCESS:  # pragma: no cover
+        raise _error_code_lookup[info](f"Failed to set global option {name!r}")
+
+
+def _check_option_name(name, options, kind):
+    if name not in options:
+        raise KeyError(f"Unknown {kind} option: {name!r}.  Valid options are: {list(options)}")
+
+
+def get_options(obj):
+    """Get the SuiteSparse options of a Matrix or Vector as a dict"""
+    kind = type(obj).__name__
+    options = _MATRIX_OPTIONS if kind == "Matrix" else _VECTOR_OPTIONS
+    getter = libget(f"GxB_{kind}_Option_get")
+    return {name: _get_option(getter, name, options, obj._carg, obj=obj) for name in options}
+
+
+def set_options(obj, **kwargs):
+    """Set SuiteSparse options of a Matrix or Vector; options with None values are ignored"""
+    kind = type(obj).__name__
+    options = _MATRIX_OPTIONS if kind == "Matrix" else _VECTOR_OPTIONS
+    setter = libget(f"GxB_{kind}_Option_set")
+    for name, value in kwargs.items():
+        _check_option_name(name, options, kind)
+        if value is not None:
+            _set_option(setter, name, value, options, obj._carg, obj=obj)
+
+
+class GlobalConfig(Mapping):
+    """Get and set global options of SuiteSparse:GraphBLAS.
+
+    Options are:
+
+    - ``nthreads``: maximum number of threads to use in each operation
+    - ``chunk``: amount of work a thread should do, used to reduce ``nthreads``
+      for small problems
+    - ``hyper_switch``: default ``hyper_switch`` of new Matrix objects
+    - ``bitmap_switch``: default ``bitmap_switch`` of new objects, as a list of
+      8 numbers for objects of different sizes (setting one number sets all 8)
+    - ``orientation``: default orientation of new Matrix objects,
+      "rowwise" or "columnwise"
+    - ``burble``: whether to print diagnostic output
+
+    Get and set options like a dict, or call with options to set them and restore
+    the previous values when used as a context manager:
+
+    >>> grblas.ss.config["nthreads"] = 4
+    >>> with grblas.ss.config(nthreads=1, burble=True):
+    ...     C = A.mxm(B).new()
+
+    See Also
+    --------
+    Matrix.ss.set_options
+    Vector.ss.set_options
+    """
+
+    def __getitem__(self, key):
+        _check_option_name(key, _GLOBAL_OPTIONS, "global")
+        return _get_option(lib.GxB_Global_Option_get, key, _GLOBAL_OPTIONS)
+
+    def __setitem__(self, key, value):
+        _check_option_name(key, _GLOBAL_OPTIONS, "global")
+        _set_option(lib.GxB_Global_Option_set, key, value, _GLOBAL_OPTIONS)
+
+    def __iter__(self):
+        return iter(_GLOBAL_OPTIONS)
+
+    def __len__(self):
+        return len(_GLOBAL_OPTIONS)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+    def __call__(self, **options):
+        return _SetGlobalOptions(self, options)
+
+
+class _SetGlobalOptions:
+    __slots__ = "_config", "_prev"
+
+    def __init__(self, config, options):
+        self._config = config
+        self._prev = {key: config[key] for key in options}
+        try:
+            for key, value in options.items():
+                config[key] = value
+        except Exception:
+            self._restore()
+            raise
+
+    def _restore(self):
+        for key, value in self._prev.items():
+            self._config[key] = value
+
+    def __enter__(self):
+        return self._config
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._restore()
+
+
+config = GlobalConfig()
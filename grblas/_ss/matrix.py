@@ -1,17 +1,18 @@
 import warnings
+from functools import reduce
 from numbers import Integral, Number
 
 import numba
 import numpy as np
 from numba import njit
-from suitesparse_graphblas.utils import claim_buffer, claim_buffer_2d, unclaim_buffer
 
 import grblas as gb
 
 from .. import ffi, lib, monoid
 from ..base import call, record_raw
-from ..dtypes import _INDEX, INT64, lookup_dtype
-from ..exceptions import check_status, check_status_carg
+from ..dtypes import _INDEX, INT64, lookup_dtype, unify
+from ..exceptions import DimensionMismatch, check_status, check_status_carg
+from ..operator import get_typed_op
 from ..scalar import Scalar, _as_scalar
 from ..utils import (
     _CArray,
@@ -23,11 +24,21 @@ from ..utils import (
     values_to_numpy_buffer,
     wrapdoc,
 )
-from .utils import get_order
+from .config import get_options, set_options
+from .utils import claim_buffer, claim_buffer_2d, get_order, unclaim_buffer
 
 ffi_new = ffi.new
 
 
+def _libget_raw(cfunc_name):
+    """Get a C function that moves data between numpy arrays and SuiteSparse.
+
+    The call is recorded as text, because a recorded `Program` can't replay it.
+    """
+    record_raw(f"{cfunc_name}(...);")
+    return libget(cfunc_name)
+
+
 @njit
 def _head_matrix_full(values, nrows, ncols, dtype, n, is_iso):  # pragma: no cover
     rows = np.empty(n, dtype=np.uint64)
@@ -323,6 +334,73 @@ def _as_matrix(x):
     return x._as_matrix() if hasattr(x, "_as_matrix") else x
 
 
+def _empty_csc(nrows, ncols, dtype):
+    from ..matrix import Matrix
+
+    return Matrix.ss.import_csc(
+        nrows=nrows,
+        ncols=ncols,
+        indptr=np.zeros(ncols + 1, dtype=np.uint64),
+        row_indices=np.empty(0, dtype=np.uint64),
+        values=np.empty(0, dtype=dtype.np_type),
+        dtype=dtype,
+        name="",
+    )
+
+
+def _stack_vectors(vectors, size, *, within):
+    """Concatenate Vectors into the columns of a new column-oriented Matrix"""
+    if not isinstance(vectors, (list, tuple)):
+        raise TypeError(f"vectors argument must be list or tuple; got: {type(vectors)}")
+    if not vectors:
+        raise ValueError("vectors argument must not be empty")
+    dummy = gb.Matrix.__new__(gb.Matrix)
+    vectors = [
+        dummy._expect_type(vector, gb.Vector, within=within, argname="vectors")
+        for vector in vectors
+    ]
+    for i, vector in enumerate(vectors):
+        if vector._size != size:
+            raise DimensionMismatch(
+                f"Vector at position {i} has size {vector._size}; expected size {size}"
+            )
+    dtype = reduce(unify, {vector.dtype for vector in vectors})
+    # Vectors are column-oriented, so this concatenates without converting
+    rv = _empty_csc(size, len(vectors), dtype)
+    rv.ss._concat([[vector._as_matrix() for vector in vectors]], 1, len(vectors))
+    return rv
+
+
+def _split_columns(matrix, name):
+    """Split a column-oriented Matrix into a list of Vectors"""
+    from ..vector import Vector
+
+    nrows, ncols = matrix.shape
+    tiles = ffi_new("GrB_Matrix[]", ncols)
+    call(
+        "GxB_Matrix_split",
+        [
+            MatrixArray(tiles, matrix, name="tiles"),
+            _as_scalar(1, _INDEX, is_cscalar=True),
+            _as_scalar(ncols, _INDEX, is_cscalar=True),
+            _CArray([nrows]),
+            _CArray([1] * ncols),
+            matrix,
+            None,
+        ],
+    )
+    rv = []
+    dtype = matrix.dtype
+    for i in range(ncols):
+        # Copy to a new handle so we can free `tiles`
+        new_vector = ffi_new("GrB_Vector*")
+        new_vector[0] = ffi.cast("GrB_Vector", tiles[i])
+        vector = Vector(new_vector, dtype, name=None if name is None else f"{name}_{i}")
+        vector._size = nrows
+        rv.append(vector)
+    return rv
+
+
 class MatrixArray:
     __slots__ = "_carg", "_exc_arg", "name"
 
@@ -401,6 +479,53 @@ class ss:
         else:
             return "rowwise"
 
+    def get_options(self):
+        """
+        GxB_Matrix_Option_get
+
+        Return a dict of the options that control how this Matrix is stored:
+        ``orientation``, ``sparsity``, ``hyper_switch``, and ``bitmap_switch``.
+
+        See Also
+        --------
+        Matrix.ss.set_options
+        grblas.ss.config
+        """
+        return get_options(self._parent)
+
+    def set_options(
+        self, *, orientation=None, sparsity=None, hyper_switch=None, bitmap_switch=None
+    ):
+        """
+        GxB_Matrix_Option_set
+
+        Set options that control how this Matrix is stored.
+        Options that are not given are not changed.
+
+        Parameters
+        ----------
+        orientation : {"rowwise", "columnwise"}, optional
+        sparsity : str or list of str, optional
+            The formats SuiteSparse may choose from: "auto" for all formats, or
+            any of "hypersparse", "sparse", "bitmap", and "full".
+        hyper_switch : float, optional
+            Controls when to change between hypersparse and sparse formats.
+        bitmap_switch : float, optional
+            Controls when to change to bitmap format.
+
+        See Also
+        --------
+        Matrix.ss.get_options
+        grblas.ss.config
+        """
+        set_options(
+            self._parent,
+            orientation=orientation,
+            sparsity=sparsity,
+            hyper_switch=hyper_switch,
+            bitmap_switch=bitmap_switch,
+        )
+
     def diag(self, vector, k=0):
         """
         GxB_Matrix_diag
@@ -439,6 +564,7 @@ class ss:
         vector = self._parent._expect_type(
             vector, gb.Vector, within="ss.build_diag", argname="vector"
         )
+        self._parent._version += 1
         call("GxB_Matrix_diag", [self._parent, vector, _as_scalar(k, INT64, is_cscalar=True), None])
 
     def split(self, chunks, *, name=None):
@@ -514,6 +640,7 @@ class ss:
                     tile = row_tiles[j] = tile.new()
                 ctiles[index] = tile.gb_obj[0]
                 index += 1
+        self._parent._version += 1
         call(
             "GxB_Matrix_concat",
             [
@@ -545,6 +672,63 @@ class ss:
         tiles, m, n, is_matrix = _concat_mn(tiles, is_matrix=True)
         self._concat(tiles, m, n)
 
+    def mxv_many(self, vectors, op="plus_times", *, name=None):
+        """
+        Compute ``A.mxv(v, op)`` for every Vector ``v`` in ``vectors``.
+
+        The vectors are concatenated into the columns of a Matrix, so all the results
+        are computed with a single ``mxm``, which is much faster than calling ``mxv``
+        many times with small vectors.  Vectors with different dtypes are cast to a
+        common dtype first.  Positional semirings are not supported.
+
+        Returns a list of new Vectors.  If ``name`` is given, they are named
+        ``f"{name}_{i}"``.
+
+        See Also
+        --------
+        Matrix.mxv
+        Matrix.ss.vxm_many
+        """
+        method_name = "ss.mxv_many"
+        parent = self._parent
+        other = _stack_vectors(vectors, parent._ncols, within=method_name)
+        op = get_typed_op(op, parent.dtype, other.dtype, kind="semiring")
+        parent._expect_op(op, "Semiring", within=method_name, argname="op")
+        if op.is_positional:
+            raise ValueError(f"{method_name} does not support positional semirings; got {op}")
+        result = _empty_csc(parent._nrows, other._ncols, op.return_type)
+        result << parent.mxm(other, op)
+        return _split_columns(result, name)
+
+    def vxm_many(self, vectors, op="plus_times", *, name=None):
+        """
+        Compute ``v.vxm(A, op)`` for every Vector ``v`` in ``vectors``.
+
+        The vectors are concatenated into the columns of a Matrix, so all the results
+        are computed with a single ``mxm``, which is much faster than calling ``vxm``
+        many times with small vectors.  Vectors with different dtypes are cast to a
+        common dtype first.  Positional semirings are not supported.
+
+        Returns a list of new Vectors.  If ``name`` is given, they are named
+        ``f"{name}_{i}"``.
+
+        See Also
+        --------
+        Vector.vxm
+        Matrix.ss.mxv_many
+        """
+        method_name = "ss.vxm_many"
+        parent = self._parent
+        other = _stack_vectors(vectors, parent._nrows, within=method_name)
+        op = get_typed_op(op, other.dtype, parent.dtype, kind="semiring")
+        parent._expect_op(op, "Semiring", within=method_name, argname="op")
+        if op.is_positional:
+            raise ValueError(f"{method_name} does not support positional semirings; got {op}")
+        result = _empty_csc(parent._ncols, other._ncols, op.return_type)
+        # Vectors must be the left argument to `op`, so compute (V.T @ A).T
+        result << other.T.mxm(parent, op).new(name="").T
+        return _split_columns(result, name)
+
     def build_scalar(self, rows, columns, value):
         """
         GxB_Matrix_build_Scalar
@@ -563,6 +747,7 @@ class ss:
                 f"`rows` and `columns` lengths must match: {rows.size}, {columns.size}"
             )
         scalar = _as_scalar(value, self._parent.dtype, is_cscalar=False)  # pragma: is_grbscalar
+        self._parent._version += 1
         call(
             "GxB_Matrix_build_Scalar",
             [
@@ -784,6 +969,8 @@ class ss:
                 format = f"{self.format[:-1]}c"
         if give_ownership or format == "coo":
             parent = self._parent
+            if give_ownership:
+                parent._version += 1
         else:
             parent = self._parent.dup(name=f"M_{method}")
         dtype = parent.dtype.np_type
@@ -843,6 +1030,7 @@ class ss:
                         rv["format"] += "c"
                 if give_ownership:
                     if method == "export":
+                        record_raw(f"GrB_Matrix_free(&{parent.name});")
                         parent.__del__()
                         parent.gb_obj = ffi.NULL
                     else:
@@ -892,7 +1080,7 @@ class ss:
             Aj = ffi_new("GrB_Index**")
             Aj_size = ffi_new("GrB_Index*")
             check_status(
-                libget(f"GxB_Matrix_{method}_CSR")(
+                _libget_raw(f"GxB_Matrix_{method}_CSR")(
                     mhandle,
                     *args,
                     Ap,
@@ -934,7 +1122,7 @@ class ss:
             Ai = ffi_new("GrB_Index**")
             Ai_size = ffi_new("GrB_Index*")
             check_status(
-                libget(f"GxB_Matrix_{method}_CSC")(
+                _libget_raw(f"GxB_Matrix_{method}_CSC")(
                     mhandle,
                     *args,
                     Ap,
@@ -979,7 +1167,7 @@ class ss:
             Ah_size = ffi_new("GrB_Index*")
             Aj_size = ffi_new("GrB_Index*")
             check_status(
-                libget(f"GxB_Matrix_{method}_HyperCSR")(
+                _libget_raw(f"GxB_Matrix_{method}_HyperCSR")(
                     mhandle,
                     *args,
                     Ap,
@@ -1034,7 +1222,7 @@ class ss:
             Ah_size = ffi_new("GrB_Index*")
             Ai_size = ffi_new("GrB_Index*")
             check_status(
-                libget(f"GxB_Matrix_{method}_HyperCSC")(
+                _libget_raw(f"GxB_Matrix_{method}_HyperCSC")(
                     mhandle,
                     *args,
                     Ap,
@@ -1084,9 +1272,9 @@ class ss:
                 rv["nvec"] = nvec
         elif format == "bitmapr" or format == "bitmapc":
             if format == "bitmapr":
-                cfunc = libget(f"GxB_Matrix_{method}_BitmapR")
+                cfunc = _libget_raw(f"GxB_Matrix_{method}_BitmapR")
             else:
-                cfunc = libget(f"GxB_Matrix_{method}_BitmapC")
+                cfunc = _libget_raw(f"GxB_Matrix_{method}_BitmapC")
             Ab = ffi_new("int8_t**")
             Ab_size = ffi_new("GrB_Index*")
             nvals_ = ffi_new("GrB_Index*")
@@ -1140,9 +1328,9 @@ class ss:
                 rv["ncols"] = ncols
         elif format == "fullr" or format == "fullc":
             if format == "fullr":
-                cfunc = libget(f"GxB_Matrix_{method}_FullR")
+                cfunc = _libget_raw(f"GxB_Matrix_{method}_FullR")
             else:
-                cfunc = libget(f"GxB_Matrix_{method}_FullC")
+                cfunc = _libget_raw(f"GxB_Matrix_{method}_FullC")
             check_status(
                 cfunc(
                     mhandle,
@@ -1327,7 +1515,7 @@ class ss:
         else:
             mhandle = matrix._carg
             args = ()
-        status = libget(f"GxB_Matrix_{method}_CSR")(
+        status = _libget_raw(f"GxB_Matrix_{method}_CSR")(
             mhandle,
             *args,
             Ap,
@@ -1351,6 +1539,7 @@ class ss:
             matrix._ncols = ncols
         else:
             check_status(status, matrix)
+            matrix._version += 1
         unclaim_buffer(indptr)
         unclaim_buffer(col_indices)
         unclaim_buffer(values)
@@ -1502,7 +1691,7 @@ class ss:
         else:
             mhandle = matrix._carg
             args = ()
-        status = libget(f"GxB_Matrix_{method}_CSC")(
+        status = _libget_raw(f"GxB_Matrix_{method}_CSC")(
             mhandle,
             *args,
             Ap,
@@ -1526,6 +1715,7 @@ class ss:
             matrix._ncols = ncols
         else:
             check_status(status, matrix)
+            matrix._version += 1
         unclaim_buffer(indptr)
         unclaim_buffer(row_indices)
         unclaim_buffer(values)
@@ -1695,7 +1885,7 @@ class ss:
         else:
             mhandle = matrix._carg
             args = ()
-        status = libget(f"GxB_Matrix_{method}_HyperCSR")(
+        status = _libget_raw(f"GxB_Matrix_{method}_HyperCSR")(
             mhandle,
             *args,
             Ap,
@@ -1722,6 +1912,7 @@ class ss:
             matrix._ncols = ncols
         else:
             check_status(status, matrix)
+            matrix._version += 1
         unclaim_buffer(indptr)
         unclaim_buffer(rows)
         unclaim_buffer(col_indices)
@@ -1891,7 +2082,7 @@ class ss:
         else:
             mhandle = matrix._carg
             args = ()
-        status = libget(f"GxB_Matrix_{method}_HyperCSC")(
+        status = _libget_raw(f"GxB_Matrix_{method}_HyperCSC")(
             mhandle,
             *args,
             Ap,
@@ -1918,6 +2109,7 @@ class ss:
             matrix._ncols = ncols
         else:
             check_status(status, matrix)
+            matrix._version += 1
         unclaim_buffer(indptr)
         unclaim_buffer(cols)
         unclaim_buffer(row_indices)
@@ -2076,7 +2268,7 @@ class ss:
         else:
             mhandle = matrix._carg
             args = ()
-        status = libget(f"GxB_Matrix_{method}_BitmapR")(
+        status = _libget_raw(f"GxB_Matrix_{method}_BitmapR")(
             mhandle,
             *args,
             Ab,
@@ -2098,6 +2290,7 @@ class ss:
             matrix._ncols = ncols
         else:
             check_status(status, matrix)
+            matrix._version += 1
         unclaim_buffer(bitmap)
         unclaim_buffer(values)
         return matrix
@@ -2254,7 +2447,7 @@ class ss:
         else:
             mhandle = matrix._carg
             args = ()
-        status = libget(f"GxB_Matrix_{method}_BitmapC")(
+        status = _libget_raw(f"GxB_Matrix_{method}_BitmapC")(
             mhandle,
             *args,
             Ab,
@@ -2276,6 +2469,7 @@ class ss:
             matrix._ncols = ncols
         else:
             check_status(status, matrix)
+            matrix._version += 1
         unclaim_buffer(bitmap)
         unclaim_buffer(values)
         return matrix
@@ -2407,7 +2601,7 @@ class ss:
         else:
             mhandle = matrix._carg
             args = ()
-        status = libget(f"GxB_Matrix_{method}_FullR")(
+        status = _libget_raw(f"GxB_Matrix_{method}_FullR")(
             mhandle,
             *args,
             Ax,
@@ -2426,6 +2620,7 @@ class ss:
             matrix._ncols = ncols
         else:
             check_status(status, matrix)
+            matrix._version += 1
         unclaim_buffer(values)
         return matrix
 
@@ -2555,7 +2750,7 @@ class ss:
         else:
             mhandle = matrix._carg
             args = ()
-        status = libget(f"GxB_Matrix_{method}_FullC")(
+        status = _libget_raw(f"GxB_Matrix_{method}_FullC")(
             mhandle,
             *args,
             Ax,
@@ -2574,6 +2769,7 @@ class ss:
             matrix._ncols = ncols
         else:
             check_status(status, matrix)
+            matrix._version += 1
         unclaim_buffer(values)
         return matrix
 
@@ -3474,6 +3670,89 @@ class ss:
     def head(self, n=10, dtype=None, *, sort=False):
         return head(self._parent, n, dtype, sort=sort)
 
+    def to_values(self, dtype=None, *, sort=False, give_ownership=False):
+        """Like ``matrix.to_values()``, but use ``export`` to avoid copying data.
+
+        The Matrix is exported as "coor" or "cooc" according to its orientation, so the
+        column indices (or row indices) and values are the buffers from SuiteSparse, and
+        only the other indices are computed from the index pointers.  If the Matrix is
+        iso-valued, the values are a read-only view of the single value.
+
+        If ``give_ownership`` is True, the Matrix is left empty and its data is not copied,
+        which is much more memory efficient for large matrices.  Otherwise, the Matrix is
+        copied first.
+
+        If sort is True, indices are sorted according to the orientation of the Matrix.
+        Otherwise, the order of indices within each row (or column) is not guaranteed.
+        """
+        fmt = "coor" if self.orientation == "rowwise" else "cooc"
+        if give_ownership:
+            d = self.unpack(fmt, sort=sort)
+        else:
+            d = self.export(fmt, sort=sort)
+        values = d["values"]
+        if dtype is not None:
+            values = values.astype(lookup_dtype(dtype).np_type, copy=False)
+        if d["is_iso"]:
+            values = np.broadcast_to(values[:1], d["rows"].shape)
+        return d["rows"], d["cols"], values
+
+    def iter_chunks(self, chunk_nvals=2**20, dtype=None, *, sort=False):
+        """Iterate over the elements of the Matrix in chunks of ``(rows, cols, values)``.
+
+        Each chunk has at most ``chunk_nvals`` elements, so huge matrices can be processed
+        in bounded memory.  Elements are ordered by row for row-oriented formats and by
+        column for column-oriented formats.  If sort is True, then elements within each
+        row (or column) are also sorted.
+
+        While iterating, the data of the Matrix is unpacked (so it is empty), and it is
+        packed back when iteration stops.  Hence, the Matrix must not be used until
+        iteration finishes or the iterator is closed.  Bitmap and full formats are
+        converted to CSR or CSC.
+        """
+        if not isinstance(chunk_nvals, Integral) or chunk_nvals <= 0:
+            raise ValueError(f"chunk_nvals must be a positive integer; got: {chunk_nvals!r}")
+        if dtype is None:
+            dtype = self._parent.dtype
+        else:
+            dtype = lookup_dtype(dtype)
+        fmt = self.format
+        if fmt.startswith("bitmap") or fmt.startswith("full"):
+            fmt = "csr" if fmt.endswith("r") else "csc"
+        d = self.unpack(fmt, raw=True, sort=sort)
+        try:
+            if fmt.endswith("r"):
+                indices = d["col_indices"]
+                vectors = d.get("rows")
+                nvec = d["nrows"]
+            else:
+                indices = d["row_indices"]
+                vectors = d.get("cols")
+                nvec = d["ncols"]
+            if vectors is not None:
+                nvec = d["nvec"]
+            # Buffers may be larger than needed when `raw=True`
+            indptr = d["indptr"][: nvec + 1]
+            values = d["values"]
+            nvals = int(indptr[-1])
+            for start in range(0, nvals, chunk_nvals):
+                stop = min(start + chunk_nvals, nvals)
+                # Copy, because the buffers are given back to the Matrix when done
+                major = _indptr_to_indices_range(indptr, start, stop)
+                if vectors is not None:
+                    major = vectors[major]
+                minor = indices[start:stop].copy()
+                if d["is_iso"]:
+                    vals = np.broadcast_to(values[:1].astype(dtype.np_type), minor.shape)
+                else:
+                    vals = values[start:stop].astype(dtype.np_type)
+                if fmt.endswith("r"):
+                    yield major, minor, vals
+                else:
+                    yield minor, major, vals
+        finally:
+            self.pack_any(take_ownership=True, **d)
+
     def scan_columnwise(self, op=monoid.plus, *, name=None):
         """Perform a prefix scan across columns with the given monoid.
 
@@ -4132,3 +4411,15 @@ def indptr_to_indices(indptr):  # pragma: no cover
         for j in range(indptr[i], indptr[i + 1]):
             indices[j] = i
     return indices
+
+
+@njit
+def _indptr_to_indices_range(indptr, start, stop):  # pragma: no cover
+    """Like ``indptr_to_indices(indptr)[start:stop]``"""
+    indices = np.empty(stop - start, dtype=np.uint64)
+    i = np.searchsorted(indptr, start, side="right") - 1
+    for j in range(start, stop):
+        while indptr[i + 1] <= j:
+            i += 1
+        indices[j - start] = i
+    return indices
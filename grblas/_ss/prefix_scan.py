@@ -1,11 +1,15 @@
 from math import ceil, log2
 
+import numba
 import numpy as np
 
-from .. import binary
-from ..operator import get_semiring, get_typed_op
+from .. import base, binary
+from ..operator import TypedBuiltinMonoid, get_semiring, get_typed_op
 from .matrix import compact_indices
 
+# Builtin monoids that `_segmented_scan` can compute
+_SCAN_OPS = {"plus": 0, "times": 1, "min": 2, "max": 3, "land": 4, "lor": 5}
+
 
 # By default, scans on matrices are done along rows.
 # To perform scans along columns, pass a transposed matrix.
@@ -20,6 +24,8 @@ def prefix_scan(A, monoid, *, name=None, within):
             monoid = monoid.monoid
         else:
             A._expect_op(monoid, "Monoid", argname="op", within=within)
+    if _can_scan_values(monoid):
+        return _scan_values(A, monoid, name=name)
     semiring = get_semiring(monoid, binary.first)
     binaryop = semiring.monoid.binaryop
 
@@ -181,3 +187,74 @@ def prefix_scan(A, monoid, *, name=None, within):
         rv_info = RV.ss.export("hypercsr", sort=True, give_ownership=True)
         RV = Matrix.ss.import_hypercsr(name=name, **dict(info, values=rv_info["values"]))
     return RV
+
+
+def _can_scan_values(monoid):
+    """Whether `_scan_values` can scan with the (typed) monoid"""
+    if type(monoid) is not TypedBuiltinMonoid or monoid.name not in _SCAN_OPS:
+        return False
+    if monoid.type.np_type.kind == "c":
+        return False
+    # Exporting values can't be replayed, so use GraphBLAS calls while recording
+    return not base._recorder_started or base._recorder.get(base._prev_recorder) is None
+
+
+def _scan_values(A, monoid, *, name):
+    """Scan the values of each row of A (or of Vector A) in one parallel pass.
+
+    Values are exported in sorted order, so each row is a contiguous segment of
+    the values array, and they are scanned in place with `_segmented_scan`.
+    """
+    from .. import Matrix, Vector
+    from ..matrix import TransposedMatrix
+
+    if type(A) is Vector:
+        info = A.ss.export("sparse", sort=True)
+        indptr = np.array([0, info["indices"].size], dtype=np.uint64)
+    elif type(A) is TransposedMatrix:
+        info = A.T.ss.export("hypercsc", sort=True)
+        indptr = info["indptr"]
+    else:
+        info = A.ss.export("hypercsr", sort=True)
+        indptr = info["indptr"]
+    values = info["values"]
+    if info["is_iso"]:
+        values = np.repeat(values, indptr[-1])
+    values = values.astype(monoid.type.np_type, copy=False)
+    _segmented_scan(indptr, values, _SCAN_OPS[monoid.name])
+    info = dict(info, values=values, is_iso=False)
+    if type(A) is Vector:
+        return Vector.ss.import_sparse(name=name, take_ownership=True, **info)
+    if type(A) is TransposedMatrix:
+        return Matrix.ss.import_hypercsc(name=name, take_ownership=True, **info)
+    return Matrix.ss.import_hypercsr(name=name, take_ownership=True, **info)
+
+
+@numba.njit(parallel=True, cache=True)
+def _segmented_scan(indptr, values, op):  # pragma: no cover
+    """Scan values[indptr[i]:indptr[i + 1]] in place for each i"""
+    for i in numba.prange(indptr.size - 1):
+        start = np.int64(indptr[i])
+        end = np.int64(indptr[i + 1])
+        for j in range(start + 1, end):
+            x = values[j - 1]
+            y = values[j]
+            if op == 0:
+                values[j] = x + y
+            elif op == 1:
+                values[j] = x * y
+            elif op == 2:
+                # Like fmin: ignore NaN
+                if y < x or x != x:
+                    values[j] = y
+                else:
+                    values[j] = x
+            elif op == 3:
+                if y > x or x != x:
+                    values[j] = y
+                else:
+                    values[j] = x
+            elif op == 4:
+                values[j] = x and y
+            else:
+                values[j] = x or y
@@ -1,3 +1,28 @@
+from suitesparse_graphblas import utils as _ssgb_utils
+
+from .. import metrics
+
+
+def claim_buffer(ffi, cdata, size, dtype):
+    """Take ownership of a buffer from GraphBLAS as a numpy array and count it as exported"""
+    array = _ssgb_utils.claim_buffer(ffi, cdata, size, dtype)
+    metrics._add("exported_bytes", array.nbytes)
+    return array
+
+
+def claim_buffer_2d(ffi, cdata, cdata_size, nrows, ncols, dtype, is_c_order):
+    """Like `claim_buffer`, but return a 2d array"""
+    array = _ssgb_utils.claim_buffer_2d(ffi, cdata, cdata_size, nrows, ncols, dtype, is_c_order)
+    metrics._add("exported_bytes", array.nbytes)
+    return array
+
+
+def unclaim_buffer(array):
+    """Give ownership of a numpy array to GraphBLAS and count it as imported"""
+    metrics._add("imported_bytes", array.nbytes)
+    _ssgb_utils.unclaim_buffer(array)
+
+
 def get_order(order):
     val = order.lower()
     if val in {"c", "row", "rows", "rowwise"}:
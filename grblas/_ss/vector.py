@@ -2,7 +2,6 @@ import warnings
 
 import numpy as np
 from numba import njit
-from suitesparse_graphblas.utils import claim_buffer, unclaim_buffer
 
 import grblas as gb
 
@@ -11,10 +10,11 @@ from ..base import call
 from ..dtypes import _INDEX, INT64, UINT64, lookup_dtype
 from ..exceptions import check_status, check_status_carg
 from ..scalar import _as_scalar
-from ..utils import _CArray, ints_to_numpy_buffer, libget, values_to_numpy_buffer, wrapdoc
-from .matrix import MatrixArray, _concat_mn, normalize_chunks
+from ..utils import _CArray, ints_to_numpy_buffer, values_to_numpy_buffer, wrapdoc
+from .config import get_options, set_options
+from .matrix import MatrixArray, _concat_mn, _libget_raw, normalize_chunks
 from .prefix_scan import prefix_scan
-from .utils import get_order
+from .utils import claim_buffer, get_order, unclaim_buffer
 
 ffi_new = ffi.new
 
@@ -120,6 +120,42 @@ class ss:
             raise NotImplementedError(f"Unknown sparsity status: {sparsity_status}")
         return format
 
+    def get_options(self):
+        """
+        GxB_Vector_Option_get
+
+        Return a dict of the options that control how this Vector is stored:
+        ``sparsity`` and ``bitmap_switch``.
+
+        See Also
+        --------
+        Vector.ss.set_options
+        grblas.ss.config
+        """
+        return get_options(self._parent)
+
+    def set_options(self, *, sparsity=None, bitmap_switch=None):
+        """
+        GxB_Vector_Option_set
+
+        Set options that control how this Vector is stored.
+        Options that are not given are not changed.
+
+        Parameters
+        ----------
+        sparsity : str or list of str, optional
+            The formats SuiteSparse may choose from: "auto" for all formats, or
+            any of "sparse", "bitmap", and "full".
+        bitmap_switch : float, optional
+            Controls when to change to bitmap format.
+
+        See Also
+        --------
+        Vector.ss.get_options
+        grblas.ss.config
+        """
+        set_options(self._parent, sparsity=sparsity, bitmap_switch=bitmap_switch)
+
     def diag(self, matrix, k=0):
         """
         GxB_Vector_diag
@@ -165,6 +201,7 @@ class ss:
             # Transpose descriptor doesn't do anything, so use the parent
             k = -k
             matrix = matrix._matrix
+        self._parent._version += 1
         call("GxB_Vector_diag", [self._parent, matrix, _as_scalar(k, INT64, is_cscalar=True), None])
 
     def split(self, chunks, *, name=None):
@@ -223,6 +260,7 @@ class ss:
         ctiles = ffi.new("GrB_Matrix[]", m)
         for i, tile in enumerate(tiles):
             ctiles[i] = tile.gb_obj[0]
+        self._parent._version += 1
         call(
             "GxB_Matrix_concat",
             [
@@ -265,6 +303,7 @@ class ss:
         """
         indices = ints_to_numpy_buffer(indices, np.uint64, name="indices")
         scalar = _as_scalar(value, self._parent.dtype, is_cscalar=False)  # pragma: is_grbscalar
+        self._parent._version += 1
         call(
             "GxB_Vector_build_Scalar",
             [
@@ -360,6 +399,7 @@ class ss:
     def _export(self, format=None, *, sort=False, give_ownership=False, raw=False, method):
         if give_ownership:
             parent = self._parent
+            parent._version += 1
         else:
             parent = self._parent.dup(name=f"v_{method}")
         dtype = parent.dtype.np_type
@@ -391,7 +431,7 @@ class ss:
             vi_size = ffi_new("GrB_Index*")
             nvals = ffi_new("GrB_Index*")
             check_status(
-                libget(f"GxB_Vector_{method}_CSC")(
+                _libget_raw(f"GxB_Vector_{method}_CSC")(
                     vhandle,
                     *args,
                     vi,
@@ -430,7 +470,7 @@ class ss:
             vb_size = ffi_new("GrB_Index*")
             nvals = ffi_new("GrB_Index*")
             check_status(
-                libget(f"GxB_Vector_{method}_Bitmap")(
+                _libget_raw(f"GxB_Vector_{method}_Bitmap")(
                     vhandle, *args, vb, vx, vb_size, vx_size, is_iso, nvals, ffi.NULL
                 ),
                 parent,
@@ -456,7 +496,9 @@ class ss:
                 rv["size"] = size
         elif format == "full":
             check_status(
-                libget(f"GxB_Vector_{method}_Full")(vhandle, *args, vx, vx_size, is_iso, ffi.NULL),
+                _libget_raw(f"GxB_Vector_{method}_Full")(
+                    vhandle, *args, vx, vx_size, is_iso, ffi.NULL
+                ),
                 parent,
             )
             is_iso = is_iso[0]
@@ -807,7 +849,7 @@ class ss:
         else:
             vhandle = vector._carg
             args = ()
-        status = libget(f"GxB_Vector_{method}_CSC")(
+        status = _libget_raw(f"GxB_Vector_{method}_CSC")(
             vhandle,
             *args,
             vi,
@@ -829,6 +871,7 @@ class ss:
             vector._size = size
         else:
             check_status(status, vector)
+            vector._version += 1
         unclaim_buffer(indices)
         unclaim_buffer(values)
         return vector
@@ -978,7 +1021,7 @@ class ss:
         else:
             vhandle = vector._carg
             args = ()
-        status = libget(f"GxB_Vector_{method}_Bitmap")(
+        status = _libget_raw(f"GxB_Vector_{method}_Bitmap")(
             vhandle,
             *args,
             vb,
@@ -999,6 +1042,7 @@ class ss:
             vector._size = size
         else:
             check_status(status, vector)
+            vector._version += 1
         unclaim_buffer(bitmap)
         unclaim_buffer(values)
         return vector
@@ -1122,7 +1166,7 @@ class ss:
         else:
             vhandle = vector._carg
             args = ()
-        status = libget(f"GxB_Vector_{method}_Full")(
+        status = _libget_raw(f"GxB_Vector_{method}_Full")(
             vhandle,
             *args,
             vx,
@@ -1140,6 +1184,7 @@ class ss:
             vector._size = size
         else:
             check_status(status, vector)
+            vector._version += 1
         unclaim_buffer(values)
         return vector
 
@@ -1147,6 +1192,30 @@ class ss:
     def head(self, n=10, dtype=None, *, sort=False):
         return head(self._parent, n, dtype, sort=sort)
 
+    def to_values(self, dtype=None, *, sort=False, give_ownership=False):
+        """Like ``vector.to_values()``, but use ``export`` to avoid copying data.
+
+        The Vector is exported as "sparse", so the indices and values are the buffers
+        from SuiteSparse.  If the Vector is iso-valued, the values are a read-only view
+        of the single value.
+
+        If ``give_ownership`` is True, the Vector is left empty and its data is not copied,
+        which is much more memory efficient for large vectors.  Otherwise, the Vector is
+        copied first.
+
+        If sort is True, indices are sorted, otherwise their order is not guaranteed.
+        """
+        if give_ownership:
+            d = self.unpack("sparse", sort=sort)
+        else:
+            d = self.export("sparse", sort=sort)
+        values = d["values"]
+        if dtype is not None:
+            values = values.astype(lookup_dtype(dtype).np_type, copy=False)
+        if d["is_iso"]:
+            values = np.broadcast_to(values[:1], d["indices"].shape)
+        return d["indices"], values
+
     def scan(self, op=monoid.plus, *, name=None):
         """Perform a prefix scan with the given monoid.
 
@@ -0,0 +1,215 @@
+"""Cache compiled user-defined operators on disk so new processes don't compile them again.
+
+This is enabled with ``grblas.config.set(udf_cache=True)``.  Cached files are saved in
+``grblas.config["udf_cache_dir"]``, which defaults to ``~/.cache/grblas/udf``.
+
+Functions are identified by a hash of their bytecode, constants, default arguments,
+closure values, the versions of Python and numba, and the global variables they use
+that are numbers, strings, or functions (which are hashed the same way).  Changes to
+other global objects used by a function, such as arrays, are not detected, so clear
+the cache directory after changing them.
+
+For each function, the wrappers that GraphBLAS calls are written to a small Python
+file in the cache directory, which lets numba cache the compiled wrappers next to it.
+The return types of the function for each input type are saved in a JSON file, so
+types that fail to compile are not tried again.
+"""
+import hashlib
+import json
+import os
+import sys
+from types import CodeType, FunctionType, ModuleType
+
+import numba
+import numpy as np
+
+from . import config
+from .dtypes import lookup_dtype
+
+_TEMPLATES = {
+    "unary": """\
+def wrapper(z, x):
+    z[0] = udf(x[0])
+
+
+def wrapper_bool_input(z, x):
+    z[0] = udf(bool(x[0]))
+
+
+def wrapper_bool_output(z, x):
+    z[0] = bool(udf(x[0]))
+
+
+def wrapper_bool_input_bool_output(z, x):
+    z[0] = bool(udf(bool(x[0])))
+""",
+    "binary": """\
+def wrapper(z, x, y):
+    z[0] = udf(x[0], y[0])
+
+
+def wrapper_bool_input(z, x, y):
+    z[0] = udf(bool(x[0]), bool(y[0]))
+
+
+def wrapper_bool_output(z, x, y):
+    z[0] = bool(udf(x[0], y[0]))
+
+
+def wrapper_bool_input_bool_output(z, x, y):
+    z[0] = bool(udf(bool(x[0]), bool(y[0])))
+""",
+}
+_SIMPLE_TYPES = (bool, int, float, complex, str, bytes, type(None))
+
+
+class CachedUdf:
+    """The cached wrappers and return types of a user-defined function"""
+
+    __slots__ = "name", "module", "return_types", "_types_path"
+
+    def __init__(self, name, module, return_types, types_path):
+        self.name = name
+        self.module = module
+        self.return_types = return_types
+        self._types_path = types_path
+
+    def wrapper(self, bool_input, bool_output):
+        """The Python function to compile with ``numba.cfunc(..., cache=True)``"""
+        name = "wrapper"
+        if bool_input:
+            name += "_bool_input"
+        if bool_output:
+            name += "_bool_output"
+        return getattr(self.module, name)
+
+    def save_return_types(self, return_types):
+        self.return_types = return_types
+        data = {input_type.name: ret_type.name for input_type, ret_type in return_types.items()}
+        try:
+            _write(self._types_path, json.dumps(data))
+        except OSError:  # pragma: no cover
+            pass
+
+
+def get_cache_dir():
+    cache_dir = config.get("udf_cache_dir")
+    if cache_dir is None:
+        cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+            os.path.expanduser("~"), ".cache"
+        )
+        cache_dir = os.path.join(cache_home, "grblas", "udf")
+    return os.fspath(cache_dir)
+
+
+def lookup(kind, func, numba_func):
+    """Get the cache of a UDF of the given kind ("unary" or "binary").
+
+    Returns None if the function can't be cached, such as when it has closure
+    values that can't be identified or the cache directory can't be written.
+    """
+    key = _key(kind, func)
+    if key is None:
+        return None
+    cache_dir = get_cache_dir()
+    name = f"grblas_udf_{kind}_{key}"
+    path = os.path.join(cache_dir, f"{name}.py")
+    source = _TEMPLATES[kind]
+    try:
+        if not os.path.exists(path):
+            os.makedirs(cache_dir, exist_ok=True)
+            _write(path, source)
+    except OSError:
+        return None
+    module = ModuleType(name)
+    module.__file__ = path
+    module.udf = numba_func
+    exec(compile(source, path, "exec"), module.__dict__)
+    # numba imports the module of a function when it loads the function from its cache
+    sys.modules[name] = module
+    types_path = os.path.join(cache_dir, f"{name}.json")
+    try:
+        with open(types_path) as f:
+            return_types = {
+                lookup_dtype(input_type): lookup_dtype(ret_type)
+                for input_type, ret_type in json.load(f).items()
+            }
+    except (OSError, ValueError):
+        return_types = None
+    return CachedUdf(name, module, return_types, types_path)
+
+
+def _write(path, text):
+    # Write atomically in case several processes write the same file
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def _key(kind, func):
+    h = hashlib.sha256()
+    h.update(f"{kind}\0{sys.version}\0{numba.__version__}\0{_TEMPLATES[kind]}".encode())
+    if not _update_function(h, func, set()):
+        return None
+    return h.hexdigest()[:32]
+
+
+def _update_function(h, func, seen):
+    if func in seen:
+        return True
+    seen.add(func)
+    _update_code(h, func.__code__)
+    h.update(repr(func.__defaults__).encode())
+    for cell in func.__closure__ or ():
+        try:
+            value = cell.cell_contents
+        except ValueError:  # pragma: no cover (empty cell)
+            return False
+        if not _update_value(h, value, seen, strict=True):
+            return False
+    func_globals = func.__globals__
+    for name in _global_names(func.__code__):
+        if name in func_globals:
+            h.update(name.encode())
+            _update_value(h, func_globals[name], seen, strict=False)
+    return True
+
+
+def _update_code(h, code):
+    h.update(code.co_code)
+    h.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            _update_code(h, const)
+        else:
+            h.update(repr(const).encode())
+
+
+def _global_names(code):
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            names.update(_global_names(const))
+    return sorted(names)
+
+
+def _update_value(h, value, seen, strict):
+    """Add the identity of ``value`` to the hash; return False if it can't be identified"""
+    if isinstance(value, numba.core.registry.CPUDispatcher):
+        value = value.py_func
+    if (
+        isinstance(value, np.generic)
+        or type(value) in _SIMPLE_TYPES
+        or (type(value) is tuple and all(type(x) in _SIMPLE_TYPES for x in value))
+    ):
+        h.update(repr(value).encode())
+    elif type(value) is FunctionType:
+        return _update_function(h, value, seen)
+    elif type(value) is ModuleType:
+        h.update(value.__name__.encode())
+    elif strict:
+        return False
+    else:
+        h.update(type(value).__qualname__.encode())
+    return True
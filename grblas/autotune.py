@@ -0,0 +1,208 @@
+"""Choose the fastest algorithm for matrix multiplication by timing the candidates."""
+import json
+import os
+from math import inf
+from time import perf_counter
+
+from . import base
+from ._udf_cache import _write
+from .base import _autotuner, _expression_cache, _recorder
+from .matrix import TransposedMatrix
+
+_METHODS = ("gustavson", "hash", "saxpy", "dot")
+_TUNED_METHODS = {"mxm", "mxv", "vxm"}
+
+
+def default_path():
+    """The default file to save decisions to, ``~/.cache/grblas/autotune.json``"""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "grblas", "autotune.json")
+
+
+def _bucket(n):
+    # Round sizes to powers of two so similar problems share decisions
+    return int(n).bit_length()
+
+
+def _describe(arg):
+    if type(arg) is TransposedMatrix:
+        arg = arg._matrix
+    if arg.ndim == 1:
+        shape = _bucket(arg._size)
+    else:
+        shape = f"{_bucket(arg._nrows)}x{_bucket(arg._ncols)}"
+    return f"{arg.ss.format}:{shape}:{_bucket(arg._nvals)}"
+
+
+class Autotuner:
+    """Choose the fastest algorithm (``axb_method``) for matrix multiplication.
+
+    While the autotuner is active, the first time ``mxm``, ``mxv``, or ``vxm`` is
+    computed for a given kind of problem, each method in ``methods`` is timed by
+    computing the result into a copy of the output, and the fastest method is
+    remembered.  The operation--and every later operation of the same kind--is
+    then computed using the remembered method.
+
+    Problems are identified by the semiring, the output dtype, the formats of the
+    output and inputs (from ``ss.format``), their shapes and number of values
+    rounded to powers of two, whether inputs are transposed, the mask type, the
+    accumulator, and ``replace``.
+
+    Decisions are saved to the JSON file ``path`` (see ``default_path``) after
+    each new decision and loaded when the autotuner is created, so later runs
+    don't need to time the methods again.  Use ``path=False`` to not save them.
+
+    Operations that specify ``axb_method`` themselves, such as
+    ``C(axb_method="dot") << A.mxm(B)``, are not tuned.
+
+    The autotuner can use `.start()` and `.stop()` to enable/disable tuning,
+    or it can be used as a context manager:
+
+    >>> with Autotuner() as tuner:
+    ...     for i in range(10):
+    ...         C << A.mxm(B)  # methods are timed the first time
+    >>> tuner.decisions
+    {'mxm;plus_times;INT64;...': 'dot'}
+
+    Currently, only one autotuner will be used at a time within a context.
+    """
+
+    __slots__ = (
+        "decisions",
+        "path",
+        "methods",
+        "repeat",
+        "hits",
+        "misses",
+        "_token",
+        "__weakref__",
+    )
+
+    def __init__(self, path=None, *, methods=_METHODS, repeat=1, start=True):
+        if path is None:
+            path = default_path()
+        self.path = path
+        self.methods = tuple(methods)
+        if not self.methods:
+            raise ValueError("methods must not be empty")
+        self.repeat = repeat
+        self.decisions = {}
+        self.hits = 0
+        self.misses = 0
+        self._token = None
+        if path is not False:
+            self.load()
+        if start:
+            self.start()
+
+    def start(self):
+        base._autotuner_started = True
+        if self._token is None:
+            self._token = _autotuner.set(self)
+
+    def stop(self):
+        if self._token is not None:
+            _autotuner.reset(self._token)
+            self._token = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, type_, value, traceback):
+        self.stop()
+
+    @property
+    def is_tuning(self):
+        return self._token is not None and _autotuner.get(None) is self
+
+    def __repr__(self):
+        return (
+            f'grblas.Autotuner ({"" if self.is_tuning else "not "}tuning, '
+            f"{len(self.decisions)} decisions, {self.hits} hits, {self.misses} misses)"
+        )
+
+    def load(self):
+        """Load decisions saved to ``path``, replacing decisions with the same keys"""
+        try:
+            with open(self.path) as f:
+                decisions = json.load(f)["decisions"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+        self.decisions.update(decisions)
+
+    def save(self):
+        """Save decisions to ``path``"""
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        _write(self.path, json.dumps({"decisions": self.decisions}, indent=1, sort_keys=True))
+
+    def clear(self):
+        """Forget all decisions; the file at ``path`` is not changed until the next decision"""
+        self.decisions.clear()
+
+    def _key(self, output, expr, mask, accum, replace):
+        if mask is None:
+            mask_key = "none"
+        else:
+            mask_key = (
+                f'{"~" if mask.complement else ""}{"S" if mask.structure else "V"}'
+                f":{_describe(mask.mask)}"
+            )
+        return ";".join(
+            [
+                expr.method_name,
+                expr.op.name,
+                output.dtype.name,
+                _describe(output),
+                *(_describe(arg) for arg in expr.args),
+                f"T{int(expr.at)}{int(expr.bt)}",
+                mask_key,
+                "none" if accum is None else accum.name,
+                f"R{int(replace)}",
+            ]
+        )
+
+    def _tune(self, output, expr, mask, accum, replace, extensions):
+        """Return the descriptor extensions to compute ``expr`` into ``output`` with"""
+        if expr.method_name not in _TUNED_METHODS or "axb_method" in extensions:
+            return extensions
+        key = self._key(output, expr, mask, accum, replace)
+        method = self.decisions.get(key)
+        if method is None:
+            self.misses += 1
+            method = self._time(output, expr, mask, accum, replace, extensions)
+            self.decisions[key] = method
+            if self.path is not False:
+                try:
+                    self.save()
+                except OSError:  # pragma: no cover
+                    pass
+        else:
+            self.hits += 1
+        return dict(extensions, axb_method=method)
+
+    def _time(self, output, expr, mask, accum, replace, extensions):
+        for arg in expr.args:
+            if type(arg) is TransposedMatrix:
+                arg = arg._matrix
+            arg.wait()
+        # Don't tune, cache, or record the trial computations
+        tokens = [(var, var.set(None)) for var in [_autotuner, _expression_cache, _recorder]]
+        try:
+            best_method = None
+            best_time = inf
+            for method in self.methods:
+                for _ in range(self.repeat):
+                    temp = output.dup(name="autotune_temp")
+                    temp.wait()
+                    start = perf_counter()
+                    temp._update(expr, mask, accum, replace, axb_method=method, **extensions)
+                    temp.wait()
+                    elapsed = perf_counter() - start
+                    if elapsed < best_time:
+                        best_method = method
+                        best_time = elapsed
+        finally:
+            for var, token in reversed(tokens):
+                var.reset(token)
+        return best_method
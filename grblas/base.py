@@ -1,7 +1,9 @@
 from contextvars import ContextVar
+from time import perf_counter_ns
 
 from . import config, ffi
 from . import replace as replace_singleton
+from .descriptor import _normalize_extensions
 from .descriptor import lookup as descriptor_lookup
 from .dtypes import lookup_dtype
 from .exceptions import check_status
@@ -14,9 +16,28 @@ NULL = ffi.NULL
 CData = ffi.CData
 _recorder = ContextVar("recorder")
 _prev_recorder = None
+# C function name: [number of calls, nanoseconds spent in C]; None if disabled (see `metrics.py`)
+_call_metrics = {}
+_profiler = ContextVar("profiler")
+# Set by `Profiler.start`.  Until then, there is no need to look for an active profiler.
+_profiler_started = False
+# Set by `Recorder.start`.  Until then, there is no need to look for an active recorder.
+_recorder_started = False
+# Set when an expression is captured as an argument of another expression (see `_lazy.py`)
+_lazy_captured = False
+_expression_cache = ContextVar("expression_cache")
+# Set by `ExpressionCache.start`.  Until then, there is no need to look for an active cache.
+_expression_cache_started = False
+_autotuner = ContextVar("autotuner")
+# Set by `Autotuner.start`.  Until then, there is no need to look for an active autotuner.
+_autotuner_started = False
+# Cache of resolved C functions by name, because `libget` may need two attribute lookups
+_cfuncs = {}
 
 
 def record_raw(text):
+    if not _recorder_started:
+        return
     rec = _recorder.get(_prev_recorder)
     if rec is not None:
         rec.record_raw(text)
@@ -24,7 +45,16 @@ def record_raw(text):
 
 def call(cfunc_name, args):
     call_args = [getattr(x, "_carg", x) if x is not None else NULL for x in args]
-    cfunc = libget(cfunc_name)
+    try:
+        cfunc = _cfuncs[cfunc_name]
+    except KeyError:
+        cfunc = _cfuncs[cfunc_name] = libget(cfunc_name)
+    profiler = _profiler.get(None) if _profiler_started else None
+    if profiler is not None:
+        profile_state = profiler._before(args)
+    call_metrics = _call_metrics
+    if call_metrics is not None:
+        start = perf_counter_ns()
     try:
         err_code = cfunc(*call_args)
     except TypeError as exc:
@@ -42,6 +72,19 @@ def call(cfunc_name, args):
             f" - C signature: {sig}\n"
             f" - Error: {exc}"
         ) from None
+    if call_metrics is not None:
+        elapsed = perf_counter_ns() - start
+        try:
+            counts = call_metrics[cfunc_name]
+        except KeyError:
+            counts = call_metrics[cfunc_name] = [0, 0]
+        counts[0] += 1
+        counts[1] += elapsed
+    if profiler is not None:
+        profiler._after(cfunc.__name__, args, profile_state)
+    if not _recorder_started:
+        # Fast path: no recorder has ever been started, so there is nothing to record
+        return check_status(err_code, args)
     try:
         rv = check_status(err_code, args)
     except Exception as exc:
@@ -56,6 +99,27 @@ def call(cfunc_name, args):
     return rv
 
 
+def _is_lazy_arg(x, within, argname):
+    """Whether expression ``x`` may be used as an argument of a delayed method without computing"""
+    global _lazy_captured
+    if argname == "other" and isinstance(x, BaseExpression) and config.get("lazy"):
+        from ._lazy import _DELAYED_OTHER
+
+        if within in _DELAYED_OTHER:
+            _lazy_captured = True
+            return True
+    return False
+
+
+def _lazy_args(expr, mask):
+    """Rewrite ``expr`` and compute its arguments that are expressions (see `_lazy.py`)"""
+    if any(isinstance(arg, BaseExpression) for arg in expr.args):
+        from ._lazy import compute_args
+
+        return compute_args(expr, mask)
+    return expr
+
+
 def _expect_type_message(
     self, x, types, *, within, argname=None, keyword_name=None, op=None, extra_message=""
 ):
@@ -63,7 +127,9 @@ def _expect_type_message(
         if type(x) in types:
             return x, None
         elif output_type(x) in types:
-            if config.get("autocompute"):
+            if _is_lazy_arg(x, within, argname):
+                return x, None
+            if config.get("autocompute") or config.get("lazy"):
                 return x._get_value(), None
             extra_message = f"{extra_message}\n\n" if extra_message else ""
             extra_message += (
@@ -73,7 +139,9 @@ def _expect_type_message(
     elif type(x) is types:
         return x, None
     elif output_type(x) is types:
-        if config.get("autocompute"):
+        if _is_lazy_arg(x, within, argname):
+            return x, None
+        if config.get("autocompute") or config.get("lazy"):
             return x._get_value(), None
         extra_message = f"{extra_message}\n\n" if extra_message else ""
         extra_message += (
@@ -182,7 +250,7 @@ def _check_mask(mask, output=None):
 
 
 class BaseType:
-    __slots__ = "gb_obj", "dtype", "name", "__weakref__"
+    __slots__ = "gb_obj", "dtype", "name", "_version", "__weakref__"
     # Flag for operations which depend on scalar vs vector/matrix
     _is_scalar = False
 
@@ -192,9 +260,17 @@ class BaseType:
         self.gb_obj = gb_obj
         self.dtype = lookup_dtype(dtype)
         self.name = name
+        # Incremented whenever the object may have been modified; used by `ExpressionCache`
+        self._version = 0
 
     def __call__(
-        self, *optional_mask_accum_replace, mask=None, accum=None, replace=False, input_mask=None
+        self,
+        *optional_mask_accum_replace,
+        mask=None,
+        accum=None,
+        replace=False,
+        input_mask=None,
+        **extensions,
     ):
         # Pick out mask and accum from positional arguments
         mask_arg = None
@@ -252,7 +328,12 @@ class BaseType:
                 accum = accum.binaryop
             else:
                 self._expect_op(accum, "BinaryOp", within="__call__", keyword_name="accum")
-        return Updater(self, mask=mask, accum=accum, replace=replace, input_mask=input_mask)
+        if extensions:
+            # SuiteSparse descriptor extensions such as `nthreads` and `axb_method`
+            extensions = dict(_normalize_extensions(extensions))
+        return Updater(
+            self, mask=mask, accum=accum, replace=replace, input_mask=input_mask, **extensions
+        )
 
     def __or__(self, other):
         if self._is_scalar:
@@ -317,7 +398,8 @@ class BaseType:
         """
         return self._update(expr)
 
-    def _update(self, expr, mask=None, accum=None, replace=False, input_mask=None):
+    def _update(self, expr, mask=None, accum=None, replace=False, input_mask=None, **extensions):
+        self._version += 1
         if not isinstance(expr, BaseExpression):
             if isinstance(expr, AmbiguousAssignOrExtract):
                 if expr._is_scalar and self._is_scalar:
@@ -354,7 +436,9 @@ class BaseType:
                 # Two choices here: apply identity `expr = expr.apply(identity)`, or assign.
                 # Choose assign for now, since it works better for iso-valued objects.
                 # Perhaps we should benchmark to see which is faster and has less Python overhead.
-                self(mask=mask, accum=accum, replace=replace, input_mask=input_mask)[...] = expr
+                self(mask=mask, accum=accum, replace=replace, input_mask=input_mask, **extensions)[
+                    ...
+                ] = expr
                 return
             elif self._is_scalar:
                 from .infix import InfixExprBase
@@ -403,7 +487,13 @@ class BaseType:
                                 f"{type(self).__name__}, {type(self).__name__}Expression, "
                                 "AmbiguousAssignOrExtract, and scalars."
                             ) from None
-                    updater = self(mask=mask, accum=accum, replace=replace, input_mask=input_mask)
+                    updater = self(
+                        mask=mask,
+                        accum=accum,
+                        replace=replace,
+                        input_mask=input_mask,
+                        **extensions,
+                    )
                     if type(self) is Matrix:
                         if mask is None:
                             raise TypeError(
@@ -421,7 +511,7 @@ class BaseType:
 
         if type(self) is not expr.output_type:
             if expr.output_type._is_scalar and config.get("autocompute"):
-                self._update(expr._get_value(), mask, accum, replace, input_mask)
+                self._update(expr._get_value(), mask, accum, replace, input_mask, **extensions)
                 return
             from .scalar import Scalar
 
@@ -431,8 +521,14 @@ class BaseType:
 
         if input_mask is not None:
             raise TypeError("`input_mask` argument may only be used for extract")
+        if _lazy_captured:
+            expr = _lazy_args(expr, mask)
+        if _expression_cache_started and mask is None and accum is None and not self._is_scalar:
+            cache = _expression_cache.get(None)
+            if cache is not None and cache._update(self, expr):
+                return
         if expr.op is not None and expr.op.opclass == "Aggregator":
-            updater = self(mask=mask, accum=accum, replace=replace)
+            updater = self(mask=mask, accum=accum, replace=replace, **extensions)
             expr.op._new(updater, expr)
             return
 
@@ -445,6 +541,11 @@ class BaseType:
             complement = mask.complement
             structure = mask.structure
 
+        if _autotuner_started:
+            tuner = _autotuner.get(None)
+            if tuner is not None:
+                extensions = tuner._tune(self, expr, mask, accum, replace, extensions)
+
         # Get descriptor based on flags
         desc = descriptor_lookup(
             transpose_first=expr.at,
@@ -452,6 +553,7 @@ class BaseType:
             mask_complement=complement,
             mask_structure=structure,
             output_replace=replace,
+            **extensions,
         )
         if self._is_scalar:
             scalar_as_vector = expr.method_name == "inner"
@@ -579,8 +681,13 @@ class BaseExpression:
             return rv
         output = self.construct_output(dtype, name=name, **kwargs)
         if self.op is not None and self.op.opclass == "Aggregator":
+            expr = _lazy_args(self, mask) if _lazy_captured else self
+            if _expression_cache_started and mask is None and not output._is_scalar:
+                cache = _expression_cache.get(None)
+                if cache is not None and cache._update(output, expr):
+                    return output
             updater = output(mask=mask)
-            self.op._new(updater, self)
+            self.op._new(updater, expr)
         elif mask is None:
             output.update(self)
         else:
@@ -0,0 +1,172 @@
+import collections
+import weakref
+
+from . import base
+from .base import _expression_cache
+from .matrix import Matrix, TransposedMatrix
+from .scalar import Scalar
+from .vector import Vector
+
+
+class ExpressionCache:
+    """Cache the results of expressions so identical expressions are computed only once.
+
+    The cache can use `.start()` and `.stop()` to enable/disable caching,
+    or it can be used as a context manager.
+
+    For example,
+
+    >>> with ExpressionCache() as cache:
+    ...     for i in range(10):
+    ...         d_out = A.reduce_rowwise(agg.count).new()  # computed once
+    ...         AT = A.T.new()  # computed once
+    >>> cache.hits
+    18
+
+    Expressions are identified by their operation, the output dtype, and their arguments.
+    Matrix, Vector, and Scalar arguments are identified by their identity and version,
+    which is incremented whenever they are modified, so results are never stale.
+    Literal scalars are identified by their values.
+
+    Only expressions computed without a mask or accumulator are cached (such as
+    ``C << A.mxm(B)`` or ``A.mxm(B).new()``), and expressions that output Scalars or
+    that assign into the output are never cached.  On a cache hit, the cached result
+    is copied into the output, so cached results are never shared with the user.
+
+    Cached results are evicted in least-recently-used order to keep the total memory
+    used by cached results (as measured by ``ss.nbytes``) at most ``max_nbytes``.
+
+    Currently, only one cache will be used at a time within a context.
+    """
+
+    __slots__ = (
+        "_data",
+        "_token",
+        "max_nbytes",
+        "nbytes",
+        "hits",
+        "misses",
+        "__weakref__",
+    )
+
+    def __init__(self, *, start=True, max_nbytes=2**30):
+        self._data = collections.OrderedDict()
+        self._token = None
+        self.max_nbytes = max_nbytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        if start:
+            self.start()
+
+    def start(self):
+        base._expression_cache_started = True
+        if self._token is None:
+            self._token = _expression_cache.set(self)
+
+    def stop(self):
+        if self._token is not None:
+            _expression_cache.reset(self._token)
+            self._token = None
+
+    def clear(self):
+        self._data.clear()
+        self.nbytes = 0
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, type_, value, traceback):
+        self.stop()
+
+    def __len__(self):
+        return len(self._data)
+
+    @property
+    def is_caching(self):
+        return self._token is not None and _expression_cache.get(None) is self
+
+    def __repr__(self):
+        return (
+            f'grblas.ExpressionCache ({"" if self.is_caching else "not "}caching, '
+            f"{len(self._data)} results, {self.nbytes} bytes, "
+            f"{self.hits} hits, {self.misses} misses)"
+        )
+
+    def _key(self, output, expr):
+        """Key of the result of computing ``expr`` into ``output``, or None if not cacheable"""
+        if "assign" in expr.cfunc_name or expr.output_type._is_scalar:
+            return None
+        keys = []
+        refs = []
+        for arg in expr.args:
+            if type(arg) is TransposedMatrix:
+                arg = arg._matrix
+            if arg is output:
+                return None
+            typ = type(arg)
+            if typ is Scalar and arg._is_cscalar:
+                value = arg.value
+                try:
+                    hash(value)
+                except TypeError:
+                    return None
+                keys.append((arg.dtype, value))
+            elif typ is Matrix or typ is Vector or typ is Scalar:
+                keys.append((id(arg), arg._version))
+                refs.append(weakref.ref(arg))
+            else:
+                return None
+        return (
+            (
+                expr.cfunc_name,
+                expr.method_name,
+                expr.op,
+                expr.at,
+                expr.bt,
+                output.dtype,
+                output.shape,
+                *keys,
+            ),
+            refs,
+        )
+
+    def _update(self, output, expr):
+        """Compute ``expr`` into ``output`` using the cache.
+
+        Returns False if ``expr`` can't be cached, in which case nothing is done.
+        """
+        key = self._key(output, expr)
+        if key is None:
+            return False
+        key, refs = key
+        data = self._data
+        if key in data:
+            cached_refs, result, nbytes = data[key]
+            # Arguments that have been deleted may have had their ids reused
+            if all(ref() is not None for ref in cached_refs):
+                data.move_to_end(key)
+                self.hits += 1
+                output[...] = result
+                return True
+            self._evict(key)
+        self.misses += 1
+        # Don't use the cache while computing, such as for the parts of aggregations
+        token = _expression_cache.set(None)
+        try:
+            output._update(expr)
+        finally:
+            _expression_cache.reset(token)
+        result = output.dup(name=f"{output.name}_cached")
+        nbytes = result.ss.nbytes
+        if nbytes <= self.max_nbytes:
+            data[key] = (refs, result, nbytes)
+            self.nbytes += nbytes
+            while self.nbytes > self.max_nbytes:
+                self._evict(next(iter(data)))
+        return True
+
+    def _evict(self, key):
+        refs, result, nbytes = self._data.pop(key)
+        self.nbytes -= nbytes
@@ -0,0 +1,103 @@
+"""Evaluate independent grblas expressions concurrently on a pool of threads."""
+from concurrent.futures import ThreadPoolExecutor
+
+from ._ss.config import config as ss_config
+from .base import BaseExpression, BaseType
+from .expr import AmbiguousAssignOrExtract, InfixExprBase
+from .matrix import TransposedMatrix
+
+
+def _get_inputs(expr):
+    if isinstance(expr, BaseExpression):
+        args = expr.args
+    elif isinstance(expr, InfixExprBase):
+        args = (expr.left, expr.right)
+    elif isinstance(expr, AmbiguousAssignOrExtract):
+        args = (expr.parent,)
+    else:
+        raise TypeError(
+            f"Expected an expression such as `A.mxm(B)` or `A[0, :]`; got: {type(expr)}"
+        )
+    for arg in args:
+        if type(arg) is TransposedMatrix:
+            arg = arg._matrix
+        if isinstance(arg, BaseType):
+            yield arg
+
+
+def _wait_inputs(exprs, masks=()):
+    inputs = {}
+    for expr in exprs:
+        for arg in _get_inputs(expr):
+            inputs[id(arg)] = arg
+    for mask in masks:
+        if mask is not None:
+            inputs[id(mask.mask)] = mask.mask
+    for arg in inputs.values():
+        arg.wait()
+
+
+class Executor:
+    """Evaluate independent expressions concurrently on a pool of threads.
+
+    SuiteSparse:GraphBLAS releases the GIL while it computes, so independent
+    expressions such as ``A.mxv(v)`` for different ``v`` can run in parallel.
+    The inputs of each expression are completed with ``wait()`` before it is
+    submitted, which makes them safe to share between threads.  Expressions
+    must not depend on the results of other expressions that are still running.
+
+    GraphBLAS also uses threads within each operation.  Use ``nthreads`` to set
+    the maximum number of threads each operation may use, such as ``nthreads=1``
+    to parallelize only across operations.  This sets the global ``GxB_NTHREADS``
+    option (see ``grblas.ss.config``), so it affects all operations until the
+    executor is shut down, when the previous value is restored.
+
+    Parameters
+    ----------
+    max_workers : int, optional
+        Number of threads to evaluate expressions with.
+        The default is the same as ``concurrent.futures.ThreadPoolExecutor``.
+    nthreads : int, optional
+        Maximum number of threads for GraphBLAS to use in each operation.
+
+    Examples
+    --------
+    >>> with Executor(4, nthreads=1) as executor:
+    ...     results = executor.compute([A.mxv(v) for v in vectors])
+
+    """
+
+    def __init__(self, max_workers=None, *, nthreads=None):
+        self._pool = ThreadPoolExecutor(max_workers, thread_name_prefix="grblas")
+        self.nthreads = nthreads
+        self._set_options = None
+        if nthreads is not None:
+            self._set_options = ss_config(nthreads=nthreads)
+
+    def submit(self, expr, dtype=None, *, mask=None, name=None):
+        """Evaluate ``expr.new(dtype, mask=mask, name=name)`` in a thread.
+
+        Returns a ``concurrent.futures.Future`` of the result.
+        """
+        _wait_inputs([expr], [mask])
+        return self._pool.submit(expr.new, dtype, mask=mask, name=name)
+
+    def compute(self, exprs):
+        """Evaluate expressions concurrently and return a list of the results."""
+        exprs = list(exprs)
+        _wait_inputs(exprs)
+        futures = [self._pool.submit(expr.new) for expr in exprs]
+        return [future.result() for future in futures]
+
+    def shutdown(self, wait=True):
+        """Free the threads and restore the previous ``GxB_NTHREADS`` global option."""
+        self._pool.shutdown(wait=wait)
+        if self._set_options is not None:
+            self._set_options.__exit__(None, None, None)
+            self._set_options = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
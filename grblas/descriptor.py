@@ -1,3 +1,5 @@
+from suitesparse_graphblas import vararg
+
 from . import ffi, lib
 from .exceptions import check_status_carg
 
@@ -14,6 +16,7 @@ class Descriptor:
         mask_structure=False,
         transpose_first=False,
         transpose_second=False,
+        **extensions,
     ):
         self.gb_obj = gb_obj
         self.name = name
@@ -22,6 +25,8 @@ class Descriptor:
         self.mask_structure = mask_structure
         self.transpose_first = transpose_first
         self.transpose_second = transpose_second
+        # SuiteSparse extensions such as ``nthreads``; see `lookup`
+        self.extensions = extensions
 
     @property
     def _carg(self):
@@ -67,14 +72,111 @@ _desc_names[(False, False, False, False, False)] = "NULL"
 _desc_map[(False, False, False, False, False)] = None
 
 
+def _axb_method_to_c(value):
+    try:
+        return _AXB_METHODS[value]
+    except KeyError:
+        raise ValueError(
+            f"axb_method must be one of {list(_AXB_METHODS)}; got: {value!r}"
+        ) from None
+
+
+def _nthreads_to_c(value):
+    value = int(value)
+    if value < 0:
+        raise ValueError(f"nthreads must be non-negative; got: {value}")
+    return value
+
+
+_AXB_METHODS = {
+    "default": lib.GxB_DEFAULT,
+    "gustavson": lib.GxB_AxB_GUSTAVSON,
+    "hash": lib.GxB_AxB_HASH,
+    "saxpy": lib.GxB_AxB_SAXPY,
+    "dot": lib.GxB_AxB_DOT,
+}
+# SuiteSparse descriptor extensions.  name: (field, C type, to C)
+_EXTENSIONS = {
+    "axb_method": (lib.GxB_AxB_METHOD, "int", _axb_method_to_c),
+    "nthreads": (lib.GxB_NTHREADS, "int", _nthreads_to_c),
+    "chunk": (lib.GxB_CHUNK, "double", float),
+    "sort": (lib.GxB_SORT, "int", bool),
+}
+
+
+def _normalize_extensions(extensions):
+    """Validate descriptor extensions and return them as a sorted tuple of items.
+
+    Extensions with None values are ignored.
+    """
+    rv = []
+    for name, value in extensions.items():
+        if name not in _EXTENSIONS:
+            raise TypeError(
+                f"Unknown descriptor option: {name!r}.  Valid options are: {list(_EXTENSIONS)}"
+            )
+        if value is not None:
+            if name == "axb_method":
+                _axb_method_to_c(value)
+            rv.append((name, value))
+    rv.sort()
+    return tuple(rv)
+
+
+def _new_descriptor(key, extensions=()):
+    output_replace, mask_complement, mask_structure, transpose_first, transpose_second = key
+    if not any(key) and not extensions:  # pragma: no cover
+        # Default descriptor stays a NULL pointer
+        return None
+    desc = ffi.new("GrB_Descriptor*")
+    lib.GrB_Descriptor_new(desc)
+    for cond, field, val in [
+        (output_replace, lib.GrB_OUTP, lib.GrB_REPLACE),
+        (mask_complement, lib.GrB_MASK, lib.GrB_COMP),
+        (mask_structure, lib.GrB_MASK, lib.GrB_STRUCTURE),
+        (transpose_first, lib.GrB_INP0, lib.GrB_TRAN),
+        (transpose_second, lib.GrB_INP1, lib.GrB_TRAN),
+    ]:
+        if cond:
+            check_status_carg(lib.GrB_Descriptor_set(desc[0], field, val), "Descriptor", desc[0])
+    for name, value in extensions:
+        field, ctype, to_c = _EXTENSIONS[name]
+        check_status_carg(
+            lib.GxB_Desc_set(desc[0], field, vararg(ffi.cast(ctype, to_c(value)))),
+            "Descriptor",
+            desc[0],
+        )
+    if extensions:
+        base_name = _desc_names.get(key, "GrB_DESC")
+        base_name = "GrB_DESC" if base_name == "NULL" else base_name
+        name = base_name + "".join(f"_{ext}_{value}" for ext, value in extensions)
+    else:  # pragma: no cover
+        name = "custom_descriptor"
+    return Descriptor(desc[0], name, *key, **dict(extensions))
+
+
 def lookup(
     *,
     output_replace=False,
     mask_complement=False,
     mask_structure=False,
     transpose_first=False,
-    transpose_second=False
+    transpose_second=False,
+    **extensions,
 ):
+    """Get a cached descriptor with the given flags.
+
+    SuiteSparse:GraphBLAS descriptor extensions may also be given:
+
+    - ``axb_method``: algorithm for matrix multiply; one of "default",
+      "gustavson", "hash", "saxpy", or "dot"
+    - ``nthreads``: maximum number of threads to use (0 uses the global setting)
+    - ``chunk``: amount of work a thread should do, used to reduce ``nthreads``
+      for small problems
+    - ``sort``: whether to sort the result instead of leaving it jumbled
+
+    Descriptors with extensions are created the first time they are needed.
+    """
     key = (
         output_replace,
         mask_complement,
@@ -82,27 +184,15 @@ def lookup(
         transpose_first,
         transpose_second,
     )
+    if extensions:
+        extensions = _normalize_extensions(extensions)
+        if extensions:
+            key += extensions
+            if key not in _desc_map:
+                _desc_map[key] = _new_descriptor(key[:5], extensions)
+            return _desc_map[key]
     if key not in _desc_map:  # pragma: no cover
         # We currently don't need this block of code!
         # All 32 possible descriptors are currently already added to _desc_map.
-        # Nevertheless, this code may be useful some day, because we will want
-        # to expose extension descriptors.
-        desc = ffi.new("GrB_Descriptor*")
-        if not any(key):
-            # Default descriptor stays a NULL pointer
-            desc[0] = NULL
-        else:
-            lib.GrB_Descriptor_new(desc)
-            for cond, field, val in [
-                (output_replace, lib.GrB_OUTP, lib.GrB_REPLACE),
-                (mask_complement, lib.GrB_MASK, lib.GrB_COMP),
-                (mask_structure, lib.GrB_MASK, lib.GrB_STRUCTURE),
-                (transpose_first, lib.GrB_INP0, lib.GrB_TRAN),
-                (transpose_second, lib.GrB_INP1, lib.GrB_TRAN),
-            ]:
-                if cond:
-                    check_status_carg(
-                        lib.GrB_Descriptor_set(desc[0], field, val), "Descriptor", desc[0]
-                    )
-        _desc_map[key] = Descriptor(desc[0], "custom_descriptor", *key)
+        _desc_map[key] = _new_descriptor(key)
     return _desc_map[key]
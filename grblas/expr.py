@@ -406,6 +406,7 @@ class Updater:
 
     def _setitem(self, resolved_indexes, obj, *, is_submask):
         # Occurs when user calls C(params)[index] = expr
+        self.parent._version += 1
         if resolved_indexes.is_single_element and not self.kwargs:
             # Fast path using assignElement
             self.parent._assign_element(resolved_indexes, obj)
@@ -428,6 +429,7 @@ class Updater:
             raise TypeError("Indexing not supported for Scalars")
         resolved_indexes = IndexerResolver(self.parent, keys)
         if resolved_indexes.is_single_element:
+            self.parent._version += 1
             self.parent._delete_element(resolved_indexes)
         else:
             # Delete selection by assigning an empty scalar
@@ -1,11 +1,10 @@
-from . import _automethods, binary, utils
+from . import _automethods, binary, semiring, utils
 from .base import _expect_op, _expect_type
 from .dtypes import BOOL
 from .expr import InfixExprBase
 from .matrix import Matrix, MatrixExpression, TransposedMatrix
 from .monoid import land, lor
 from .scalar import Scalar, ScalarExpression
-from .semiring import any_pair
 from .utils import output_type, wrapdoc
 from .vector import Vector, VectorExpression
 
@@ -81,6 +80,7 @@ class VectorInfixExpr(InfixExprBase):
     ewise_mult = wrapdoc(Vector.ewise_mult)(property(_automethods.ewise_mult))
     ewise_union = wrapdoc(Vector.ewise_union)(property(_automethods.ewise_union))
     gb_obj = wrapdoc(Vector.gb_obj)(property(_automethods.gb_obj))
+    groupby = wrapdoc(Vector.groupby)(property(_automethods.groupby))
     inner = wrapdoc(Vector.inner)(property(_automethods.inner))
     isclose = wrapdoc(Vector.isclose)(property(_automethods.isclose))
     isequal = wrapdoc(Vector.isequal)(property(_automethods.isequal))
@@ -194,6 +194,8 @@ class MatrixInfixExpr(InfixExprBase):
     ewise_mult = wrapdoc(Matrix.ewise_mult)(property(_automethods.ewise_mult))
     ewise_union = wrapdoc(Matrix.ewise_union)(property(_automethods.ewise_union))
     gb_obj = wrapdoc(Matrix.gb_obj)(property(_automethods.gb_obj))
+    groupby_columns = wrapdoc(Matrix.groupby_columns)(property(_automethods.groupby_columns))
+    groupby_rows = wrapdoc(Matrix.groupby_rows)(property(_automethods.groupby_rows))
     isclose = wrapdoc(Matrix.isclose)(property(_automethods.isclose))
     isequal = wrapdoc(Matrix.isequal)(property(_automethods.isequal))
     kronecker = wrapdoc(Matrix.kronecker)(property(_automethods.kronecker))
@@ -401,7 +403,7 @@ def _matmul_infix_expr(left, right, *, within):
         )
 
     # Create dummy expression to check compatibility of dimensions, etc.
-    expr = getattr(left, method)(right, any_pair[bool])
+    expr = getattr(left, method)(right, semiring.any_pair[bool])
     if expr.output_type is Vector:
         return VectorMatMulExpr(left, right, method_name=method, size=expr._size)
     elif expr.output_type is Matrix:
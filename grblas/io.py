@@ -1,5 +1,14 @@
+import ast
+import math
+import os
+from io import TextIOBase
+
+import numba
+import numpy as np
+from numba import njit
+
 from . import Matrix, Vector, backend
-from .dtypes import lookup_dtype
+from .dtypes import lookup_dtype, register_anonymous
 from .exceptions import GrblasException
 from .matrix import TransposedMatrix
 from .utils import output_type
@@ -149,15 +158,222 @@ def to_scipy_sparse_matrix(m, format="csr"):
     return rv.asformat(format)
 
 
-def mmread(source, *, dup_op=None, name=None):
+def mmread(source, *, dup_op=None, name=None, engine="native"):
     """Read the contents of a Matrix Market filename or file into a new Matrix.
 
-    This uses `scipy.io.mmread`:
+    By default, the file is read in blocks, and each block is parsed in parallel by
+    numba, so the entries are never converted to Python objects or to a scipy matrix.
+    Files ending in ".gz" or ".bz2" are decompressed while reading.  Symmetric,
+    skew-symmetric, and hermitian matrices are expanded to include both triangles.
+    Pattern matrices are read as iso-valued matrices of 1.0, and duplicate entries
+    in pattern matrices are ignored unless ``dup_op`` is given.
+
+    Use ``engine="scipy"`` to read the file with `scipy.io.mmread` instead:
     https://docs.scipy.org/doc/scipy/reference/generated/scipy.io.mmread.html
 
     For more information on the Matrix Market format, see:
     https://math.nist.gov/MatrixMarket/formats.html
     """
+    if engine == "scipy":
+        return _mmread_scipy(source, dup_op=dup_op, name=name)
+    if engine != "native":
+        raise ValueError(f'engine must be "native" or "scipy"; got: {engine!r}')
+    if isinstance(source, (str, os.PathLike)):
+        with _mm_open(source, "rb") as f:
+            return mmread(f, dup_op=dup_op, name=name)
+    fmt, field, symmetry, shape = _mm_read_header(source)
+    if field == "integer" or field == "unsigned-integer":
+        nint, nfloat = 1, 0
+    elif field == "real":
+        nint, nfloat = 0, 1
+    elif field == "complex":
+        nint, nfloat = 0, 2
+    else:
+        nint, nfloat = 0, 0
+    if fmt == "coordinate":
+        nint += 2
+    ints, floats = _mm_read_entries(source, nint, nfloat, unsigned=field == "unsigned-integer")
+    if field == "integer":
+        values = ints[:, -1]
+    elif field == "unsigned-integer":
+        # Parsed as the bits of uint64
+        values = ints[:, -1].view(np.uint64)
+    elif field == "real":
+        values = floats[:, 0]
+    elif field == "complex":
+        values = floats[:, 0] + 1j * floats[:, 1]
+    else:
+        values = None
+    if fmt == "coordinate":
+        nrows, ncols, nnz = shape
+        if ints.shape[0] != nnz:
+            raise ValueError(
+                f"Matrix Market file has {ints.shape[0]} entries; expected {nnz} entries"
+            )
+        rows = ints[:, 0] - 1
+        cols = ints[:, 1] - 1
+        if symmetry != "general":
+            offdiag = rows != cols
+            rows, cols = (
+                np.concatenate([rows, cols[offdiag]]),
+                np.concatenate([cols, rows[offdiag]]),
+            )
+            if values is not None:
+                values = np.concatenate([values, _mm_mirror(values[offdiag], symmetry)])
+        if values is None:
+            # Pattern matrices are iso
+            values = 1.0 if dup_op is None else np.ones(rows.size)
+        return Matrix.from_values(
+            rows, cols, values, nrows=nrows, ncols=ncols, dup_op=dup_op, name=name
+        )
+    nrows, ncols = shape
+    if symmetry == "general":
+        if values.size != nrows * ncols:
+            raise ValueError(
+                f"Matrix Market file has {values.size} entries; expected {nrows * ncols} entries"
+            )
+        values = np.ascontiguousarray(values).reshape(ncols, nrows).T
+        # SS, SuiteSparse-specific: import_full
+        return Matrix.ss.import_fullc(values=values, name=name)
+    # Only the lower triangle is stored in column-major order
+    cols, rows = np.triu_indices(nrows, 1 if symmetry == "skew-symmetric" else 0)
+    if values.size != rows.size:
+        raise ValueError(
+            f"Matrix Market file has {values.size} entries; expected {rows.size} entries"
+        )
+    array = np.zeros((nrows, ncols), dtype=values.dtype)
+    array[cols, rows] = _mm_mirror(values, symmetry)
+    array[rows, cols] = values
+    # SS, SuiteSparse-specific: import_full
+    return Matrix.ss.import_fullr(values=array, take_ownership=True, name=name)
+
+
+def mmwrite(
+    target, matrix, *, comment="", field=None, precision=None, symmetry=None, engine="native"
+):
+    """Write matrix to Matrix Market file `target`.
+
+    By default, the entries are streamed from the Matrix in chunks (see
+    ``Matrix.ss.iter_chunks``), so they are not all copied at once.  Files ending in
+    ".gz" or ".bz2" are compressed while writing.  The parameters are the same as
+    for `scipy.io.mmwrite`, which may be used instead with ``engine="scipy"``:
+    https://docs.scipy.org/doc/scipy/reference/generated/scipy.io.mmwrite.html
+
+    Parameters
+    ----------
+    target : str, path-like, or file-like object
+    matrix : Matrix
+    comment : str, optional
+        Comments to write at the beginning of the file
+    field : {"real", "complex", "pattern", "integer", "unsigned-integer"}, optional
+        The default is determined from the dtype of the Matrix.  Unsigned integers
+        are written as "unsigned-integer", as `scipy.io.mmwrite` does.
+    precision : int, optional
+        Number of significant digits to write for real and complex values, as in
+        `scipy.io.mmwrite`.  The default writes the shortest representation that
+        exactly round-trips.
+    symmetry : {"general", "symmetric", "skew-symmetric", "hermitian"}, optional
+        If not given, this is determined by comparing the Matrix to its transpose,
+        which makes up to two temporary copies of the Matrix for the Hermitian and
+        skew-symmetric checks.  Only the lower triangle is written for symmetric
+        matrices.
+    engine : {"native", "scipy"}, default "native"
+    """
+    if engine == "scipy":
+        return _mmwrite_scipy(
+            target, matrix, comment=comment, field=field, precision=precision, symmetry=symmetry
+        )
+    if engine != "native":
+        raise ValueError(f'engine must be "native" or "scipy"; got: {engine!r}')
+    if isinstance(target, (str, os.PathLike)):
+        with _mm_open(target, "wb") as f:
+            return mmwrite(
+                f, matrix, comment=comment, field=field, precision=precision, symmetry=symmetry
+            )
+    typ = output_type(matrix)
+    if typ is Vector:
+        # Written as a row vector
+        matrix = matrix._as_matrix().T.new()
+    elif typ is TransposedMatrix:
+        matrix = matrix.new()
+    elif typ is not Matrix:
+        raise TypeError(f"Can only write a Matrix to a Matrix Market file, not {typ}")
+    if matrix.dtype._is_udt:
+        raise ValueError("Matrix Market files can't have user-defined types")
+    if field is None:
+        kind = matrix.dtype.np_type.kind
+        if kind == "f":
+            field = "real"
+        elif kind == "c":
+            field = "complex"
+        elif kind == "u":
+            field = "unsigned-integer"
+        else:
+            field = "integer"
+    elif field not in _MM_FIELDS:
+        raise ValueError(f"field must be one of {sorted(_MM_FIELDS)}; got: {field!r}")
+    if symmetry is None:
+        symmetry = _mm_symmetry(matrix)
+    elif symmetry not in _MM_SYMMETRIES:
+        raise ValueError(f"symmetry must be one of {sorted(_MM_SYMMETRIES)}; got: {symmetry!r}")
+    if field == "pattern":
+        ntokens = 0
+    elif field == "complex":
+        ntokens = 2
+    else:
+        ntokens = 1
+    if field == "integer" or field == "unsigned-integer":
+        to_str = str  # only used for uint64
+    elif precision is None:
+        to_str = repr  # shortest representation that round-trips
+    else:
+        if precision < 1:
+            raise ValueError(f"precision must be at least 1; got: {precision}")
+        to_str = f"%.{precision - 1}e".__mod__
+    if symmetry == "general":
+        nnz = matrix._nvals
+    else:
+        nnz = sum(
+            np.count_nonzero(_mm_lower(rows, cols, symmetry))
+            for rows, cols, _ in matrix.ss.iter_chunks()
+        )
+    header = [f"%%MatrixMarket matrix coordinate {field} {symmetry}"]
+    header.extend(f"%{line}" for line in comment.splitlines())
+    header.append(f"{matrix._nrows} {matrix._ncols} {nnz}\n")
+    header = "\n".join(header)
+    is_text = isinstance(target, TextIOBase)
+    target.write(header if is_text else header.encode())
+    for rows, cols, values in matrix.ss.iter_chunks(sort=True):
+        if symmetry != "general":
+            lower = _mm_lower(rows, cols, symmetry)
+            rows = rows[lower]
+            cols = cols[lower]
+            values = values[lower]
+        if rows.size == 0:
+            continue
+        # Integers are formatted by numba, and floats are formatted by Python
+        ints = np.empty(0, np.int64)
+        tokens = np.empty(0, np.uint8)
+        if (field == "integer" or field == "unsigned-integer") and values.dtype != np.uint64:
+            ints = values.astype(np.int64)
+        elif ntokens > 0:
+            if field == "complex":
+                values = np.stack([values.real, values.imag], axis=1).ravel()
+            elif field == "real":
+                values = values.astype(np.float64)
+            tokens = "\n".join(map(to_str, values.tolist()))
+            tokens = np.frombuffer(f"{tokens}\n".encode(), np.uint8)
+        lines = _mm_format(
+            rows.astype(np.uint64),
+            cols.astype(np.uint64),
+            ints,
+            tokens,
+            0 if ints.size else ntokens,
+        )
+        target.write(lines.tobytes().decode() if is_text else lines.data)
+
+
+def _mmread_scipy(source, *, dup_op=None, name=None):
     try:
         from scipy.io import mmread  # noqa
         from scipy.sparse import coo_matrix  # noqa
@@ -173,12 +389,7 @@ def mmread(source, *, dup_op=None, name=None):
     return Matrix.ss.import_fullr(values=array, take_ownership=True, name=name)
 
 
-def mmwrite(target, matrix, *, comment="", field=None, precision=None, symmetry=None):
-    """Write matrix to Matrix Market file `target`.
-
-    This uses `scipy.io.mmwrite`.  See documentation for the parameters here:
-    https://docs.scipy.org/doc/scipy/reference/generated/scipy.io.mmwrite.html
-    """
+def _mmwrite_scipy(target, matrix, *, comment="", field=None, precision=None, symmetry=None):
     try:
         from scipy.io import mmwrite  # noqa
     except ImportError:  # pragma: no cover
@@ -195,3 +406,618 @@ def mmwrite(target, matrix, *, comment="", field=None, precision=None, symmetry=
 
     array = to_scipy_sparse_matrix(matrix, format="coo")
     mmwrite(target, array, comment=comment, field=field, precision=precision, symmetry=symmetry)
+
+
+_MM_FORMATS = {"coordinate", "array"}
+_MM_FIELDS = {"real", "complex", "pattern", "integer", "unsigned-integer"}
+_MM_SYMMETRIES = {"general", "symmetric", "skew-symmetric", "hermitian"}
+# Number of bytes to read at a time, which bounds the memory used while parsing
+_MM_BLOCKSIZE = 2**24
+
+
+def _mm_open(path, mode):
+    path = os.fspath(path)
+    if path.endswith(".gz"):
+        import gzip
+
+        return gzip.open(path, mode)
+    if path.endswith(".bz2"):
+        import bz2
+
+        return bz2.open(path, mode)
+    return open(path, mode)
+
+
+def _mm_read(f, size=-1):
+    data = f.read(size)
+    if isinstance(data, str):
+        data = data.encode()
+    return data
+
+
+def _mm_readline(f):
+    line = f.readline()
+    if isinstance(line, str):
+        line = line.encode()
+    return line
+
+
+def _mm_read_header(f):
+    line = _mm_readline(f)
+    tokens = line.decode().lower().split()
+    if len(tokens) != 5 or tokens[0] != "%%matrixmarket" or tokens[1] != "matrix":
+        raise ValueError(f"Invalid Matrix Market header: {line!r}")
+    fmt, field, symmetry = tokens[2:]
+    if fmt not in _MM_FORMATS:
+        raise ValueError(f"Unknown Matrix Market format: {fmt!r}")
+    if field not in _MM_FIELDS or field == "pattern" and fmt == "array":
+        raise ValueError(f"Unknown Matrix Market field for {fmt} format: {field!r}")
+    if symmetry not in _MM_SYMMETRIES:
+        raise ValueError(f"Unknown Matrix Market symmetry: {symmetry!r}")
+    # Skip comments and empty lines
+    line = b"%"
+    while not line or line.startswith(b"%"):
+        line = _mm_readline(f)
+        if not line:
+            raise ValueError("Matrix Market file has no size line")
+        line = line.strip()
+    shape = tuple(int(x) for x in line.split())
+    if len(shape) != (3 if fmt == "coordinate" else 2):
+        raise ValueError(f"Invalid Matrix Market size line: {line!r}")
+    if symmetry != "general" and shape[0] != shape[1]:
+        raise ValueError(f"{symmetry} Matrix Market files must be square")
+    return fmt, field, symmetry, shape
+
+
+def _mm_read_entries(f, nint, nfloat, *, unsigned=False):
+    """Read all entries of ``nint`` integers followed by ``nfloat`` floats.
+
+    If ``unsigned`` is True, the last integer is parsed as uint64 and its bits are
+    stored in the int64 result.
+    """
+    all_ints = []
+    all_floats = []
+    tail = b""
+    while True:
+        data = _mm_read(f, _MM_BLOCKSIZE)
+        if not data:
+            block = tail
+        else:
+            # Only parse complete lines
+            cut = data.rfind(b"\n") + 1
+            if cut == 0:
+                tail += data
+                continue
+            block = tail + data[:cut]
+            tail = data[cut:]
+        ints, floats = _mm_parse(block, nint, nfloat, unsigned)
+        all_ints.append(ints)
+        all_floats.append(floats)
+        if not data:
+            break
+    if len(all_ints) == 1:
+        return all_ints[0], all_floats[0]
+    return np.concatenate(all_ints), np.concatenate(all_floats)
+
+
+def _mm_parse(block, nint, nfloat, unsigned=False):
+    """Parse a block of complete lines with one chunk per thread"""
+    buf = np.frombuffer(block, np.uint8)
+    nchunks = max(1, min(numba.get_num_threads(), len(block) // 2**16))
+    bounds = [0]
+    for i in range(1, nchunks):
+        cut = block.find(b"\n", max(bounds[-1], i * len(block) // nchunks))
+        if cut < 0:
+            break
+        bounds.append(cut + 1)
+    bounds.append(len(block))
+    bounds = np.array(bounds, dtype=np.int64)
+    # Every token and its delimiter take at least two bytes
+    ntokens = max(nint + nfloat, 1)
+    offsets = np.zeros(bounds.size, dtype=np.int64)
+    np.cumsum((np.diff(bounds) + 1) // (2 * ntokens) + 1, out=offsets[1:])
+    size = int(offsets[-1])
+    ints = np.empty((size, nint), dtype=np.int64)
+    floats = np.empty((size, nfloat), dtype=np.float64)
+    slow = np.full((size, nfloat), -1, dtype=np.int64)
+    counts = _mm_parse_chunks(buf, bounds, offsets, nint, nfloat, unsigned, ints, floats, slow)
+    status = counts.min()
+    if status == -1:
+        raise ValueError("Invalid integer in Matrix Market file")
+    if status == -2:
+        raise OverflowError("Integer in Matrix Market file does not fit in 64 bits")
+    if status == -3:
+        raise ValueError(f"Matrix Market file has an entry with fewer than {ntokens} values")
+    # Floats that need full precision parsing are parsed by numpy
+    slow = slow.ravel()
+    idx = np.flatnonzero(slow >= 0)
+    if idx.size > 0:
+        tokens = _mm_tokens(buf, slow[idx])
+        floats.ravel()[idx] = tokens.view(f"S{tokens.shape[1]}").ravel().astype(np.float64)
+    if nchunks == 1:
+        return ints[: counts[0]], floats[: counts[0]]
+    keep = np.concatenate([np.arange(o, o + c) for o, c in zip(offsets[:-1], counts)])
+    return ints[keep], floats[keep]
+
+
+def _mm_mirror(values, symmetry):
+    if symmetry == "skew-symmetric":
+        return -values
+    if symmetry == "hermitian":
+        return values.conj()
+    return values
+
+
+def _mm_lower(rows, cols, symmetry):
+    if symmetry == "skew-symmetric":
+        return rows > cols
+    return rows >= cols
+
+
+def _mm_symmetry(matrix):
+    if matrix._nrows != matrix._ncols or matrix._nvals == 0:
+        return "general"
+    from . import unary
+
+    if matrix.isequal(matrix.T):
+        return "symmetric"
+    kind = matrix.dtype.np_type.kind
+    if kind == "c" and matrix.isequal(matrix.T.apply(unary.conj).new()):
+        return "hermitian"
+    # Skew-symmetric files can't store the diagonal, so explicit (zero) diagonal
+    # values would be lost.
+    if (
+        kind in "ifc"
+        and matrix.diag()._nvals == 0
+        and matrix.isequal(matrix.T.apply(unary.ainv).new())
+    ):
+        return "skew-symmetric"
+    return "general"
+
+
+# Powers of 10 that are exactly representable as floats
+_POW10 = np.array([10.0**i for i in range(23)])
+_INT64_MAX = np.uint64(2**63 - 1)
+_UINT64_MAX = np.uint64(2**64 - 1)
+_ONE = np.uint64(1)
+_TEN = np.uint64(10)
+_MASK32 = np.uint64(2**32 - 1)
+_MIN_EXP10 = -348
+_MAX_EXP10 = 347
+
+
+def _powers_of_ten():
+    """Normalized 128-bit mantissas of powers of 10 rounded down, split into (hi, lo)"""
+    hi = np.empty(_MAX_EXP10 - _MIN_EXP10 + 1, dtype=np.uint64)
+    lo = np.empty_like(hi)
+    for i, q in enumerate(range(_MIN_EXP10, _MAX_EXP10 + 1)):
+        # Powers of 10 and 5 have the same mantissa
+        p = 5 ** abs(q)
+        if q < 0:
+            m = (1 << (127 + p.bit_length())) // p
+        elif p.bit_length() > 128:
+            m = p >> (p.bit_length() - 128)
+        else:
+            m = p << (128 - p.bit_length())
+        hi[i] = m >> 64
+        lo[i] = m & (2**64 - 1)
+    return hi, lo
+
+
+_POW10_HI, _POW10_LO = _powers_of_ten()
+
+
+@njit(cache=True)
+def _isspace(c):  # pragma: no cover
+    return c == 32 or 9 <= c <= 13
+
+
+@njit(cache=True)
+def _mul64(a, b):  # pragma: no cover
+    """Full 128-bit product of two uint64 as (hi, lo)"""
+    a_lo = a & _MASK32
+    a_hi = a >> np.uint64(32)
+    b_lo = b & _MASK32
+    b_hi = b >> np.uint64(32)
+    p0 = a_lo * b_lo
+    p1 = a_lo * b_hi
+    p2 = a_hi * b_lo
+    mid = (p0 >> np.uint64(32)) + (p1 & _MASK32) + (p2 & _MASK32)
+    lo = (mid << np.uint64(32)) | (p0 & _MASK32)
+    hi = a_hi * b_hi + (p1 >> np.uint64(32)) + (p2 >> np.uint64(32)) + (mid >> np.uint64(32))
+    return hi, lo
+
+
+@njit(cache=True)
+def _eisel_lemire(m, exp10):  # pragma: no cover
+    """Compute ``m * 10**exp10`` correctly rounded, or return False if unsure.
+
+    This is the algorithm by Daniel Lemire and Michael Eisel, following the
+    implementation in the Go standard library (strconv/eisel_lemire.go).
+    """
+    if exp10 < _MIN_EXP10 or exp10 > _MAX_EXP10:
+        return 0.0, False
+    # Normalize
+    clz = 0
+    while m < np.uint64(2**63):
+        m = m << _ONE
+        clz += 1
+    ret_exp2 = ((217706 * exp10) >> 16) + 64 + 1023 - clz
+    # Multiply
+    idx = exp10 - _MIN_EXP10
+    x_hi, x_lo = _mul64(m, _POW10_HI[idx])
+    # Wider approximation
+    if x_hi & np.uint64(0x1FF) == np.uint64(0x1FF) and x_lo + m < m:
+        y_hi, y_lo = _mul64(m, _POW10_LO[idx])
+        merged_hi = x_hi
+        merged_lo = x_lo + y_hi
+        if merged_lo < x_lo:
+            merged_hi += _ONE
+        if (
+            merged_hi & np.uint64(0x1FF) == np.uint64(0x1FF)
+            and merged_lo + _ONE == np.uint64(0)
+            and y_lo + m < m
+        ):
+            return 0.0, False
+        x_hi = merged_hi
+        x_lo = merged_lo
+    # Shift to 54 bits
+    msb = x_hi >> np.uint64(63)
+    mantissa = x_hi >> (msb + np.uint64(9))
+    ret_exp2 -= 1 - np.int64(msb)
+    # Half-way ambiguity
+    if x_lo == 0 and x_hi & np.uint64(0x1FF) == 0 and mantissa & np.uint64(3) == _ONE:
+        return 0.0, False
+    # From 54 to 53 bits
+    mantissa += mantissa & _ONE
+    mantissa = mantissa >> _ONE
+    if mantissa >> np.uint64(53) > 0:
+        mantissa = mantissa >> _ONE
+        ret_exp2 += 1
+    # Subnormals, infinity, and NaN
+    if ret_exp2 <= 0 or ret_exp2 >= 0x7FF:
+        return 0.0, False
+    return math.ldexp(np.float64(mantissa), ret_exp2 - 1075), True
+
+
+@njit(cache=True)
+def _mm_parse_float(buf, p, stop):  # pragma: no cover
+    """Parse a float without a sign in ``buf[p:stop]``, or return False if unsure"""
+    m = np.uint64(0)
+    ndigits = 0
+    exponent = 0
+    seen_digit = False
+    seen_point = False
+    while p < stop:
+        c = buf[p]
+        if 48 <= c <= 57:
+            seen_digit = True
+            if m > 0 or c > 48:
+                ndigits += 1
+                if ndigits > 19:
+                    return 0.0, False
+                m = m * _TEN + np.uint64(c - 48)
+            if seen_point:
+                exponent -= 1
+        elif c == 46 and not seen_point:  # "."
+            seen_point = True
+        else:
+            break
+        p += 1
+    if not seen_digit:
+        return 0.0, False
+    if p < stop and (buf[p] == 101 or buf[p] == 69):  # "e" or "E"
+        p += 1
+        negative_exponent = p < stop and buf[p] == 45
+        if p < stop and (negative_exponent or buf[p] == 43):
+            p += 1
+        if p == stop:
+            return 0.0, False
+        e = 0
+        while p < stop and 48 <= buf[p] <= 57 and e < 10000:
+            e = e * 10 + (buf[p] - 48)
+            p += 1
+        exponent += -e if negative_exponent else e
+    if p != stop:
+        return 0.0, False
+    if m == 0:
+        return 0.0, True
+    if m <= np.uint64(2**53) and -22 <= exponent <= 22:
+        # Exact, because m and 10**exponent are exact (Clinger's fast path)
+        if exponent >= 0:
+            return np.float64(m) * _POW10[exponent], True
+        return np.float64(m) / _POW10[-exponent], True
+    return _eisel_lemire(m, exponent)
+
+
+@njit(nogil=True, cache=True)
+def _mm_parse_chunk(
+    buf, start, stop, offset, nint, nfloat, unsigned, ints, floats, slow
+):  # pragma: no cover
+    """Parse entries of ``nint`` integers followed by ``nfloat`` floats in ``buf[start:stop]``.
+
+    If ``unsigned`` is True, the last integer is parsed as uint64.
+
+    Floats that can't be parsed exactly by the fast path below are zero, and their
+    positions are saved in ``slow``.  Returns the number of entries parsed, or a
+    negative error code.
+    """
+    ntokens = nint + nfloat
+    n = offset
+    k = 0
+    i = start
+    while True:
+        while i < stop and _isspace(buf[i]):
+            i += 1
+        if i == stop:
+            break
+        if k == 0 and buf[i] == 37:  # "%": skip comments
+            while i < stop and buf[i] != 10:
+                i += 1
+            continue
+        j = i
+        while j < stop and not _isspace(buf[j]):
+            j += 1
+        if ntokens == 0:
+            return -1
+        p = i
+        neg = buf[p] == 45  # "-"
+        if neg or buf[p] == 43:  # "+"
+            p += 1
+        if k < nint:
+            if p == j:
+                return -1
+            if unsigned and k == nint - 1:
+                if neg:
+                    return -1
+                limit = _UINT64_MAX
+            elif neg:
+                limit = _INT64_MAX + _ONE
+            else:
+                limit = _INT64_MAX
+            val = np.uint64(0)
+            while p < j:
+                d = np.uint64(buf[p] - 48)
+                if d > 9:
+                    return -1
+                if val > (limit - d) // _TEN:
+                    return -2
+                val = val * _TEN + d
+                p += 1
+            if neg:
+                ints[n, k] = -np.int64(val - _ONE) - 1 if val > 0 else 0
+            else:
+                ints[n, k] = np.int64(val)
+        else:
+            val, ok = _mm_parse_float(buf, p, j)
+            if ok:
+                floats[n, k - nint] = -val if neg else val
+            else:
+                floats[n, k - nint] = 0.0
+                slow[n, k - nint] = i
+        k += 1
+        if k == ntokens:
+            k = 0
+            n += 1
+        i = j
+    if k != 0:
+        return -3
+    return n - offset
+
+
+@numba.njit(parallel=True, cache=True)
+def _mm_parse_chunks(
+    buf, bounds, offsets, nint, nfloat, unsigned, ints, floats, slow
+):  # pragma: no cover
+    counts = np.empty(bounds.size - 1, dtype=np.int64)
+    for i in numba.prange(bounds.size - 1):
+        counts[i] = _mm_parse_chunk(
+            buf, bounds[i], bounds[i + 1], offsets[i], nint, nfloat, unsigned, ints, floats, slow
+        )
+    return counts
+
+
+@njit(cache=True)
+def _mm_write_uint(out, pos, x, digits):  # pragma: no cover
+    n = 0
+    while True:
+        digits[n] = np.uint8(x % _TEN) + 48
+        x = x // _TEN
+        n += 1
+        if x == 0:
+            break
+    for i in range(n - 1, -1, -1):
+        out[pos] = digits[i]
+        pos += 1
+    return pos
+
+
+@njit(cache=True)
+def _mm_format(rows, cols, ints, tokens, ntokens):  # pragma: no cover
+    """Lines of 1-based ``rows`` and ``cols`` followed by values.
+
+    The values are ``ints`` if not empty, else ``ntokens`` newline-separated tokens.
+    """
+    n = rows.size
+    # Each integer takes at most 20 digits (and a sign)
+    out = np.empty(64 * n + tokens.size, dtype=np.uint8)
+    digits = np.empty(20, dtype=np.uint8)
+    pos = 0
+    t = 0
+    for i in range(n):
+        pos = _mm_write_uint(out, pos, rows[i] + _ONE, digits)
+        out[pos] = 32  # " "
+        pos = _mm_write_uint(out, pos + 1, cols[i] + _ONE, digits)
+        if ints.size > 0:
+            out[pos] = 32
+            pos += 1
+            x = ints[i]
+            if x < 0:
+                out[pos] = 45  # "-"
+                pos = _mm_write_uint(out, pos + 1, np.uint64(-(x + 1)) + _ONE, digits)
+            else:
+                pos = _mm_write_uint(out, pos, np.uint64(x), digits)
+        for _ in range(ntokens):
+            out[pos] = 32
+            pos += 1
+            while tokens[t] != 10:
+                out[pos] = tokens[t]
+                pos += 1
+                t += 1
+            t += 1
+        out[pos] = 10  # "\n"
+        pos += 1
+    return out[:pos]
+
+
+@njit(cache=True)
+def _mm_tokens(buf, starts):  # pragma: no cover
+    """Copy the tokens that begin at ``starts`` into rows of a 2d array"""
+    lengths = np.empty(starts.size, dtype=np.int64)
+    width = 1
+    for i in range(starts.size):
+        j = starts[i]
+        while j < buf.size and not _isspace(buf[j]):
+            j += 1
+        lengths[i] = j - starts[i]
+        width = max(width, lengths[i])
+    rv = np.zeros((starts.size, width), dtype=np.uint8)
+    for i in range(starts.size):
+        rv[i, : lengths[i]] = buf[starts[i] : starts[i] + lengths[i]]
+    return rv
+
+
+# Version 1 of the binary format used by `save` and `load`
+_MAGIC = b"\x93GRBLAS\x01"
+_ALIGNMENT = 64
+
+
+def _aligned(n):
+    return -(-n // _ALIGNMENT) * _ALIGNMENT
+
+
+def save(target, x):
+    """Save a Matrix or Vector to a file in a binary format that can be memory-mapped by `load`.
+
+    The raw arrays of the SuiteSparse format (such as CSR, HyperCSR, or bitmap) are
+    written without converting them, each aligned to 64 bytes, after a small header.
+    While saving, the data is unpacked from ``x`` (so ``x`` is empty) and is packed
+    back when done, so data is not copied in memory.
+
+    Parameters
+    ----------
+    target : str, path-like, or file-like object
+        Filename or binary file opened for writing
+    x : Matrix or Vector
+
+    See Also
+    --------
+    load
+    """
+    if type(x) is TransposedMatrix:
+        x = x.new()
+    elif type(x) is not Matrix and type(x) is not Vector:
+        raise TypeError(f"Can only save a Matrix or Vector, not {type(x)}")
+    if isinstance(target, (str, os.PathLike)):
+        with open(target, "wb") as f:
+            return save(f, x)
+    # SS, SuiteSparse-specific: unpack and pack
+    d = x.ss.unpack(raw=True)
+    try:
+        header = {"type": type(x).__name__}
+        if x.dtype._is_udt:
+            header["udt"] = np.lib.format.dtype_to_descr(x.dtype.np_type)
+        else:
+            header["dtype"] = x.dtype.name
+        arrays = []
+        offset = 0
+        for key, val in d.items():
+            if isinstance(val, np.ndarray):
+                header[key] = {
+                    "dtype": np.lib.format.dtype_to_descr(val.dtype),
+                    "size": val.size,
+                    "offset": offset,
+                }
+                offset = _aligned(offset + val.nbytes)
+                arrays.append(val)
+            elif key != "dtype":
+                header[key] = val
+        header = repr(header).encode()
+        f = target
+        f.write(_MAGIC)
+        f.write(np.uint64(len(header)).tobytes())
+        f.write(header)
+        written = len(_MAGIC) + 8 + len(header)
+        f.write(bytes(_aligned(written) - written))
+        offset = 0
+        for val in arrays:
+            f.write(val.view(np.uint8).data)
+            f.write(bytes(_aligned(offset + val.nbytes) - offset - val.nbytes))
+            offset = _aligned(offset + val.nbytes)
+    finally:
+        x.ss.pack_any(take_ownership=True, **d)
+
+
+def load(source, *, mmap=True, name=None):
+    """Load a Matrix or Vector that was saved with `save`.
+
+    Parameters
+    ----------
+    source : str, path-like, or file-like object
+        Filename or binary file opened for reading.  Memory-mapping requires a file
+        on disk, so use ``mmap=False`` for other file-like objects such as BytesIO.
+    mmap : bool, default True
+        Whether to read the arrays with `numpy.memmap`, which is the fastest way to read
+        large files, and pages of the file may be shared by processes that load the
+        same file.  The data is then copied into memory owned by SuiteSparse.
+    name : str, optional
+        Name of the new Matrix or Vector
+
+    Returns
+    -------
+    Matrix or Vector
+
+    See Also
+    --------
+    save
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            return load(f, mmap=mmap, name=name)
+    f = source
+    magic = f.read(len(_MAGIC))
+    if magic != _MAGIC:
+        raise GrblasException("Not a file written by `grblas.io.save` (bad magic number)")
+    header_size = int(np.frombuffer(f.read(8), np.uint64)[0])
+    header = ast.literal_eval(f.read(header_size).decode())
+    start = _aligned(len(_MAGIC) + 8 + header_size)
+    typ = header.pop("type")
+    if "udt" in header:
+        np_type = np.lib.format.descr_to_dtype(header.pop("udt"))
+        try:
+            dtype = lookup_dtype(np_type)
+        except ValueError:
+            dtype = register_anonymous(np_type)
+    else:
+        dtype = lookup_dtype(header.pop("dtype"))
+    for key, val in header.items():
+        if type(val) is not dict:
+            continue
+        arr_dtype = np.lib.format.descr_to_dtype(val["dtype"])
+        if val["size"] == 0:
+            # np.memmap can't map empty arrays
+            arr = np.empty(val["size"], arr_dtype)
+        elif mmap:
+            arr = np.memmap(f, arr_dtype, "r", start + val["offset"], val["size"])
+        else:
+            f.seek(start + val["offset"])
+            arr = np.frombuffer(f.read(arr_dtype.itemsize * val["size"]), arr_dtype)
+        header[key] = arr
+    if typ == "Matrix":
+        cls = Matrix
+    elif typ == "Vector":
+        cls = Vector
+    else:  # pragma: no cover
+        raise GrblasException(f"Unknown type in file: {typ}")
+    # SS, SuiteSparse-specific: import_any
+    return cls.ss.import_any(**header, dtype=dtype, take_ownership=False, name=name)
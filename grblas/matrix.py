@@ -2,7 +2,7 @@ import itertools
 
 import numpy as np
 
-from . import _automethods, backend, binary, ffi, lib, monoid, semiring, utils
+from . import _automethods, backend, binary, ffi, lib, monoid, utils
 from ._ss.matrix import ss
 from .base import BaseExpression, BaseType, call
 from .dtypes import _INDEX, lookup_dtype, unify
@@ -126,9 +126,9 @@ class Matrix(BaseType):
         return not scalar._is_empty
 
     def __iter__(self):
-        self.wait()  # sort in SS
-        rows, columns, values = self.to_values()
-        return zip(rows.flat, columns.flat)
+        # SS, SuiteSparse-specific: stream from a copy so this Matrix may be used while iterating
+        for rows, columns, _ in self.dup(name="M_iter").ss.iter_chunks(sort=True):
+            yield from zip(rows.flat, columns.flat)
 
     def __sizeof__(self):
         size = ffi_new("size_t*")
@@ -232,11 +232,13 @@ class Matrix(BaseType):
         return TransposedMatrix(self)
 
     def clear(self):
+        self._version += 1
         call("GrB_Matrix_clear", [self])
 
     def resize(self, nrows, ncols):
         nrows = _as_scalar(nrows, _INDEX, is_cscalar=True)
         ncols = _as_scalar(ncols, _INDEX, is_cscalar=True)
+        self._version += 1
         call("GrB_Matrix_resize", [self, nrows, ncols])
         self._nrows = nrows.value
         self._ncols = ncols.value
@@ -308,6 +310,7 @@ class Matrix(BaseType):
         columns = _CArray(columns)
         values = _CArray(values, self.dtype)
         dtype_name = "UDT" if self.dtype._is_udt else self.dtype.name
+        self._version += 1
         call(
             f"GrB_Matrix_build_{dtype_name}",
             [self, rows, columns, values, _as_scalar(n, _INDEX, is_cscalar=True), dup_op],
@@ -604,7 +607,7 @@ class Matrix(BaseType):
             expr.new(name="")  # incompatible shape; raise now
         return expr
 
-    def mxv(self, other, op=semiring.plus_times):
+    def mxv(self, other, op="plus_times"):
         """
         GrB_mxv
         Matrix-Vector multiplication. Result is a Vector.
@@ -626,7 +629,7 @@ class Matrix(BaseType):
             expr.new(name="")  # incompatible shape; raise now
         return expr
 
-    def mxm(self, other, op=semiring.plus_times):
+    def mxm(self, other, op="plus_times"):
         """
         GrB_mxm
         Matrix-Matrix multiplication. Result is a Matrix.
@@ -864,6 +867,39 @@ class Matrix(BaseType):
             is_cscalar=not allow_empty,
         )
 
+    # Unofficial methods
+    def groupby_rows(self, labels, *, ngroups=None):
+        """
+        Group the rows of this Matrix by integer labels to aggregate each column of each group.
+
+        ``labels`` is a Vector or 1-D array of nonnegative integers of size ``nrows``.
+        Rows without a label (missing from a labels Vector) are ignored.  The result of
+        aggregating has ``ngroups`` rows, which defaults to ``max(labels) + 1``.
+
+        >>> A.groupby_rows(labels).agg(agg.sum)
+
+        Groups are aggregated with sparse products with an iso-valued assignment
+        Matrix, which is reused by each call to ``agg``.
+
+        *This is not a standard GraphBLAS function*
+        """
+        from ._groupby import MatrixGroupBy
+
+        return MatrixGroupBy(self, labels, ngroups, rowwise=True)
+
+    def groupby_columns(self, labels, *, ngroups=None):
+        """
+        Group the columns of this Matrix by integer labels to aggregate each row of each group.
+
+        Like ``groupby_rows``, but ``labels`` has size ``ncols`` and the result of
+        aggregating has ``ngroups`` columns.
+
+        *This is not a standard GraphBLAS function*
+        """
+        from ._groupby import MatrixGroupBy
+
+        return MatrixGroupBy(self, labels, ngroups, rowwise=False)
+
     ##################################
     # Extract and Assign index methods
     ##################################
@@ -1410,6 +1446,8 @@ class MatrixExpression(BaseExpression):
     ewise_mult = wrapdoc(Matrix.ewise_mult)(property(_automethods.ewise_mult))
     ewise_union = wrapdoc(Matrix.ewise_union)(property(_automethods.ewise_union))
     gb_obj = wrapdoc(Matrix.gb_obj)(property(_automethods.gb_obj))
+    groupby_columns = wrapdoc(Matrix.groupby_columns)(property(_automethods.groupby_columns))
+    groupby_rows = wrapdoc(Matrix.groupby_rows)(property(_automethods.groupby_rows))
     isclose = wrapdoc(Matrix.isclose)(property(_automethods.isclose))
     isequal = wrapdoc(Matrix.isequal)(property(_automethods.isequal))
     kronecker = wrapdoc(Matrix.kronecker)(property(_automethods.kronecker))
@@ -1488,6 +1526,8 @@ class MatrixIndexExpr(AmbiguousAssignOrExtract):
     ewise_mult = wrapdoc(Matrix.ewise_mult)(property(_automethods.ewise_mult))
     ewise_union = wrapdoc(Matrix.ewise_union)(property(_automethods.ewise_union))
     gb_obj = wrapdoc(Matrix.gb_obj)(property(_automethods.gb_obj))
+    groupby_columns = wrapdoc(Matrix.groupby_columns)(property(_automethods.groupby_columns))
+    groupby_rows = wrapdoc(Matrix.groupby_rows)(property(_automethods.groupby_rows))
     isclose = wrapdoc(Matrix.isclose)(property(_automethods.isclose))
     isequal = wrapdoc(Matrix.isequal)(property(_automethods.isequal))
     kronecker = wrapdoc(Matrix.kronecker)(property(_automethods.kronecker))
@@ -1604,6 +1644,8 @@ class TransposedMatrix:
     reduce_rowwise = Matrix.reduce_rowwise
     reduce_columnwise = Matrix.reduce_columnwise
     reduce_scalar = Matrix.reduce_scalar
+    groupby_rows = Matrix.groupby_rows
+    groupby_columns = Matrix.groupby_columns
 
     # Operator sugar
     __or__ = Matrix.__or__
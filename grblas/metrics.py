@@ -0,0 +1,108 @@
+"""Cheap counters of GraphBLAS usage that are always on.
+
+Counters are kept for every GraphBLAS C call made by grblas (the number of calls
+and the time spent in C for each C function) and for the bytes of buffers moved
+between numpy and GraphBLAS by ``ss.import_*``, ``ss.pack_*``, ``ss.export``, and
+``ss.unpack``.  Updating them costs a few hundred nanoseconds per call, so they are
+enabled by default; use ``disable()`` to turn them off.
+
+Get the counters as a dict with ``snapshot()`` or as text in the Prometheus
+exposition format with ``to_prometheus()``:
+
+>>> grblas.metrics.snapshot()["calls"]["GrB_mxm"]
+3
+
+Counters are not locked, so a few counts may be lost when several threads call
+GraphBLAS at the same time.  For more detail about each call, use
+``grblas.profiler.Profiler``.
+"""
+from . import base
+
+# C function name: [number of calls, nanoseconds spent in C]; updated by `base.call`
+_calls = base._call_metrics
+_counters = {"imported_bytes": 0, "exported_bytes": 0}
+_HELP = {
+    "imported_bytes": "Bytes of buffers imported into GraphBLAS by ss.import_* and ss.pack_*",
+    "exported_bytes": "Bytes of buffers exported from GraphBLAS by ss.export and ss.unpack",
+}
+
+
+def _add(key, nbytes):
+    if base._call_metrics is not None:
+        _counters[key] += nbytes
+
+
+def enable():
+    """Start updating the counters"""
+    base._call_metrics = _calls
+
+
+def disable():
+    """Stop updating the counters; their values are kept"""
+    base._call_metrics = None
+
+
+def is_enabled():
+    return base._call_metrics is not None
+
+
+def reset():
+    """Set all counters to zero"""
+    _calls.clear()
+    for key in _counters:
+        _counters[key] = 0
+
+
+def snapshot():
+    """Get the current values of the counters as a dict.
+
+    The keys are:
+
+    - ``"calls"``: dict of the number of calls of each C function
+    - ``"time"``: dict of the seconds spent in each C function
+    - ``"total_calls"``: number of calls of all C functions
+    - ``"total_time"``: seconds spent in all C functions
+    - ``"imported_bytes"``: bytes imported by ``ss.import_*`` and ``ss.pack_*``
+    - ``"exported_bytes"``: bytes exported by ``ss.export`` and ``ss.unpack``
+    """
+    calls = {name: counts[0] for name, counts in _calls.items()}
+    time = {name: counts[1] / 1e9 for name, counts in _calls.items()}
+    return {
+        "calls": calls,
+        "time": time,
+        "total_calls": sum(calls.values()),
+        "total_time": sum(time.values()),
+        **_counters,
+    }
+
+
+def to_prometheus(prefix="grblas"):
+    """Get the current values of the counters in the Prometheus text exposition format"""
+    data = snapshot()
+    lines = [
+        f"# HELP {prefix}_calls_total Number of GraphBLAS C calls",
+        f"# TYPE {prefix}_calls_total counter",
+    ]
+    lines.extend(
+        f'{prefix}_calls_total{{cfunc="{name}"}} {count}'
+        for name, count in sorted(data["calls"].items())
+    )
+    lines.extend(
+        [
+            f"# HELP {prefix}_call_seconds_total Seconds spent in GraphBLAS C calls",
+            f"# TYPE {prefix}_call_seconds_total counter",
+        ]
+    )
+    lines.extend(
+        f'{prefix}_call_seconds_total{{cfunc="{name}"}} {seconds!r}'
+        for name, seconds in sorted(data["time"].items())
+    )
+    for key, help_text in _HELP.items():
+        lines.extend(
+            [
+                f"# HELP {prefix}_{key}_total {help_text}",
+                f"# TYPE {prefix}_{key}_total counter",
+                f"{prefix}_{key}_total {data[key]}",
+            ]
+        )
+    return "\n".join(lines) + "\n"
@@ -9,7 +9,7 @@ from types import FunctionType, ModuleType
 import numba
 import numpy as np
 
-from . import config, ffi, lib
+from . import _udf_cache, config, ffi, lib
 from .dtypes import (
     BOOL,
     FP32,
@@ -43,6 +43,8 @@ UNKNOWN_OPCLASS = "UnknownOpClass"
 
 
 def _hasop(module, name):
+    if module is op or module is semiring:
+        _initialize_semirings()
     return name in module.__dict__ or name in module._delayed
 
 
@@ -645,17 +647,24 @@ class ParameterizedSemiring(ParameterizedUdf):
 
 
 _VARNAMES = tuple(x for x in dir(lib) if x[0] != "_")
+_RETURN_PREFIXES = (
+    ("re_exprs", None),
+    ("re_exprs_return_bool", "BOOL"),
+    ("re_exprs_return_float", "FP"),
+    ("re_exprs_return_complex", "FC"),
+)
 
 
 class OpBase:
     __slots__ = (
         "name",
         "_typed_ops",
-        "types",
+        "_types",
         "coercions",
         "_anonymous",
         "_udt_types",
         "_udt_ops",
+        "_lazy_udf",
         "__weakref__",
     )
     _parse_config = None
@@ -666,15 +675,22 @@ class OpBase:
     def __init__(self, name, *, anonymous=False):
         self.name = name
         self._typed_ops = {}
-        self.types = {}
+        self._types = {}
         self.coercions = {}
         self._anonymous = anonymous
         self._udt_types = None
         self._udt_ops = None
+        self._lazy_udf = None
 
     def __repr__(self):
         return f"{self._modname}.{self.name}"
 
+    @property
+    def types(self):
+        if self._lazy_udf is not None:
+            self._compile_lazy_udf()
+        return self._types
+
     def __getitem__(self, type_):
         if type(type_) is tuple:
             dtype1, dtype2 = type_
@@ -683,7 +699,9 @@ class OpBase:
             return get_typed_op(self, dtype1, dtype2)
         elif not self._is_udt:
             type_ = lookup_dtype(type_)
-            if type_ not in self._typed_ops:
+            if type_ not in self._typed_ops and (
+                self._lazy_udf is None or not self._compile_lazy_udf(type_)
+            ):
                 if self._udt_types is None:
                     if self.is_positional:
                         return self._typed_ops[UINT64]
@@ -696,12 +714,46 @@ class OpBase:
 
     def _add(self, op):
         self._typed_ops[op.type] = op
-        self.types[op.type] = op.return_type
+        self._types[op.type] = op.return_type
+        get_typed_op.cache_clear()
 
     def __delitem__(self, type_):
         type_ = lookup_dtype(type_)
+        if self._lazy_udf is not None:
+            self._compile_lazy_udf(type_)
         del self._typed_ops[type_]
-        del self.types[type_]
+        del self._types[type_]
+        get_typed_op.cache_clear()
+
+    def _compile_lazy_udf(self, type_=None):
+        """Compile a UDF that was registered lazily for ``type_``, or for all remaining types.
+
+        Returns whether the UDF was compiled successfully for ``type_``.
+        """
+        lazy = self._lazy_udf
+        if type_ is None:
+            for type_ in list(lazy.pending):
+                self._compile_lazy_udf(type_)
+            return bool(self._typed_ops)
+        if type_ not in lazy.pending:
+            return type_ in self._typed_ops
+        # Return types for these types depend on the return types for INT64 and INT8
+        if type_ == UINT64:
+            self._compile_lazy_udf(INT64)
+        elif type_ == BOOL:
+            self._compile_lazy_udf(INT8)
+        ret_type = lazy.pending.pop(type_)
+        if ret_type is None:
+            ret_type = _get_return_type(self._numba_func, type_, lazy.return_types, self._nargs)
+        if ret_type is not None:
+            self._add(self._build_typed_op(type_, ret_type, lazy.cached))
+            lazy.return_types[type_] = ret_type
+        if not lazy.pending:
+            self._lazy_udf = None
+            cached = lazy.cached
+            if cached is not None and cached.return_types is None and lazy.return_types:
+                cached.save_return_types(lazy.return_types)
+        return ret_type is not None
 
     def __contains__(self, type_):
         try:
@@ -744,6 +796,33 @@ class OpBase:
                 break
         return rv
 
+    @classmethod
+    def _find_varnames(cls):
+        """Get ``(return_prefix, varname)`` for names in ``lib`` that match the parse config.
+
+        All regexes are combined so each name is matched only once, which is much faster
+        than matching each regex separately.  Names are returned in the order they would
+        be found by matching each regex separately (in reverse order) over all names.
+        """
+        patterns = []
+        for i, (re_str, return_prefix) in enumerate(_RETURN_PREFIXES):
+            if re_str not in cls._parse_config:
+                continue
+            if "complex" in re_str and not _supports_complex:
+                continue
+            regexes = cls._parse_config[re_str]
+            for j, r in enumerate(regexes):
+                patterns.append(f"(?P<g{i}_{len(regexes) - j}>{r.pattern})")
+        combined = re.compile("|".join(patterns))
+        matches = []
+        for k, varname in enumerate(_VARNAMES):
+            m = combined.match(varname)
+            if m:
+                i, j = m.lastgroup[1:].split("_")
+                matches.append((int(i), int(j), k, varname))
+        matches.sort()
+        return [(_RETURN_PREFIXES[i][1], varname) for i, j, k, varname in matches]
+
     @classmethod
     def _initialize(cls):
         if cls._initialized:
@@ -753,68 +832,55 @@ class OpBase:
         delete_exact = cls._parse_config.get("delete_exact", None)
         num_underscores = cls._parse_config["num_underscores"]
 
-        for re_str, return_prefix in (
-            ("re_exprs", None),
-            ("re_exprs_return_bool", "BOOL"),
-            ("re_exprs_return_float", "FP"),
-            ("re_exprs_return_complex", "FC"),
-        ):
-            if re_str not in cls._parse_config:
-                continue
-            if "complex" in re_str and not _supports_complex:
-                continue
-            for r in reversed(cls._parse_config[re_str]):
-                for varname in _VARNAMES:
-                    m = r.match(varname)
-                    if m:
-                        # Parse function into name and datatype
-                        gb_name = m.string
-                        splitname = gb_name[trim_from_front:].split("_")
-                        if delete_exact and delete_exact in splitname:
-                            splitname.remove(delete_exact)
-                        if len(splitname) == num_underscores + 1:
-                            *splitname, type_ = splitname
-                        else:
-                            type_ = None
-                        name = "_".join(splitname).lower()
-                        # Create object for name unless it already exists
-                        if not hasattr(cls._module, name):
-                            if cls._positional is None:
-                                obj = cls(name)
-                            else:
-                                obj = cls(name, is_positional=name in cls._positional)
-                            setattr(cls._module, name, obj)
-                            _STANDARD_OPERATOR_NAMES.add(f"{cls._modname}.{name}")
-                            if not hasattr(op, name):
-                                setattr(op, name, obj)
-                        else:
-                            obj = getattr(cls._module, name)
-                        gb_obj = getattr(lib, varname)
-                        # Determine return type
-                        if return_prefix == "BOOL":
-                            return_type = BOOL
-                            if type_ is None:
-                                type_ = BOOL
-                        else:
-                            if type_ is None:  # pragma: no cover
-                                raise TypeError(f"Unable to determine return type for {varname}")
-                            if return_prefix is None:
-                                return_type = type_
-                            else:
-                                # Grab the number of bits from type_
-                                num_bits = type_[-2:]
-                                if num_bits not in {"32", "64"}:  # pragma: no cover
-                                    raise TypeError(f"Unexpected number of bits: {num_bits}")
-                                return_type = f"{return_prefix}{num_bits}"
-                        builtin_op = cls._typed_class(
-                            obj,
-                            name,
-                            lookup_dtype(type_),
-                            lookup_dtype(return_type),
-                            gb_obj,
-                            gb_name,
-                        )
-                        obj._add(builtin_op)
+        for return_prefix, varname in cls._find_varnames():
+            # Parse function into name and datatype
+            gb_name = varname
+            splitname = gb_name[trim_from_front:].split("_")
+            if delete_exact and delete_exact in splitname:
+                splitname.remove(delete_exact)
+            if len(splitname) == num_underscores + 1:
+                *splitname, type_ = splitname
+            else:
+                type_ = None
+            name = "_".join(splitname).lower()
+            # Create object for name unless it already exists
+            if not hasattr(cls._module, name):
+                if cls._positional is None:
+                    obj = cls(name)
+                else:
+                    obj = cls(name, is_positional=name in cls._positional)
+                setattr(cls._module, name, obj)
+                _STANDARD_OPERATOR_NAMES.add(f"{cls._modname}.{name}")
+                if not hasattr(op, name):
+                    setattr(op, name, obj)
+            else:
+                obj = getattr(cls._module, name)
+            gb_obj = getattr(lib, varname)
+            # Determine return type
+            if return_prefix == "BOOL":
+                return_type = BOOL
+                if type_ is None:
+                    type_ = BOOL
+            else:
+                if type_ is None:  # pragma: no cover
+                    raise TypeError(f"Unable to determine return type for {varname}")
+                if return_prefix is None:
+                    return_type = type_
+                else:
+                    # Grab the number of bits from type_
+                    num_bits = type_[-2:]
+                    if num_bits not in {"32", "64"}:  # pragma: no cover
+                        raise TypeError(f"Unexpected number of bits: {num_bits}")
+                    return_type = f"{return_prefix}{num_bits}"
+            builtin_op = cls._typed_class(
+                obj,
+                name,
+                lookup_dtype(type_),
+                lookup_dtype(return_type),
+                gb_obj,
+                gb_name,
+            )
+            obj._add(builtin_op)
 
     @classmethod
     def _deserialize(cls, name, *args):
@@ -837,6 +903,7 @@ class UnaryOp(OpBase):
     _module = unary
     _modname = "unary"
     _typed_class = TypedBuiltinUnaryOp
+    _nargs = 1
     _parse_config = {
         "trim_from_front": 4,
         "num_underscores": 1,
@@ -871,82 +938,62 @@ class UnaryOp(OpBase):
             raise TypeError(f"UDF argument must be a function, not {type(func)}")
         if name is None:
             name = getattr(func, "__name__", "<anonymous_unary>")
-        success = False
         unary_udf = numba.njit(func)
         new_type_obj = cls(name, func, anonymous=anonymous, is_udt=is_udt, numba_func=unary_udf)
-        return_types = {}
-        nt = numba.types
         if not is_udt:
-            for type_, sample_val in _sample_values.items():
-                sig = (type_.numba_type,)
-                try:
-                    unary_udf.compile(sig)
-                except numba.TypingError:
-                    continue
-                ret_type = lookup_dtype(unary_udf.overloads[sig].signature.return_type)
-                if ret_type != type_ and (
-                    ("INT" in ret_type.name and "INT" in type_.name)
-                    or ("FP" in ret_type.name and "FP" in type_.name)
-                    or ("FC" in ret_type.name and "FC" in type_.name)
-                    or (type_ == UINT64 and ret_type == FP64 and return_types.get(INT64) == INT64)
-                ):
-                    # Downcast `ret_type` to `type_`.
-                    # This is what users want most of the time, but we can't make a perfect rule.
-                    # There should be a way for users to be explicit.
-                    ret_type = type_
-                elif type_ == BOOL and ret_type == INT64 and return_types.get(INT8) == INT8:
-                    ret_type = INT8
-
-                # Numba is unable to handle BOOL correctly right now, but we have a workaround
-                # See: https://github.com/numba/numba/issues/5395
-                # We're relying on coercion behaving correctly here
-                input_type = INT8 if type_ == BOOL else type_
-                return_type = INT8 if ret_type == BOOL else ret_type
-
-                # Build wrapper because GraphBLAS wants pointers and void return
-                wrapper_sig = nt.void(
-                    nt.CPointer(return_type.numba_type),
-                    nt.CPointer(input_type.numba_type),
-                )
+            new_type_obj._lazy_udf = _LazyUdf("unary", func, unary_udf)
+            if not config.get("lazy_udf") and not new_type_obj._compile_lazy_udf():
+                raise UdfParseError("Unable to parse function using Numba")
+        return new_type_obj
 
-                if type_ == BOOL:
-                    if ret_type == BOOL:
+    def _build_typed_op(self, type_, ret_type, cached):
+        # Numba is unable to handle BOOL correctly right now, but we have a workaround
+        # See: https://github.com/numba/numba/issues/5395
+        # We're relying on coercion behaving correctly here
+        input_type = INT8 if type_ == BOOL else type_
+        return_type = INT8 if ret_type == BOOL else ret_type
 
-                        def unary_wrapper(z, x):
-                            z[0] = bool(unary_udf(bool(x[0])))  # pragma: no cover
+        # Build wrapper because GraphBLAS wants pointers and void return
+        nt = numba.types
+        wrapper_sig = nt.void(
+            nt.CPointer(return_type.numba_type),
+            nt.CPointer(input_type.numba_type),
+        )
 
-                    else:
+        unary_udf = self._numba_func
+        if cached is not None:
+            unary_wrapper = cached.wrapper(type_ == BOOL, ret_type == BOOL)
+        elif type_ == BOOL:
+            if ret_type == BOOL:
 
-                        def unary_wrapper(z, x):
-                            z[0] = unary_udf(bool(x[0]))  # pragma: no cover
+                def unary_wrapper(z, x):
+                    z[0] = bool(unary_udf(bool(x[0])))  # pragma: no cover
 
-                elif ret_type == BOOL:
+            else:
 
-                    def unary_wrapper(z, x):
-                        z[0] = bool(unary_udf(x[0]))  # pragma: no cover
+                def unary_wrapper(z, x):
+                    z[0] = unary_udf(bool(x[0]))  # pragma: no cover
 
-                else:
+        elif ret_type == BOOL:
 
-                    def unary_wrapper(z, x):
-                        z[0] = unary_udf(x[0])  # pragma: no cover
+            def unary_wrapper(z, x):
+                z[0] = bool(unary_udf(x[0]))  # pragma: no cover
 
-                unary_wrapper = numba.cfunc(wrapper_sig, nopython=True)(unary_wrapper)
-                new_unary = ffi_new("GrB_UnaryOp*")
-                check_status_carg(
-                    lib.GrB_UnaryOp_new(
-                        new_unary, unary_wrapper.cffi, ret_type.gb_obj, type_.gb_obj
-                    ),
-                    "UnaryOp",
-                    new_unary,
-                )
-                op = TypedUserUnaryOp(new_type_obj, name, type_, ret_type, new_unary[0])
-                new_type_obj._add(op)
-                success = True
-                return_types[type_] = ret_type
-        if success or is_udt:
-            return new_type_obj
         else:
-            raise UdfParseError("Unable to parse function using Numba")
+
+            def unary_wrapper(z, x):
+                z[0] = unary_udf(x[0])  # pragma: no cover
+
+        unary_wrapper = numba.cfunc(wrapper_sig, nopython=True, cache=cached is not None)(
+            unary_wrapper
+        )
+        new_unary = ffi_new("GrB_UnaryOp*")
+        check_status_carg(
+            lib.GrB_UnaryOp_new(new_unary, unary_wrapper.cffi, ret_type.gb_obj, type_.gb_obj),
+            "UnaryOp",
+            new_unary,
+        )
+        return TypedUserUnaryOp(self, self.name, type_, ret_type, new_unary[0])
 
     def _compile_udt(self, dtype, dtype2):
         if dtype in self._udt_types:
@@ -1134,6 +1181,46 @@ def _pair(x, y):
     return 1  # pragma: no cover
 
 
+def _get_return_type(numba_func, type_, return_types, nargs):
+    """Compile a UDF for inputs of ``type_`` and get its return type, or None if it fails"""
+    sig = (type_.numba_type,) * nargs
+    try:
+        numba_func.compile(sig)
+    except numba.TypingError:
+        return None
+    ret_type = lookup_dtype(numba_func.overloads[sig].signature.return_type)
+    if ret_type != type_ and (
+        ("INT" in ret_type.name and "INT" in type_.name)
+        or ("FP" in ret_type.name and "FP" in type_.name)
+        or ("FC" in ret_type.name and "FC" in type_.name)
+        or (type_ == UINT64 and ret_type == FP64 and return_types.get(INT64) == INT64)
+    ):
+        # Downcast `ret_type` to `type_`.
+        # This is what users want most of the time, but we can't make a perfect rule.
+        # There should be a way for users to be explicit.
+        ret_type = type_
+    elif type_ == BOOL and ret_type == INT64 and return_types.get(INT8) == INT8:
+        ret_type = INT8
+    return ret_type
+
+
+class _LazyUdf:
+    """The types a UDF has yet to be compiled for"""
+
+    __slots__ = "pending", "return_types", "cached"
+
+    def __init__(self, kind, func, numba_func):
+        self.cached = None
+        if config.get("udf_cache"):
+            self.cached = _udf_cache.lookup(kind, func, numba_func)
+        if self.cached is not None and self.cached.return_types is not None:
+            # Return types are known, so the wrappers can be loaded from numba's cache
+            self.pending = dict(self.cached.return_types)
+        else:
+            self.pending = dict.fromkeys(_sample_values)
+        self.return_types = {}
+
+
 def _get_udt_wrapper(numba_func, return_type, dtype, dtype2=None):
     ztype = INT8 if return_type == BOOL else return_type
     xtype = INT8 if dtype == BOOL else dtype
@@ -1212,6 +1299,7 @@ class BinaryOp(OpBase):
     _module = binary
     _modname = "binary"
     _typed_class = TypedBuiltinBinaryOp
+    _nargs = 2
     _parse_config = {
         "trim_from_front": 4,
         "num_underscores": 1,
@@ -1318,87 +1406,69 @@ class BinaryOp(OpBase):
             raise TypeError(f"UDF argument must be a function, not {type(func)}")
         if name is None:
             name = getattr(func, "__name__", "<anonymous_binary>")
-        success = False
         binary_udf = numba.njit(func)
         new_type_obj = cls(name, func, anonymous=anonymous, is_udt=is_udt, numba_func=binary_udf)
-        return_types = {}
-        nt = numba.types
         if not is_udt:
-            for type_, sample_val in _sample_values.items():
-                sig = (type_.numba_type, type_.numba_type)
-                try:
-                    binary_udf.compile(sig)
-                except numba.TypingError:
-                    continue
-                ret_type = lookup_dtype(binary_udf.overloads[sig].signature.return_type)
-                if ret_type != type_ and (
-                    ("INT" in ret_type.name and "INT" in type_.name)
-                    or ("FP" in ret_type.name and "FP" in type_.name)
-                    or ("FC" in ret_type.name and "FC" in type_.name)
-                    or (type_ == UINT64 and ret_type == FP64 and return_types.get(INT64) == INT64)
-                ):
-                    # Downcast `ret_type` to `type_`.
-                    # This is what users want most of the time, but we can't make a perfect rule.
-                    # There should be a way for users to be explicit.
-                    ret_type = type_
-                elif type_ == BOOL and ret_type == INT64 and return_types.get(INT8) == INT8:
-                    ret_type = INT8
-
-                # Numba is unable to handle BOOL correctly right now, but we have a workaround
-                # See: https://github.com/numba/numba/issues/5395
-                # We're relying on coercion behaving correctly here
-                input_type = INT8 if type_ == BOOL else type_
-                return_type = INT8 if ret_type == BOOL else ret_type
-
-                # Build wrapper because GraphBLAS wants pointers and void return
-                wrapper_sig = nt.void(
-                    nt.CPointer(return_type.numba_type),
-                    nt.CPointer(input_type.numba_type),
-                    nt.CPointer(input_type.numba_type),
-                )
+            new_type_obj._lazy_udf = _LazyUdf("binary", func, binary_udf)
+            if not config.get("lazy_udf") and not new_type_obj._compile_lazy_udf():
+                raise UdfParseError("Unable to parse function using Numba")
+        return new_type_obj
 
-                if type_ == BOOL:
-                    if ret_type == BOOL:
+    def _build_typed_op(self, type_, ret_type, cached):
+        # Numba is unable to handle BOOL correctly right now, but we have a workaround
+        # See: https://github.com/numba/numba/issues/5395
+        # We're relying on coercion behaving correctly here
+        input_type = INT8 if type_ == BOOL else type_
+        return_type = INT8 if ret_type == BOOL else ret_type
 
-                        def binary_wrapper(z, x, y):
-                            z[0] = bool(binary_udf(bool(x[0]), bool(y[0])))  # pragma: no cover
+        # Build wrapper because GraphBLAS wants pointers and void return
+        nt = numba.types
+        wrapper_sig = nt.void(
+            nt.CPointer(return_type.numba_type),
+            nt.CPointer(input_type.numba_type),
+            nt.CPointer(input_type.numba_type),
+        )
 
-                    else:
+        binary_udf = self._numba_func
+        if cached is not None:
+            binary_wrapper = cached.wrapper(type_ == BOOL, ret_type == BOOL)
+        elif type_ == BOOL:
+            if ret_type == BOOL:
 
-                        def binary_wrapper(z, x, y):
-                            z[0] = binary_udf(bool(x[0]), bool(y[0]))  # pragma: no cover
+                def binary_wrapper(z, x, y):
+                    z[0] = bool(binary_udf(bool(x[0]), bool(y[0])))  # pragma: no cover
 
-                elif ret_type == BOOL:
+            else:
 
-                    def binary_wrapper(z, x, y):
-                        z[0] = bool(binary_udf(x[0], y[0]))  # pragma: no cover
+                def binary_wrapper(z, x, y):
+                    z[0] = binary_udf(bool(x[0]), bool(y[0]))  # pragma: no cover
 
-                else:
+        elif ret_type == BOOL:
 
-                    def binary_wrapper(z, x, y):
-                        z[0] = binary_udf(x[0], y[0])  # pragma: no cover
+            def binary_wrapper(z, x, y):
+                z[0] = bool(binary_udf(x[0], y[0]))  # pragma: no cover
 
-                binary_wrapper = numba.cfunc(wrapper_sig, nopython=True)(binary_wrapper)
-                new_binary = ffi_new("GrB_BinaryOp*")
-                check_status_carg(
-                    lib.GrB_BinaryOp_new(
-                        new_binary,
-                        binary_wrapper.cffi,
-                        ret_type.gb_obj,
-                        type_.gb_obj,
-                        type_.gb_obj,
-                    ),
-                    "BinaryOp",
-                    new_binary,
-                )
-                op = TypedUserBinaryOp(new_type_obj, name, type_, ret_type, new_binary[0])
-                new_type_obj._add(op)
-                success = True
-                return_types[type_] = ret_type
-        if success or is_udt:
-            return new_type_obj
         else:
-            raise UdfParseError("Unable to parse function using Numba")
+
+            def binary_wrapper(z, x, y):
+                z[0] = binary_udf(x[0], y[0])  # pragma: no cover
+
+        binary_wrapper = numba.cfunc(wrapper_sig, nopython=True, cache=cached is not None)(
+            binary_wrapper
+        )
+        new_binary = ffi_new("GrB_BinaryOp*")
+        check_status_carg(
+            lib.GrB_BinaryOp_new(
+                new_binary,
+                binary_wrapper.cffi,
+                ret_type.gb_obj,
+                type_.gb_obj,
+                type_.gb_obj,
+            ),
+            "BinaryOp",
+            new_binary,
+        )
+        return TypedUserBinaryOp(self, self.name, type_, ret_type, new_binary[0])
 
     def _compile_udt(self, dtype, dtype2):
         if dtype2 is None:
@@ -1990,8 +2060,8 @@ class Semiring(OpBase):
         new_type_obj = cls(name, monoid, binaryop, anonymous=anonymous)
         if binaryop._is_udt:
             return new_type_obj
-        for binary_in, binary_func in binaryop._typed_ops.items():
-            binary_out = binary_func.return_type
+        for binary_in, binary_out in binaryop.types.items():
+            binary_func = binaryop._typed_ops[binary_in]
             # Unfortunately, we can't have user-defined monoids over bools yet
             # because numba can't compile correctly.
             if (
@@ -2285,6 +2355,38 @@ class Semiring(OpBase):
 
 
 def get_typed_op(op, dtype, dtype2=None, *, is_left_scalar=False, is_right_scalar=False, kind=None):
+    """Get the typed operator to use for the given op (or op name) and input dtypes.
+
+    This is called for nearly every operation, so results for builtin and registered
+    operators (and their names) are cached.  Anonymous operators are not cached, so
+    they can be freed when they are no longer used.  Use ``get_typed_op.cache_info()``
+    to see cache hits and misses.  The cache is cleared when typed operators are added
+    to or removed from an operator.
+    """
+    if isinstance(op, TypedOpBase):
+        return op
+    if type(op) is str or isinstance(op, OpBase) and not op._anonymous:
+        return _get_typed_op_cached(
+            op,
+            dtype,
+            dtype2,
+            is_left_scalar=is_left_scalar,
+            is_right_scalar=is_right_scalar,
+            kind=kind,
+        )
+    return _get_typed_op(
+        op,
+        dtype,
+        dtype2,
+        is_left_scalar=is_left_scalar,
+        is_right_scalar=is_right_scalar,
+        kind=kind,
+    )
+
+
+def _get_typed_op(
+    op, dtype, dtype2=None, *, is_left_scalar=False, is_right_scalar=False, kind=None
+):
     if isinstance(op, OpBase):
         if op._is_udt:
             return op._compile_udt(dtype, dtype2)
@@ -2310,8 +2412,6 @@ def get_typed_op(op, dtype, dtype2=None, *, is_left_scalar=False, is_right_scala
             is_right_scalar=is_right_scalar,
             kind=kind,
         )
-    elif isinstance(op, TypedOpBase):
-        return op
     elif isinstance(op, Aggregator):
         return op[dtype]
     elif isinstance(op, TypedAggregator):
@@ -2352,6 +2452,11 @@ def get_typed_op(op, dtype, dtype2=None, *, is_left_scalar=False, is_right_scala
         raise TypeError(f"Unable to get typed operator from object with type {type(op)}")
 
 
+_get_typed_op_cached = lru_cache(maxsize=1024)(_get_typed_op)
+get_typed_op.cache_info = _get_typed_op_cached.cache_info
+get_typed_op.cache_clear = _get_typed_op_cached.cache_clear
+
+
 def find_opclass(gb_op):
     if isinstance(gb_op, OpBase):
         opclass = type(gb_op).__name__
@@ -2408,6 +2513,8 @@ def get_semiring(monoid, binaryop, name=None):
     if monoid._anonymous or binaryop._anonymous:
         rv = Semiring.register_anonymous(monoid, binaryop, name=name)
     else:
+        # Make sure builtin semirings exist before we look for them
+        _initialize_semirings()
         *monoid_prefix, monoid_name = monoid.name.rsplit(".", 1)
         *binary_prefix, binary_name = binaryop.name.rsplit(".", 1)
         if (
@@ -2461,12 +2568,30 @@ def get_semiring(monoid, binaryop, name=None):
         return rv
 
 
-# Now initialize all the things!
+def _initialize_semirings():
+    """Initialize the builtin semirings if they haven't been yet.
+
+    There are many more semirings than other operators, so to make importing faster, they
+    are initialized the first time the `semiring` or `op` modules need them.  Returns True
+    if they were initialized by this call.
+    """
+    global _semirings_initializing
+    if Semiring._initialized or _semirings_initializing or not Monoid._initialized:
+        return False
+    _semirings_initializing = True
+    try:
+        Semiring._initialize()
+    finally:
+        _semirings_initializing = False
+    return True
+
+
+# Now initialize all the things (except semirings)!
+_semirings_initializing = False
 try:
     UnaryOp._initialize()
     BinaryOp._initialize()
     Monoid._initialize()
-    Semiring._initialize()
 except Exception:  # pragma: no cover
     # Exceptions here can often get ignored by Python
     import traceback
@@ -0,0 +1,218 @@
+import json
+import os
+import threading
+from collections import deque
+from time import perf_counter_ns
+
+from . import base, ffi, lib
+from .base import _profiler
+from .mask import Mask
+from .matrix import Matrix, TransposedMatrix
+from .recorder import gbstr
+from .scalar import Scalar
+from .utils import _Pointer
+from .vector import Vector
+
+NULL = ffi.NULL
+
+
+def _unwrap(arg):
+    """Get the Matrix, Vector, or GrB_Scalar of an argument, or None"""
+    typ = type(arg)
+    if typ is _Pointer:
+        arg = arg.val
+        typ = type(arg)
+    elif typ is TransposedMatrix:
+        arg = arg._matrix
+        typ = Matrix
+    elif isinstance(arg, Mask):
+        arg = arg.mask
+        typ = type(arg)
+    if typ is Matrix or typ is Vector or typ is Scalar and not arg._is_cscalar:
+        return arg
+    return None
+
+
+def _memory(obj):
+    if obj.gb_obj[0] == NULL:
+        return 0
+    size = ffi.new("size_t*")
+    if type(obj) is Matrix:
+        info = lib.GxB_Matrix_memoryUsage(size, obj.gb_obj[0])
+    elif type(obj) is Vector:
+        info = lib.GxB_Vector_memoryUsage(size, obj.gb_obj[0])
+    else:
+        info = lib.GxB_Scalar_memoryUsage(size, obj.gb_obj[0])
+    return size[0] if info == lib.GrB_SUCCESS else 0
+
+
+def _describe(obj):
+    if obj.gb_obj[0] == NULL:
+        return None
+    info = {"name": gbstr(obj), "shape": list(obj.shape), "nvals": obj._nvals}
+    if type(obj) is not Scalar:
+        info["format"] = obj.ss.format
+    return info
+
+
+class Profiler:
+    """Profile GraphBLAS C calls.
+
+    For each call, the profiler records how long it took, the name, shape,
+    number of values, and format of the output and inputs, and how much the
+    memory used by the output changed (from ``GxB_*_memoryUsage``).  Calls are
+    also aggregated by C function name in ``stats``.
+
+    The profiler can use `.start()` and `.stop()` to enable/disable profiling,
+    or it can be used as a context manager.
+
+    For example,
+
+    >>> with Profiler() as prof:
+    ...     C = A.mxm(B).new()
+    >>> prof.stats["GrB_mxm"]
+    {'calls': 1, 'time': 0.0012, 'max_time': 0.0012, 'memory_delta': 2048}
+    >>> prof.to_chrome_trace("trace.json")
+
+    Save the profile with ``to_chrome_trace`` to view it as a timeline in
+    ``chrome://tracing``, Perfetto, or speedscope.
+
+    Getting the number of values of inputs and outputs completes pending work,
+    so profiling is most accurate in blocking mode, ``grblas.init(blocking=True)``.
+    Use ``max_events`` to keep only that many of the most recent calls in
+    ``events``; all calls are always counted in ``stats``.
+
+    Currently, only one profiler will profile at a time within a context.
+    """
+
+    __slots__ = "events", "stats", "_token", "_start_time", "__weakref__"
+
+    def __init__(self, *, start=True, max_events=None):
+        self.events = deque(maxlen=max_events)
+        self.stats = {}
+        self._token = None
+        self._start_time = perf_counter_ns()
+        if start:
+            self.start()
+
+    def start(self):
+        base._profiler_started = True
+        if self._token is None:
+            self._token = _profiler.set(self)
+
+    def stop(self):
+        if self._token is not None:
+            _profiler.reset(self._token)
+            self._token = None
+
+    def clear(self):
+        self.events.clear()
+        self.stats.clear()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, type_, value, traceback):
+        self.stop()
+
+    @property
+    def is_profiling(self):
+        return self._token is not None and _profiler.get(None) is self
+
+    def _before(self, args):
+        """Called by `base.call` before calling a C function"""
+        output = _unwrap(args[0]) if args else None
+        memory = None if output is None else _memory(output)
+        return output, memory, perf_counter_ns()
+
+    def _after(self, cfunc_name, args, state):
+        """Called by `base.call` after calling a C function"""
+        end = perf_counter_ns()
+        output, memory, start = state
+        elapsed = end - start
+        if output is None:
+            output_info = memory_delta = None
+        else:
+            output_info = _describe(output)
+            memory_delta = _memory(output) - memory
+        inputs = []
+        for arg in args[1:]:
+            arg = _unwrap(arg)
+            if arg is not None and arg is not output:
+                info = _describe(arg)
+                if info is not None:
+                    inputs.append(info)
+        self.events.append(
+            {
+                "name": cfunc_name,
+                "start": (start - self._start_time) / 1e9,
+                "time": elapsed / 1e9,
+                "thread": threading.get_ident(),
+                "output": output_info,
+                "inputs": inputs,
+                "memory_delta": memory_delta,
+            }
+        )
+        stats = self.stats.get(cfunc_name)
+        if stats is None:
+            stats = self.stats[cfunc_name] = {
+                "calls": 0,
+                "time": 0.0,
+                "max_time": 0.0,
+                "memory_delta": 0,
+            }
+        stats["calls"] += 1
+        stats["time"] += elapsed / 1e9
+        stats["max_time"] = max(stats["max_time"], elapsed / 1e9)
+        if memory_delta is not None:
+            stats["memory_delta"] += memory_delta
+
+    def to_chrome_trace(self, path=None):
+        """Get the recorded calls in the Chrome trace event format.
+
+        The trace is written as JSON to ``path`` if given.
+        """
+        pid = os.getpid()
+        events = []
+        for event in self.events:
+            args = {"inputs": event["inputs"]}
+            if event["output"] is not None:
+                args["output"] = event["output"]
+                args["memory_delta"] = event["memory_delta"]
+            events.append(
+                {
+                    "name": event["name"],
+                    "cat": "grblas",
+                    "ph": "X",
+                    "ts": event["start"] * 1e6,
+                    "dur": event["time"] * 1e6,
+                    "pid": pid,
+                    "tid": event["thread"],
+                    "args": args,
+                }
+            )
+        trace = {"traceEvents": events, "displayTimeUnit": "ms"}
+        if path is not None:
+            with open(path, "w") as f:
+                json.dump(trace, f)
+        return trace
+
+    def __repr__(self):
+        lines = [
+            f'grblas.Profiler ({"" if self.is_profiling else "not "}profiling, '
+            f"{sum(stats['calls'] for stats in self.stats.values())} calls)"
+        ]
+        lines.append("-" * len(lines[0]))
+        if self.stats:
+            width = max(len(name) for name in self.stats)
+            lines.append(
+                f"  {'':{width}}  {'calls':>8}  {'time (s)':>10}  {'max (s)':>10}  "
+                f"{'memory (bytes)':>14}"
+            )
+            for name, stats in sorted(self.stats.items(), key=lambda x: -x[1]["time"]):
+                lines.append(
+                    f"  {name:{width}}  {stats['calls']:>8}  {stats['time']:>10.6f}  "
+                    f"{stats['max_time']:>10.6f}  {stats['memory_delta']:>14}"
+                )
+        return "\n".join(lines)
@@ -1,12 +1,19 @@
 import collections
+import gc
+import weakref
 
-from . import base, lib
+from . import base, ffi, lib
 from .base import _recorder
 from .dtypes import DataType
+from .exceptions import DimensionMismatch, _error_code_lookup
 from .mask import Mask
-from .matrix import TransposedMatrix
+from .matrix import Matrix, TransposedMatrix
 from .operator import TypedOpBase
 from .scalar import Scalar
+from .utils import _Pointer, libget
+from .vector import Vector
+
+NULL = ffi.NULL
 
 
 def gbstr(arg):
@@ -32,6 +39,265 @@ def gbstr(arg):
     return name
 
 
+# Kinds of arguments of instructions in a `Program`
+_OBJECT = 0  # the handle of an object, such as `GrB_Matrix`
+_HANDLE = 1  # a pointer to the handle of an object that is created, such as `GrB_Matrix*`
+_CONSTANT = 2  # any other argument, which is passed as recorded
+
+
+def _unwrap(arg):
+    """Get the Matrix, Vector, or GrB_Scalar of an argument, or None"""
+    typ = type(arg)
+    if typ is _Pointer:
+        arg = arg.val
+        typ = type(arg)
+    elif typ is TransposedMatrix:
+        return arg._matrix
+    elif isinstance(arg, Mask):
+        arg = arg.mask
+        typ = type(arg)
+    if typ is Matrix or typ is Vector or typ is Scalar and not arg._is_cscalar:
+        return arg
+    return None
+
+
+def _read_shape(obj, handle):
+    """Set the cached shape of a Matrix or Vector from its GraphBLAS object"""
+    n = ffi.new("GrB_Index*")
+    if type(obj) is Matrix:
+        lib.GrB_Matrix_nrows(n, handle[0])
+        obj._nrows = n[0]
+        lib.GrB_Matrix_ncols(n, handle[0])
+        obj._ncols = n[0]
+    elif type(obj) is Vector:
+        lib.GrB_Vector_size(n, handle[0])
+        obj._size = n[0]
+
+
+class _Slot:
+    """An object used by a `Program`"""
+
+    __slots__ = "type", "dtype", "name", "shape", "ref", "is_created"
+
+    def __init__(self, obj, is_created):
+        self.type = type(obj)
+        self.dtype = obj.dtype
+        self.name = obj.name
+        self.shape = None if is_created else obj.shape
+        self.ref = weakref.ref(obj)
+        self.is_created = is_created
+
+    @property
+    def ctype(self):
+        return "GrB_Scalar" if self.type is Scalar else f"GrB_{self.type.__name__}"
+
+
+class Program:
+    """A sequence of GraphBLAS C calls recorded by ``Recorder(replayable=True)``.
+
+    Replaying a program makes the same C calls again without creating Matrix,
+    Vector, or expression objects in Python, which is useful to repeat a step
+    of an iterative algorithm quickly.
+
+    Objects that existed before recording are inputs of the program.  They can
+    be replaced when replaying by passing new objects with the same type, dtype,
+    and shape by name, such as ``program.replay(A=B)``; by default, the original
+    objects are used (and updated in place).  Objects that were created while
+    recording are created again each time the program is replayed.  Those that
+    still existed when the program was made are outputs, which are returned as
+    a dict by name from ``replay``; the others are freed.  The names of inputs
+    and the names of outputs must be unique.
+
+    Other arguments, such as Python scalars and arrays, are passed exactly as
+    they were recorded, so changing them in Python doesn't change the program.
+    Calls that move data between numpy arrays and the C library, such as
+    ``ss.import_*``, ``ss.export``, ``ss.pack_*``, and ``ss.unpack``, are only
+    recorded as text, and programs that use them can't be made.
+
+    >>> with Recorder(replayable=True) as rec:
+    ...     r << A.mxv(r)
+    >>> program = rec.program
+    >>> for i in range(10):
+    ...     program.replay()
+
+    """
+
+    __slots__ = "_slots", "_instructions", "_ids", "_outputs", "_raw"
+
+    def __init__(self):
+        self._slots = []
+        self._instructions = []
+        self._ids = {}
+        self._outputs = []
+        # Text of calls that can't be replayed
+        self._raw = []
+
+    def _get_slot(self, obj, is_created):
+        index = self._ids.get(id(obj))
+        # Object ids may be reused after objects are deleted
+        if index is None or is_created or self._slots[index].ref() is not obj:
+            index = self._ids[id(obj)] = len(self._slots)
+            self._slots.append(_Slot(obj, is_created))
+        return index
+
+    def _record(self, cfunc_name, args):
+        is_created = cfunc_name.endswith(("_new", "_dup"))
+        specs = []
+        for arg in args:
+            obj = _unwrap(arg)
+            if obj is None:
+                carg = NULL if arg is None else getattr(arg, "_carg", arg)
+                # Keep the argument alive, since `carg` may point to memory it owns
+                specs.append((_CONSTANT, carg, arg))
+            elif type(arg) is _Pointer:
+                specs.append((_HANDLE, self._get_slot(obj, is_created), None))
+            else:
+                specs.append((_OBJECT, self._get_slot(obj, False), None))
+        self._instructions.append((cfunc_name, libget(cfunc_name), specs))
+
+    def _snapshot(self):
+        """Copy the program recorded so far, with objects that still exist as outputs"""
+        if self._raw:
+            raise ValueError(
+                "The recorded calls can't be replayed, because they include calls made "
+                f"directly to the C library: {self._raw}"
+            )
+        # Matrix and Vector objects are in reference cycles (through `.ss`),
+        # so collect garbage to know which objects still exist.
+        gc.collect()
+        rv = Program()
+        rv._slots = list(self._slots)
+        rv._instructions = list(self._instructions)
+        rv._outputs = [
+            index
+            for index, slot in enumerate(self._slots)
+            if slot.is_created and slot.ref() is not None
+        ]
+        # Inputs are given to `replay` by name, and outputs are returned by name
+        input_names = [slot.name for slot in rv._slots if not slot.is_created]
+        for kind, names in [("inputs", input_names), ("outputs", rv.outputs)]:
+            dups = sorted(name for name, count in collections.Counter(names).items() if count > 1)
+            if dups:
+                raise ValueError(
+                    f"The recorded program has {kind} with the same name: {dups}.  "
+                    "Give them unique names before recording."
+                )
+        return rv
+
+    @property
+    def inputs(self):
+        """Dict of the names of inputs to the original objects (or None if deleted)"""
+        return {slot.name: slot.ref() for slot in self._slots if not slot.is_created}
+
+    @property
+    def outputs(self):
+        """List of the names of outputs returned by ``replay``"""
+        return [self._slots[index].name for index in self._outputs]
+
+    def __len__(self):
+        return len(self._instructions)
+
+    def __repr__(self):
+        return (
+            f"grblas.recorder.Program ({len(self)} calls, inputs: {list(self.inputs)}, "
+            f"outputs: {self.outputs})"
+        )
+
+    def _bind(self, slot, obj):
+        if type(obj) is not slot.type or slot.type is Scalar and obj._is_cscalar:
+            raise TypeError(
+                f"Input {slot.name!r} must be a {slot.type.__name__}; got {type(obj).__name__}"
+            )
+        if obj.dtype != slot.dtype:
+            raise TypeError(f"Input {slot.name!r} must have dtype {slot.dtype}; got {obj.dtype}")
+        if obj.shape != slot.shape:
+            raise DimensionMismatch(
+                f"Input {slot.name!r} must have shape {slot.shape}; got {obj.shape}"
+            )
+        return obj.gb_obj
+
+    def replay(self, **inputs):
+        """Make the recorded C calls again and return the outputs as a dict by name.
+
+        Objects given by name replace the inputs of the same name.
+        """
+        unknown = inputs.keys() - {slot.name for slot in self._slots if not slot.is_created}
+        if unknown:
+            raise TypeError(f"Unknown inputs: {sorted(unknown)}.  Inputs are: {list(self.inputs)}")
+        handles = []
+        for slot in self._slots:
+            if slot.is_created:
+                handles.append(ffi.new(f"{slot.ctype}*"))
+            elif slot.name in inputs:
+                handles.append(self._bind(slot, inputs[slot.name]))
+            else:
+                obj = slot.ref()
+                if obj is None:
+                    raise ValueError(
+                        f"Input {slot.name!r} has been deleted, so it must be given to replay"
+                    )
+                handles.append(self._bind(slot, obj))
+        outputs = self._outputs
+        # Inputs that are written to, which may be changed even if replaying fails
+        written = {
+            specs[0][1]: handles[specs[0][1]]
+            for _, _, specs in self._instructions
+            if specs and specs[0][0] == _OBJECT and not self._slots[specs[0][1]].is_created
+        }
+        try:
+            for cfunc_name, cfunc, specs in self._instructions:
+                info = cfunc(
+                    *[
+                        handles[val][0]
+                        if kind == _OBJECT
+                        else handles[val]
+                        if kind == _HANDLE
+                        else val
+                        for kind, val, _ in specs
+                    ]
+                )
+                if info != lib.GrB_SUCCESS and info != lib.GrB_NO_VALUE:
+                    raise _error_code_lookup[info](f"Error replaying {cfunc_name}")
+        except Exception:
+            outputs = []
+            raise
+        finally:
+            for index, slot in enumerate(self._slots):
+                if slot.is_created and index not in outputs and handles[index][0] != NULL:
+                    libget(f"{slot.ctype}_free")(handles[index])
+            for index, handle in written.items():
+                slot = self._slots[index]
+                obj = inputs[slot.name] if slot.name in inputs else slot.ref()
+                # Invalidate cached results (see `ExpressionCache`) and update the shape,
+                # which may have been changed in C such as by `GrB_Matrix_resize`.
+                obj._version += 1
+                _read_shape(obj, handle)
+        return {self._slots[index].name: self._wrap(index, handles[index]) for index in outputs}
+
+    def to_c(self, name="grblas_program", *, header="GraphBLAS.h"):
+        """Get the program as the source code of a C function.
+
+        The function is named ``name`` and returns ``GrB_Info``.  Inputs are passed
+        as handles, such as ``GrB_Matrix A``, followed by pointers for the outputs,
+        such as ``GrB_Matrix *C``, in the order of ``inputs`` and ``outputs``.
+        Outputs are created by the function and must be freed by the caller.  If
+        the function returns an error, the outputs are freed and set to NULL.
+
+        User-defined types and operators and complex values can't be exported.
+        """
+        from ._csource import to_c
+
+        return to_c(self, name, header)
+
+    def _wrap(self, index, handle):
+        slot = self._slots[index]
+        if slot.type is Scalar:
+            return Scalar(handle, slot.dtype, name=slot.name)
+        rv = slot.type(handle, slot.dtype, name=slot.name)
+        _read_shape(rv, handle)
+        return rv
+
+
 class Recorder:
     """Record GraphBLAS C calls.
 
@@ -48,13 +314,14 @@ class Recorder:
     Currently, only one recorder will record at a time within a context.
     """
 
-    __slots__ = "data", "_token", "max_rows", "_prev_recorder", "__weakref__"
+    __slots__ = "data", "_token", "max_rows", "_prev_recorder", "_program", "__weakref__"
 
-    def __init__(self, *, start=True, max_rows=20):
+    def __init__(self, *, start=True, max_rows=20, replayable=False):
         self.data = []
         self._token = None
         self._prev_recorder = None
         self.max_rows = max_rows
+        self._program = Program() if replayable else None
         if start:
             self.start()
 
@@ -64,14 +331,32 @@ class Recorder:
         val = f'{cfunc_name}({", ".join(gbstr(x) for x in args)});'
         if exc is not None:
             val += f" /* ERROR: {type(exc).__name__} */"
+        elif self._program is not None:
+            self._program._record(cfunc_name, args)
         self.data.append(val)
         base._prev_recorder = self
 
     def record_raw(self, text):
+        if self._program is not None:
+            self._program._raw.append(text)
         self.data.append(text)
         base._prev_recorder = self
 
+    @property
+    def program(self):
+        """The calls recorded so far as a `Program` that can be replayed.
+
+        This requires ``Recorder(replayable=True)``.
+        """
+        if self._program is None:
+            raise ValueError(
+                "Use `Recorder(replayable=True)` to record a program that can be replayed"
+            )
+        return self._program._snapshot()
+
     def start(self):
+        if self is not skip_record:
+            base._recorder_started = True
         if self._token is None:
             self._prev_recorder = _recorder.get(base._prev_recorder)
             self._token = _recorder.set(self)
@@ -87,6 +372,8 @@ class Recorder:
 
     def clear(self):
         self.data.clear()
+        if self._program is not None:
+            self._program = Program()
 
     def __enter__(self):
         self.start()
@@ -207,6 +207,7 @@ class Scalar(BaseType):
     def clear(self):
         if self._is_empty:
             return
+        self._version += 1
         if self._is_cscalar:
             self._empty = True
         else:
@@ -248,6 +249,7 @@ class Scalar(BaseType):
 
     @value.setter
     def value(self, val):
+        self._version += 1
         if val is None or output_type(val) is Scalar and val._is_empty:
             self.clear()
         elif self._is_cscalar:
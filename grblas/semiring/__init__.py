@@ -1,17 +1,19 @@
 # All items are dynamically added by classes in operator.py
 # This module acts as a container of Semiring instances
 _delayed = {}
-from grblas import operator  # noqa isort:skip
+from grblas import operator as _operator  # noqa isort:skip
 from . import numpy  # noqa isort:skip
 
-del operator
-
 
 def __dir__():
+    _operator._initialize_semirings()
     return globals().keys() | _delayed.keys()
 
 
 def __getattr__(key):
+    if _operator._initialize_semirings() and key in globals():
+        # Builtin semirings are initialized when first needed
+        return globals()[key]
     if key in _delayed:
         func, kwargs = _delayed.pop(key)
         if type(kwargs["binaryop"]) is str:
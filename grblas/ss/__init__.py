@@ -1 +1,2 @@
+from .._ss.config import config  # noqa
 from ._core import concat, diag  # noqa
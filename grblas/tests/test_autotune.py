@@ -0,0 +1,83 @@
+import json
+
+import pytest
+
+from grblas import Matrix, Recorder, Vector, binary, semiring
+from grblas.autotune import Autotuner, default_path
+
+
+@pytest.fixture
+def A():
+    return Matrix.from_values([0, 0, 1, 2], [1, 2, 2, 0], [1, 2, 3, 4], nrows=3, ncols=3, name="A")
+
+
+@pytest.fixture
+def v():
+    return Vector.from_values([0, 2], [5, 6], size=3, name="v")
+
+
+def test_autotune(A, v, tmp_path):
+    path = tmp_path / "autotune.json"
+    expected = A.mxm(A.T).new()
+    expected_mxv = A.mxv(v).new(mask=v.S)
+    expected_vxm = v.vxm(A, semiring.min_plus).new()
+    with Autotuner(path) as tuner:
+        assert tuner.is_tuning
+        with Recorder() as rec:
+            for _ in range(3):
+                C = Matrix.new(A.dtype, 3, 3)
+                C << A.mxm(A.T)
+                assert C.isequal(expected)
+        assert tuner.misses == 1
+        assert tuner.hits == 2
+        [(key, method)] = tuner.decisions.items()
+        assert key.startswith("mxm;plus_times;INT64;")
+        assert method in {"gustavson", "hash", "saxpy", "dot"}
+        # Trial computations are not recorded
+        assert len([line for line in rec if line.startswith("GrB_mxm")]) == 3
+        # Vectors, masks, and accumulators
+        w = Vector.new(A.dtype, 3)
+        w(v.S, binary.plus) << A.mxv(v)
+        assert w.isequal(expected_mxv)
+        w << v.vxm(A, semiring.min_plus)
+        assert w.isequal(expected_vxm)
+        assert tuner.misses == 3
+        # Not tuned
+        C(axb_method="dot") << A.mxm(A)
+        C << A.ewise_mult(A)
+        assert tuner.misses == 3
+        assert len(tuner.decisions) == 3
+    assert not tuner.is_tuning
+    assert "not tuning, 3 decisions" in repr(tuner)
+    C << A.mxm(A.T)
+    assert tuner.hits == 2
+    with open(path) as f:
+        assert json.load(f)["decisions"] == tuner.decisions
+
+    # Decisions are loaded from disk
+    tuner2 = Autotuner(path, start=False)
+    assert tuner2.decisions == tuner.decisions
+    with tuner2:
+        C = Matrix.new(A.dtype, 3, 3)
+        C << A.mxm(A.T)
+    assert tuner2.hits == 1
+    assert tuner2.misses == 0
+    tuner2.clear()
+    assert not tuner2.decisions
+
+    tuner3 = Autotuner(False, methods=["dot"], repeat=2)
+    assert tuner3.path is False
+    assert tuner3.is_tuning
+    C = Matrix.new(A.dtype, 3, 3)
+    C << A.mxm(A.T)
+    assert tuner3.decisions == {next(iter(tuner.decisions)): "dot"}
+    tuner3.stop()
+    assert not (tmp_path / "missing").exists()
+    assert Autotuner(tmp_path / "missing", start=False).decisions == {}
+    with pytest.raises(ValueError, match="methods must not be empty"):
+        Autotuner(False, methods=[])
+
+
+def test_default_path(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert default_path() == str(tmp_path / "grblas" / "autotune.json")
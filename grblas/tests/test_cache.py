@@ -0,0 +1,121 @@
+import pytest
+
+import grblas as gb
+from grblas import ExpressionCache, Matrix, Recorder, Vector, agg, binary, unary
+
+
+@pytest.fixture
+def A():
+    return Matrix.from_values([0, 0, 1, 2], [1, 2, 2, 0], [1, 2, 3, 4], nrows=3, ncols=3, name="A")
+
+
+@pytest.fixture
+def v():
+    return Vector.from_values([0, 2], [5, 6], size=3, name="v")
+
+
+def test_cache(A, v):
+    with ExpressionCache() as cache:
+        assert cache.is_caching
+        with Recorder() as rec:
+            for _ in range(5):
+                AT = A.T.new()
+                w = A.mxv(v).new()
+                d = A.reduce_rowwise(agg.count).new()
+        assert cache.hits == 12
+        assert cache.misses == 3
+        assert len(cache) == 3
+        assert 0 < cache.nbytes <= cache.max_nbytes
+        assert [line for line in rec if line.startswith("GrB_mxv")] == [
+            "GrB_mxv(v_0, NULL, NULL, GrB_PLUS_TIMES_SEMIRING_INT64, A, v, NULL);",
+            "GrB_mxv(v_1, NULL, NULL, GxB_PLUS_PAIR_INT64, A, v_2, NULL);",  # agg.count
+        ]
+        assert AT.isequal(A.T.new())
+        assert w.isequal(A.mxv(v).new())
+        assert d.isequal(A.reduce_rowwise(agg.count).new())
+        # Results are copies
+        AT[0, 0] = 100
+        assert A.T.new().isequal(Matrix.from_values([1, 2, 2, 0], [0, 0, 1, 2], [1, 2, 3, 4]))
+    assert not cache.is_caching
+    hits = cache.hits
+    A.T.new()
+    assert cache.hits == hits
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.nbytes == 0
+    assert "not caching" in repr(cache)
+
+
+def test_cache_mutation(A, v):
+    with ExpressionCache() as cache:
+        B = A.ewise_mult(A, binary.plus).new()
+        A[0, 0] = 10
+        C = A.ewise_mult(A, binary.plus).new()
+        assert cache.hits == 0
+        assert C[0, 0].new() == 20
+        assert not C.isequal(B)
+        w = A.mxv(v).new()
+        v << v.apply(unary.ainv)
+        assert A.mxv(v).new().isequal(w.apply(unary.ainv).new())
+        del A[0, 0]
+        A(A.S) << A.apply(binary.times, 2)  # masked, so not cached
+        assert A.ewise_mult(A, binary.plus).new().isequal(B.apply(binary.times, 2).new())
+        A.clear()
+        assert A.T.new().nvals == 0
+        assert cache.hits == 0
+        # Self-referential updates are not cached
+        B << B.T
+        B << B.T
+        assert B.isequal(A.ewise_add(B).new().T.new().T.new())
+        assert cache.hits == 0
+        # Literal scalars are compared by value
+        x = v.apply(binary.plus, right=1).new()
+        y = v.apply(binary.plus, right=2).new()
+        assert not x.isequal(y)
+        assert v.apply(binary.plus, right=1).new().isequal(x)
+        assert cache.hits == 1
+
+
+def test_cache_readonly_export(A):
+    with ExpressionCache() as cache:
+        B = A.T.new()
+        A.to_values()
+        A.ss.export("coo")
+        A.ss.export("csr")
+        assert A.T.new().isequal(B)
+        assert cache.hits == 1
+        A.ss.unpack("coo")
+        assert A.T.new().nvals == 0
+        assert cache.hits == 1
+
+
+def test_cache_eviction(A):
+    with ExpressionCache(max_nbytes=0) as cache:
+        A.T.new()
+        A.T.new()
+        assert len(cache) == 0
+        assert cache.hits == 0
+    nbytes = A.T.new().ss.nbytes
+    with ExpressionCache(max_nbytes=2 * nbytes) as cache:
+        A.T.new()
+        A.apply(unary.ainv).new()
+        A.T.new()  # move to end
+        A.apply(unary.abs).new()  # evicts ainv
+        assert len(cache) == 2
+        assert cache.nbytes <= 2 * nbytes
+        hits = cache.hits
+        A.T.new()
+        assert cache.hits == hits + 1
+        A.apply(unary.ainv).new()
+        assert cache.hits == hits + 1
+
+
+def test_cache_deleted_argument():
+    with ExpressionCache() as cache:
+        for _ in range(3):
+            B = Matrix.from_values([0], [1], [1], nrows=2, ncols=2)
+            C = B.T.new()
+            assert C.isequal(Matrix.from_values([1], [0], [1], nrows=2, ncols=2))
+            del B
+        assert cache.hits == 0
+    assert gb.ExpressionCache is ExpressionCache
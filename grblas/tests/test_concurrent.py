@@ -0,0 +1,38 @@
+import pytest
+
+import grblas as gb
+from grblas import Matrix, Vector, binary
+from grblas.concurrent import Executor
+
+
+@pytest.fixture
+def A():
+    return Matrix.from_values([0, 0, 1, 2], [1, 2, 2, 0], [1, 2, 3, 4], nrows=3, ncols=3, name="A")
+
+
+def test_executor(A):
+    vectors = [Vector.from_values([i], [i + 1], size=3) for i in range(3)]
+
+    def get_exprs():
+        return [A.mxv(v) for v in vectors] + [A @ A.T, A.T.ewise_mult(A, binary.plus), A[0, :]]
+
+    expected = [expr.new() for expr in get_exprs()]
+    with Executor(2) as executor:
+        results = executor.compute(get_exprs())
+        assert len(results) == len(expected)
+        for result, val in zip(results, expected):
+            assert result.isequal(val, check_dtype=True)
+        future = executor.submit(A.mxm(A), float, mask=A.S, name="B")
+        B = future.result()
+        assert B.name == "B"
+        assert B.isequal(A.mxm(A).new(float, mask=A.S), check_dtype=True)
+        with pytest.raises(TypeError, match="Expected an expression"):
+            executor.submit(A)
+
+
+def test_executor_nthreads(A):
+    nthreads = gb.ss.config["nthreads"]
+    with Executor(nthreads=nthreads + 1) as executor:
+        assert gb.ss.config["nthreads"] == nthreads + 1
+        assert executor.compute([A.mxm(A)])[0].isequal(A.mxm(A).new())
+    assert gb.ss.config["nthreads"] == nthreads
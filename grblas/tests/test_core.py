@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 import pytest
 
 import grblas
@@ -47,3 +50,23 @@ def test_bad_call():
         TypeError, match=r"Call objects: GrB_Matrix_apply\(bad, bad, bad, bad, bad, bad\)"
     ):
         grblas.base.call("GrB_Matrix_apply", [bad, bad, bad, bad, bad, bad])
+
+
+def test_semirings_initialized_lazily():
+    # Semirings are only created when needed to make importing faster
+    code = (
+        "import grblas\n"
+        "from grblas import Matrix, Vector, agg, binary, monoid, unary\n"
+        "assert not grblas.operator.Semiring._initialized\n"
+        "v = Vector.from_values([0, 1], [1, 2])\n"
+        "assert v.reduce(agg.count).new() == 2\n"
+        "assert grblas.operator.Semiring._initialized\n"
+        "assert grblas.op.plus_times is grblas.semiring.plus_times\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+    code = (
+        "import grblas\n"
+        "from grblas.operator import semiring_from_string\n"
+        "assert semiring_from_string('+.*') is grblas.semiring.plus_times\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
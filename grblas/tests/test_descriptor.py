@@ -1,3 +1,5 @@
+import pytest
+
 from grblas import descriptor, lib
 
 
@@ -22,3 +24,23 @@ def test_null_desc():
     """
     default = descriptor.lookup()
     assert default is None
+
+
+def test_extensions():
+    desc = descriptor.lookup(transpose_first=True, nthreads=2, axb_method="dot")
+    assert desc is descriptor.lookup(axb_method="dot", nthreads=2, transpose_first=True, sort=None)
+    assert desc.transpose_first
+    assert desc.extensions == {"axb_method": "dot", "nthreads": 2}
+    assert desc.name == "GrB_DESC_T0_axb_method_dot_nthreads_2"
+    assert desc.gb_obj != lib.GrB_DESC_T0
+    assert descriptor.lookup(transpose_first=True, nthreads=None) is descriptor.lookup(
+        transpose_first=True
+    )
+    desc = descriptor.lookup(chunk=1e6, sort=True)
+    assert desc.name == "GrB_DESC_chunk_1000000.0_sort_True"
+    with pytest.raises(TypeError, match="Unknown descriptor option"):
+        descriptor.lookup(bad_option=1)
+    with pytest.raises(ValueError, match="axb_method must be one of"):
+        descriptor.lookup(axb_method="bad")
+    with pytest.raises(ValueError, match="nthreads must be non-negative"):
+        descriptor.lookup(nthreads=-1)
@@ -124,7 +124,8 @@ def test_matrix_to_from_networkx():
 
 
 @pytest.mark.skipif("not ss")
-def test_mmread_mmwrite():
+@pytest.mark.parametrize("engine", ["native", "scipy"])
+def test_mmread_mmwrite(engine):
     from scipy.io.tests import test_mmio
 
     p31 = 2**31
@@ -222,9 +223,9 @@ def test_mmread_mmwrite():
         mm_in = StringIO(getattr(test_mmio, example))
         if over64:
             with pytest.raises(OverflowError):
-                M = gb.io.mmread(mm_in)
+                M = gb.io.mmread(mm_in, engine=engine)
         else:
-            M = gb.io.mmread(mm_in)
+            M = gb.io.mmread(mm_in, engine=engine)
             if not M.isequal(expected):  # pragma: no cover
                 print(example)
                 print("Expected:")
@@ -233,12 +234,12 @@ def test_mmread_mmwrite():
                 print(M)
                 raise AssertionError("Matrix M not as expected.  See print output above")
             mm_out = BytesIO()
-            gb.io.mmwrite(mm_out, M)
+            gb.io.mmwrite(mm_out, M, engine=engine)
             mm_out.flush()
             mm_out.seek(0)
             mm_out_str = b"".join(mm_out.readlines()).decode()
             mm_out.seek(0)
-            M2 = gb.io.mmread(mm_out)
+            M2 = gb.io.mmread(mm_out, engine=engine)
             if not M2.isequal(expected):  # pragma: no cover
                 print(example)
                 print("Expected:")
@@ -279,3 +280,227 @@ def test_matrix_market_sparse_duplicates():
     a = gb.io.mmread(mm, dup_op=gb.binary.plus)
     expected = gb.Matrix.from_values([0, 1, 2], [2, 1, 0], [1, 2, 7])
     assert a.isequal(expected)
+
+
+def test_mmread_native():
+    mm = StringIO(
+        """%%MatrixMarket matrix coordinate pattern symmetric
+        % comment
+
+        3 3 3
+        2 1
+        3 1
+        3 3
+        """
+    )
+    M = gb.io.mmread(mm, name="M")
+    assert M.name == "M"
+    assert M.ss.is_iso
+    expected = Matrix.from_values([1, 2, 0, 0, 2], [0, 0, 1, 2, 2], 1.0)
+    assert M.isequal(expected, check_dtype=True)
+    mm = BytesIO(b"%%MatrixMarket matrix array complex hermitian\n2 2\n1 0\n2 -3\n4 0\n")
+    M = gb.io.mmread(mm)
+    expected = Matrix.from_values([0, 0, 1, 1], [0, 1, 0, 1], [1, 2 + 3j, 2 - 3j, 4])
+    assert M.isequal(expected, check_dtype=True)
+    mm = StringIO("%%MatrixMarket matrix array integer skew-symmetric\n3 3\n-1\n2\n3\n")
+    M = gb.io.mmread(mm)
+    expected = Matrix.from_values(
+        [0, 0, 0, 1, 1, 1, 2, 2, 2], [0, 1, 2, 0, 1, 2, 0, 1, 2], [0, 1, -2, -1, 0, -3, 2, 3, 0]
+    )
+    assert M.isequal(expected, check_dtype=True)
+    # Floats are parsed exactly; some are parsed by numba, and others by numpy
+    values = np.array([0.1, 1 / 3, -2.5e-310, 1.7976931348623157e308, 123456789e-300, 7e22])
+    text = "\n".join(f"{i} 1 {x}" for i, x in enumerate([*map(repr, values), "-inf"], 1))
+    mm = StringIO(f"%%MatrixMarket matrix coordinate real general\n7 1 7\n{text}\n")
+    M = gb.io.mmread(mm)
+    np.testing.assert_array_equal(M.to_values()[2], [*values, -np.inf])
+    # Unsigned integers are read as UINT64
+    A = Matrix.from_values([0, 1], [1, 0], [2**64 - 1, 5], dtype="UINT64")
+    f = StringIO()
+    gb.io.mmwrite(f, A)
+    assert f.getvalue().startswith("%%MatrixMarket matrix coordinate unsigned-integer general\n")
+    f.seek(0)
+    assert gb.io.mmread(f).isequal(A, check_dtype=True)
+    mm = StringIO(
+        "%%MatrixMarket matrix array unsigned-integer general\n2 1\n18446744073709551615\n3\n"
+    )
+    M = gb.io.mmread(mm)
+    expected = Matrix.from_values([0, 1], [0, 0], [2**64 - 1, 3], dtype="UINT64")
+    assert M.isequal(expected, check_dtype=True)
+    # Errors
+    for text, error, match in [
+        ("%%MatrixMarket vector coordinate real general\n", ValueError, "header"),
+        ("%%MatrixMarket matrix sparse real general\n", ValueError, "format"),
+        ("%%MatrixMarket matrix array pattern general\n", ValueError, "field"),
+        ("%%MatrixMarket matrix array real upper\n", ValueError, "symmetry"),
+        ("%%MatrixMarket matrix array real general\n% comment\n", ValueError, "size line"),
+        ("%%MatrixMarket matrix array real symmetric\n2 3\n", ValueError, "square"),
+        ("%%MatrixMarket matrix coordinate real general\n2 2\n", ValueError, "size line"),
+        ("%%MatrixMarket matrix coordinate real general\n2 2 2\n1 1 1\n", ValueError, "1 entries"),
+        ("%%MatrixMarket matrix coordinate real general\n2 2 1\n1 1\n", ValueError, "fewer"),
+        ("%%MatrixMarket matrix coordinate real general\n2 2 1\n1 1.0 1\n", ValueError, "integer"),
+        ("%%MatrixMarket matrix coordinate real general\n2 2 1\n1 1 x\n", ValueError, "float"),
+        ("%%MatrixMarket matrix array unsigned-integer general\n1 1\n-1\n", ValueError, "integer"),
+        ("%%MatrixMarket matrix array unsigned-integer general\n1 1\n1e1\n", ValueError, "integer"),
+        (
+            "%%MatrixMarket matrix array unsigned-integer general\n1 1\n18446744073709551616\n",
+            OverflowError,
+            "64 bits",
+        ),
+        ("%%MatrixMarket matrix array real general\n2 2\n1\n", ValueError, "4 entries"),
+        ("%%MatrixMarket matrix array real symmetric\n2 2\n1\n", ValueError, "3 entries"),
+    ]:
+        with pytest.raises(error, match=match):
+            gb.io.mmread(StringIO(text))
+    with pytest.raises(ValueError, match="engine"):
+        gb.io.mmread(StringIO(text), engine="bad")
+
+
+def test_mmread_chunks(monkeypatch):
+    import numba
+
+    # Read in several blocks that are each parsed in several chunks
+    monkeypatch.setattr(gb.io, "_MM_BLOCKSIZE", 2**17)
+    monkeypatch.setattr(numba, "get_num_threads", lambda: 5)
+    rng = np.random.default_rng(0)
+    A = Matrix.from_values(
+        rng.integers(0, 1000, 20000),
+        rng.integers(0, 1000, 20000),
+        rng.random(20000),
+        dup_op=gb.binary.plus,
+    )
+    f = BytesIO()
+    gb.io.mmwrite(f, A, symmetry="general")
+    f.seek(0)
+    B = gb.io.mmread(f)
+    assert B.isequal(A, check_dtype=True)
+
+
+@pytest.mark.skipif("not ss")
+def test_mmwrite_precision():
+    # precision is the number of significant digits for both engines
+    A = Matrix.from_values([0, 1, 2], [1, 0, 2], [1 / 3, 2 / 3, 1 + 1 / 7])
+    native = BytesIO()
+    gb.io.mmwrite(native, A, comment="precision", symmetry="general", precision=3)
+    scipy = BytesIO()
+    gb.io.mmwrite(scipy, A, comment="precision", symmetry="general", precision=3, engine="scipy")
+    assert native.getvalue() == scipy.getvalue()
+    assert b"1 2 3.33e-01\n" in native.getvalue()
+    with pytest.raises(ValueError, match="precision"):
+        gb.io.mmwrite(BytesIO(), A, precision=0)
+
+
+@pytest.mark.parametrize("ext", [".mtx", ".mtx.gz", ".mtx.bz2"])
+def test_mmwrite_native(tmp_path, ext):
+    A = Matrix.from_values([0, 1, 1, 2], [1, 0, 2, 1], [1.5, 1.5, 1 / 3, 1 / 3], name="A")
+    filename = tmp_path / f"A{ext}"
+    gb.io.mmwrite(filename, A, comment="line 1\nline 2")
+    assert gb.io.mmread(filename).isequal(A, check_dtype=True)
+    f = StringIO()
+    gb.io.mmwrite(f, A, comment="line 1\nline 2", precision=3)
+    assert f.getvalue() == (
+        "%%MatrixMarket matrix coordinate real symmetric\n"
+        "%line 1\n"
+        "%line 2\n"
+        "3 3 2\n"
+        "2 1 1.50e+00\n"
+        "3 2 3.33e-01\n"
+    )
+    # Not symmetric, and Vectors are written as a row
+    f = StringIO()
+    gb.io.mmwrite(f, A[0, :].new(), field="pattern")
+    assert f.getvalue() == "%%MatrixMarket matrix coordinate pattern general\n1 3 1\n1 2\n"
+    B = Matrix.from_values([0, 1, 2], [1, 0, 0], [-(2**63), 2**63 - 1, 0], nrows=3, ncols=3)
+    f = StringIO()
+    gb.io.mmwrite(f, B, symmetry="general")
+    assert f.getvalue() == (
+        "%%MatrixMarket matrix coordinate integer general\n"
+        "3 3 3\n"
+        "1 2 -9223372036854775808\n"
+        "2 1 9223372036854775807\n"
+        "3 1 0\n"
+    )
+    C = Matrix.from_values([0, 1], [1, 0], [1 + 2j, 1 - 2j])
+    f = StringIO()
+    gb.io.mmwrite(f, C)
+    assert f.getvalue().splitlines()[0].endswith("complex hermitian")
+    f.seek(0)
+    assert gb.io.mmread(f).isequal(C, check_dtype=True)
+    D = Matrix.from_values([0, 1], [1, 0], [1, -1])
+    f = StringIO()
+    gb.io.mmwrite(f, D)
+    assert f.getvalue() == (
+        "%%MatrixMarket matrix coordinate integer skew-symmetric\n2 2 1\n2 1 -1\n"
+    )
+    # Explicit zeros on the diagonal can't be written as skew-symmetric
+    E = Matrix.from_values([0, 1, 0, 1], [1, 0, 0, 1], [2.0, -2, 0, 0])
+    f = StringIO()
+    gb.io.mmwrite(f, E)
+    assert f.getvalue().splitlines()[0].endswith("real general")
+    f.seek(0)
+    assert gb.io.mmread(f).isequal(E, check_dtype=True)
+    with pytest.raises(TypeError, match="Can only write a Matrix"):
+        gb.io.mmwrite(f, gb.Scalar.from_value(1))
+    with pytest.raises(ValueError, match="field"):
+        gb.io.mmwrite(f, A, field="double")
+    with pytest.raises(ValueError, match="symmetry"):
+        gb.io.mmwrite(f, A, symmetry="upper")
+    with pytest.raises(ValueError, match="engine"):
+        gb.io.mmwrite(f, A, engine="bad")
+
+
+@pytest.mark.parametrize(
+    "fmt", ["csr", "csc", "hypercsr", "hypercsc", "bitmapr", "bitmapc", "fullr"]
+)
+def test_save_load(tmp_path, fmt):
+    A = gb.Matrix.from_values([0, 0, 1, 1], [0, 1, 0, 1], [1.5, 2.5, 3.5, 4.5], nrows=2, ncols=2)
+    if fmt != "fullr":
+        del A[0, 1]
+    A = A.ss.import_any(**A.ss.export(fmt))
+    filename = tmp_path / "A.grb"
+    gb.io.save(filename, A)
+    assert A.ss.format == fmt  # data is put back into A
+    for mmap in [True, False]:
+        B = gb.io.load(filename, mmap=mmap, name="B")
+        assert B.name == "B"
+        assert B.ss.format == fmt
+        assert B.isequal(A, check_dtype=True)
+    # Transposed and iso
+    A = gb.Matrix.from_values([0, 1, 2], [1, 2, 0], 7, nrows=3, ncols=100)
+    gb.io.save(filename, A.T)
+    B = gb.io.load(filename)
+    assert B.ss.is_iso
+    assert B.isequal(A.T.new(), check_dtype=True)
+
+
+def test_save_load_vector():
+    for v in [
+        gb.Vector.from_values([1, 5], [True, False], size=10),
+        gb.Vector.from_values([0, 1, 2], 1),
+        gb.Vector.new(int, size=3),
+    ]:
+        f = BytesIO()
+        gb.io.save(f, v)
+        f.seek(0)
+        w = gb.io.load(f, mmap=False)
+        assert type(w) is gb.Vector
+        assert w.isequal(v, check_dtype=True)
+
+
+def test_save_load_udt():
+    np_dtype = np.dtype([("x", np.int32), ("y", np.float64)])
+    udt = dtypes.register_anonymous(np_dtype)
+    A = gb.Matrix.from_values([0, 1], [1, 0], [(1, 2.5), (3, 4.5)], dtype=udt)
+    f = BytesIO()
+    gb.io.save(f, A)
+    f.seek(0)
+    B = gb.io.load(f, mmap=False)
+    assert B.dtype == udt
+    assert B.isequal(A)
+
+
+def test_save_load_bad():
+    with pytest.raises(TypeError, match="Can only save"):
+        gb.io.save(BytesIO(), gb.Scalar.from_value(1))
+    with pytest.raises(gb.exceptions.GrblasException, match="bad magic"):
+        gb.io.load(BytesIO(b"%%MatrixMarket matrix coordinate real general"), mmap=False)
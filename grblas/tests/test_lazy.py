@@ -0,0 +1,182 @@
+import pytest
+
+import grblas as gb
+from grblas import Matrix, Recorder, Vector, agg, binary, monoid, semiring, unary
+
+
+@pytest.fixture(autouse=True)
+def lazy():
+    with gb.config.set(lazy=True):
+        yield
+
+
+@pytest.fixture
+def A():
+    return Matrix.from_values(
+        [0, 0, 1, 2, 2, 3], [1, 3, 2, 0, 3, 1], [1, -2, 3, -4, 5, 6], nrows=4, ncols=4, name="A"
+    )
+
+
+@pytest.fixture
+def B():
+    return Matrix.from_values(
+        [0, 1, 1, 2, 3, 3], [0, 1, 3, 2, 0, 2], [7, -8, 9, 2, -1, 3], nrows=4, ncols=4, name="B"
+    )
+
+
+@pytest.fixture
+def v():
+    return Vector.from_values([0, 1, 3], [2, -3, 4], size=4, name="v")
+
+
+def calls(rec):
+    """C functions that were called, excluding creating new objects"""
+    return [line.split("(", 1)[0] for line in rec if "_new(" not in line]
+
+
+def test_chain_is_delayed(A, B):
+    expr = A.mxm(B).apply(unary.abs).reduce_rowwise(monoid.max)
+    assert type(expr) is gb.vector.VectorExpression
+    assert type(expr.args[0]) is gb.matrix.MatrixExpression
+    assert expr.args[0]._value is None
+    with gb.config.set(lazy=False):
+        expected = A.mxm(B).new().apply(unary.abs).new().reduce_rowwise(monoid.max).new()
+    assert expr.new().isequal(expected)
+
+
+def test_other_is_delayed(A, B, v):
+    expr = A.mxm(A.ewise_add(B))
+    assert type(expr.args[1]) is gb.matrix.MatrixExpression
+    expected = A.mxm(A.ewise_add(B).new()).new()
+    assert expr.new().isequal(expected)
+    w = A.mxv(v.apply(unary.ainv)).new()
+    assert w.isequal(A.mxv(v.apply(unary.ainv).new()).new())
+    w = v.vxm(A.T.apply(unary.ainv)).new()
+    assert w.isequal(v.vxm(A.T.new().apply(unary.ainv).new()).new())
+    C = A.kronecker(B.apply(unary.abs), binary.plus).new()
+    assert C.isequal(A.kronecker(B.apply(unary.abs).new(), binary.plus).new())
+
+
+def test_not_lazy(A, B):
+    with gb.config.set(lazy=False):
+        with pytest.raises(TypeError, match="autocompute"):
+            A.mxm(B).apply(unary.abs)
+        with pytest.raises(TypeError, match="autocompute"):
+            A.mxm(A.mxm(B))
+
+
+def test_reduce_reassociated(A, B):
+    with Recorder() as rec:
+        w = A.mxm(B).reduce_rowwise().new()
+    assert calls(rec) == ["GrB_Matrix_reduce_Monoid", "GrB_mxv"]
+    assert w.isequal(A.mxm(B).new().reduce_rowwise().new())
+    with Recorder() as rec:
+        w = A.mxm(B.T, semiring.min_plus).reduce_columnwise(monoid.min).new()
+    assert calls(rec) == ["GrB_Matrix_reduce_Monoid", "GrB_vxm"]
+    assert w.isequal(A.mxm(B.T, semiring.min_plus).new().reduce_columnwise(monoid.min).new())
+    # Not distributive, or monoid doesn't match
+    for op, reducer in [(semiring.plus_plus, monoid.plus), (semiring.plus_times, monoid.max)]:
+        with Recorder() as rec:
+            w = A.mxm(B, op).reduce_rowwise(reducer).new()
+        assert calls(rec) == ["GrB_mxm", "GrB_Matrix_reduce_Monoid"]
+    # Shared with another expression
+    C = A.mxm(B)
+    with Recorder() as rec:
+        w = C.reduce_rowwise().ewise_mult(C.reduce_columnwise()).new()
+    assert calls(rec).count("GrB_mxm") == 1
+    assert "GrB_mxv" not in calls(rec)
+
+
+def test_ignored_apply(A, B, v):
+    with Recorder() as rec:
+        C = A.mxm(B.apply(unary.abs), semiring.plus_first).new()
+    assert calls(rec) == ["GrB_mxm"]
+    assert C.isequal(A.mxm(B, semiring.plus_first).new())
+    with Recorder() as rec:
+        C = A.T.apply(unary.ainv).mxm(B, semiring.plus_pair).new()
+    assert calls(rec) == ["GrB_mxm"]
+    assert list(rec)[-1].endswith(" GxB_PLUS_PAIR_INT64, A, B, GrB_DESC_T0);")
+    assert C.isequal(A.T.mxm(B, semiring.plus_pair).new())
+    with Recorder() as rec:
+        w = A.apply(unary.abs).mxv(v.apply(unary.ainv), semiring.min_secondi).new()
+    assert calls(rec) == ["GrB_mxv"]
+    assert w.isequal(A.mxv(v, semiring.min_secondi).new())
+    with Recorder() as rec:
+        C = A.apply(unary.abs).ewise_mult(B.apply(unary.abs), binary.first).new()
+    assert calls(rec) == ["GrB_Matrix_apply", "GrB_Matrix_eWiseMult_BinaryOp"]
+    assert C.isequal(A.apply(unary.abs).new().ewise_mult(B, binary.first).new())
+
+
+def test_simplify_apply(A, v):
+    with Recorder() as rec:
+        C = A.apply(unary.ainv).apply(unary.abs).new()
+    assert calls(rec) == ["GrB_Matrix_apply"]
+    assert C.isequal(A.apply(unary.abs).new())
+    with Recorder() as rec:
+        C = A.T.apply(unary.ainv).apply(unary.ainv).new()
+    assert calls(rec) == ["GrB_Matrix_apply"]
+    assert list(rec)[-1].endswith(" GrB_IDENTITY_INT64, A, GrB_DESC_T0T1);")
+    assert C.isequal(A.T.new())
+    with Recorder() as rec:
+        w = v.apply(binary.plus, right=1).apply(unary.one).new()
+    assert calls(rec) == ["GrB_Vector_apply"]
+    assert w.isequal(v.apply(unary.one).new())
+    # ainv is different for unsigned integers
+    B = A.dup(dtype="UINT8")
+    with Recorder() as rec:
+        C = B.apply(unary.ainv).apply(unary.abs).new()
+    assert calls(rec) == ["GrB_Matrix_apply", "GrB_Matrix_apply"]
+
+
+def test_mask_pushdown(A, B):
+    M = Matrix.from_values([0, 2], [1, 3], [True, True], nrows=4, ncols=4, name="M")
+    with Recorder() as rec:
+        C = A.mxm(B).apply(unary.abs).new(mask=M.S)
+    assert calls(rec) == ["GrB_mxm", "GrB_Matrix_apply"]
+    assert list(rec)[2].endswith(", M, NULL, GrB_PLUS_TIMES_SEMIRING_INT64, A, B, GrB_DESC_S);")
+    expected = A.mxm(B).new().apply(unary.abs).new(mask=M.S)
+    assert C.isequal(expected)
+    C = Matrix.new(A.dtype, 4, 4)
+    C(~M.V, accum=binary.plus) << A.mxm(B).ewise_add(B.mxm(A))
+    expected = Matrix.new(A.dtype, 4, 4)
+    expected(~M.V, accum=binary.plus) << A.mxm(B).new().ewise_add(B.mxm(A).new())
+    assert C.isequal(expected)
+
+
+def test_shared_computed_once(A, B):
+    C = A.mxm(B)
+    D = C.apply(unary.abs)
+    with Recorder() as rec:
+        E = C.ewise_add(D).ewise_mult(D, binary.minus).new()
+    assert calls(rec).count("GrB_mxm") == 1
+    assert calls(rec).count("GrB_Matrix_apply") == 1
+    Cv = A.mxm(B).new()
+    Dv = Cv.apply(unary.abs).new()
+    assert E.isequal(Cv.ewise_add(Dv).new().ewise_mult(Dv, binary.minus).new())
+    # Intermediate values are not kept after an expression is computed
+    Cv = C.new()
+    with Recorder() as rec:
+        D.new()
+    assert calls(rec) == ["GrB_mxm", "GrB_Matrix_apply"]
+    assert Cv.isequal(A.mxm(B).new())
+
+
+def test_reduce_scalar_and_aggregators(A, B, v):
+    s = A.mxm(B).apply(unary.abs).reduce_scalar().new()
+    assert s == A.mxm(B).new().apply(unary.abs).new().reduce_scalar().new()
+    with Recorder() as rec:
+        w = A.mxm(B).reduce_rowwise(agg.mean).new()
+    assert calls(rec).count("GrB_mxm") == 1
+    assert w.isequal(A.mxm(B).new().reduce_rowwise(agg.mean).new())
+    s = v.apply(unary.abs).reduce(agg.count).new()
+    assert s == 3
+    w = Vector.new(float, 4)
+    w << A.T.mxm(B).reduce_columnwise(agg.mean)
+    assert w.isequal(A.T.mxm(B).new().reduce_columnwise(agg.mean).new())
+
+
+def test_autocompute_lazy(A, B):
+    with gb.config.set(autocompute=True):
+        expr = A.mxm(B).apply(unary.abs)
+        assert expr.args[0]._value is None
+        assert expr.nvals == A.mxm(B).new().nvals
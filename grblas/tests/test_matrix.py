@@ -358,6 +358,30 @@ def test_mxm_accum(A):
     assert A.isequal(result)
 
 
+def test_mxm_descriptor_extensions(A, capfd):
+    expected = A.mxm(A.T, semiring.plus_times).new()
+    for axb_method in ["gustavson", "hash", "saxpy", "dot", "default"]:
+        C = Matrix.new(A.dtype, A.nrows, A.ncols)
+        C(axb_method=axb_method, nthreads=1, sort=True) << A.mxm(A.T, semiring.plus_times)
+        assert C.isequal(expected)
+    C = Matrix.new(A.dtype, A.nrows, A.ncols)
+    with grblas.ss.config(burble=True):
+        C(C.S, axb_method="dot") << A.mxm(A.T, semiring.plus_times)
+    assert "dot" in capfd.readouterr().out
+    C(binary.plus, chunk=1e6) << A.mxm(A.T, semiring.plus_times)
+    assert C.isequal(expected)
+    w = Vector.new(A.dtype, A.nrows)
+    w(nthreads=2) << A.reduce_rowwise(monoid.plus)
+    assert w.isequal(A.reduce_rowwise(monoid.plus).new())
+    s = Scalar.new(A.dtype)
+    s(nthreads=2) << A.reduce_scalar(monoid.plus)
+    assert s == A.reduce_scalar(monoid.plus).new()
+    with pytest.raises(TypeError, match="Unknown descriptor option"):
+        C(bad_option=1)
+    with pytest.raises(ValueError, match="axb_method must be one of"):
+        C(axb_method="fastest")
+
+
 def test_mxv(A, v):
     w = A.mxv(v, semiring.plus_times).new()
     result = Vector.from_values([0, 1, 6], [5, 16, 13])
@@ -1182,6 +1206,129 @@ def test_reduce_agg(A):
         B.reduce_scalar(agg.vars, allow_empty=False)
 
 
+def test_reduce_scalar_agg_direct(A, monkeypatch):
+    from grblas import _agg
+
+    aggs = [agg.count, agg.count_nonzero, agg.sum_of_squares, agg.exists, agg.hypot]
+    aggs += [agg.logaddexp, agg.L1norm, agg.Linfnorm]
+    with grblas.Recorder() as rec:
+        results = [A.reduce_scalar(aggregator).new() for aggregator in aggs]
+        results.append(A.T.reduce_scalar(agg.L1norm).new())
+        empty = Matrix.new(int, 2, 3).reduce_scalar(agg.sum_of_squares).new()
+    assert not any("mxv" in line or "vxm" in line for line in rec.data)
+    assert empty.is_empty
+    monkeypatch.setattr(_agg, "_reduces_directly", lambda *args: False)
+    for aggregator, result in zip(aggs, results):
+        expected = A.reduce_scalar(aggregator).new()
+        assert result.dtype == expected.dtype
+        assert result.isclose(expected)
+    assert results[-1] == A.reduce_scalar(agg.L1norm).new()
+
+
+@pytest.mark.parametrize("dtype", ["FP64", "INT64", "FP32"])
+def test_reduce_agg_fused(A, dtype):
+    A = A.dup(dtype=dtype)
+
+    def assert_same(result, expected):
+        assert result.dtype == expected.dtype
+        if result.ndim == 0:
+            assert result.isclose(expected, rel_tol=1e-6)
+            return
+        indices, values = result.to_values()
+        expected_indices, expected_values = expected.to_values()
+        assert_array_equal(indices, expected_indices)
+        np.testing.assert_allclose(values, expected_values, rtol=1e-6)
+
+    for aggregator in [agg.varp, agg.vars, agg.stdp, agg.stds]:
+        composite = agg.Aggregator(
+            aggregator.name,
+            composite=aggregator._composite,
+            finalize=aggregator._finalize,
+            types=aggregator._types_orig,
+        )
+        for fmt in ["csr", "hypercsr", "csc", "hypercsc", "bitmapr", "bitmapc"]:
+            B = Matrix.ss.import_any(**A.ss.export(fmt))
+            for M in [B, B.T]:
+                assert_same(M.reduce_rowwise(aggregator).new(), M.reduce_rowwise(composite).new())
+                assert_same(
+                    M.reduce_columnwise(aggregator).new(), M.reduce_columnwise(composite).new()
+                )
+                assert_same(M.reduce_scalar(aggregator).new(), M.reduce_scalar(composite).new())
+        B = Matrix.from_values([0, 0, 1, 1], [0, 1, 0, 1], [1, 2, 3, 5], dtype=dtype)
+        assert B.ss.format == "fullr"
+        assert_same(B.reduce_columnwise(aggregator).new(), B.reduce_columnwise(composite).new())
+        assert_same(B.reduce_scalar(aggregator).new(), B.reduce_scalar(composite).new())
+        B = Matrix.from_values([0, 0, 2], [0, 1, 1], 3, nrows=3, ncols=2, dtype=dtype)
+        assert B.ss.is_iso
+        assert_same(B.reduce_rowwise(aggregator).new(), B.reduce_rowwise(composite).new())
+        for fmt in ["sparse", "bitmap", "full"]:
+            v = A[0, :].new()
+            if fmt == "full":
+                v = v[[1, 3]].new()
+            v = Vector.ss.import_any(**v.ss.export(fmt))
+            assert_same(v.reduce(aggregator).new(), v.reduce(composite).new())
+    # Masks and accumulation are applied to the result
+    w = Vector.new(float, A.nrows)
+    w[0] = 100
+    mask = Vector.from_values([0, 1, 3], True, size=A.nrows)
+    w(mask.S, binary.plus) << A.reduce_rowwise(agg.varp)
+    expected = A.reduce_rowwise(agg.varp).new(mask=mask.S)
+    expected[0] = expected[0].new().value + 100
+    assert w.isclose(expected)
+    # Values are exported, which isn't recorded, so use GraphBLAS calls while recording
+    with grblas.Recorder() as rec:
+        result = A.reduce_rowwise(agg.stds).new()
+    assert any("mxv" in line for line in rec.data)
+    assert_same(result, A.reduce_rowwise(agg.stds).new())
+
+
+def test_reduce_agg_argminmax_one_pass(A, monkeypatch):
+    from grblas import _agg
+
+    A = A.dup(dtype=float)
+    A[0, 4] = 2  # tie with A[0, 1]
+    A[4, 2] = np.nan
+    results = {}
+    for fmt in ["csr", "hypercsr", "csc", "hypercsc", "bitmapr", "bitmapc"]:
+        B = Matrix.ss.import_any(**A.ss.export(fmt))
+        for aggregator in [agg.argmin, agg.argmax]:
+            for M in [B, B.T]:
+                for method in ["reduce_rowwise", "reduce_columnwise"]:
+                    results[fmt, aggregator.name, M is B, method] = getattr(M, method)(
+                        aggregator
+                    ).new()
+    B = Matrix.from_values([0, 0, 1, 1], [0, 1, 0, 1], [1, 1, 3, 0], dtype=float)
+    assert B.ss.format == "fullr"
+    v = Vector.from_values([1, 3, 4], [5, np.nan, 5])
+    dense_results = [
+        B.reduce_rowwise(agg.argmax).new(),
+        B.reduce_columnwise(agg.argmin).new(),
+        B[0, :].new().reduce(agg.argmin).new(),
+        v.reduce(agg.argmin).new(),
+        Vector.ss.import_any(**v.ss.export("bitmap")).reduce(agg.argmax).new(),
+    ]
+    assert dense_results[0].isequal(Vector.from_values([0, 1], [0, 0]))
+    assert dense_results[2] == 0
+    assert dense_results[3] == 1
+
+    monkeypatch.setattr(_agg, "_can_fuse", lambda *args: False)
+    for (fmt, name, is_B, method), result in results.items():
+        B = Matrix.ss.import_any(**A.ss.export(fmt))
+        M = B if is_B else B.T
+        expected = getattr(M, method)(getattr(agg, name)).new()
+        assert result.isequal(expected, check_dtype=True), (fmt, name, is_B, method)
+    B = Matrix.from_values([0, 0, 1, 1], [0, 1, 0, 1], [1, 1, 3, 0], dtype=float)
+    expected = [
+        B.reduce_rowwise(agg.argmax).new(),
+        B.reduce_columnwise(agg.argmin).new(),
+        B[0, :].new().reduce(agg.argmin).new(),
+        v.reduce(agg.argmin).new(),
+        v.reduce(agg.argmax).new(),
+    ]
+    for result, expected in zip(dense_results, expected):
+        assert result.isequal(expected, check_dtype=True)
+
+
 def test_reduce_agg_argminmax(A):
     # reduce_rowwise
     expected = Vector.from_values([0, 1, 2, 3, 4, 5, 6], [1, 6, 5, 0, 5, 2, 4])
@@ -1351,6 +1498,60 @@ def test_reduce_agg_empty():
                 assert compute(s.value) is None
 
 
+def test_groupby(A):
+    rows, cols, values = A.to_values()
+    row_labels = np.array([1, 0, 1, 2, 0, 1, 0])
+    col_labels = Vector.from_values([0, 1, 2, 3, 5, 6], [0, 1, 0, 1, 1, 1], size=7)
+    for attr, aggr in vars(agg).items():
+        if not isinstance(aggr, agg.Aggregator) or A.dtype not in aggr:
+            continue
+        for rowwise, labels in [(True, row_labels), (False, col_labels)]:
+            if rowwise:
+                g = A.groupby_rows(labels)
+            else:
+                g = A.groupby_columns(labels)
+            assert g.ngroups == (3 if rowwise else 2)
+            if aggr._custom is not None:
+                with pytest.raises(ValueError, match="Aggregator"):
+                    g.agg(aggr)
+                continue
+            result = g.agg(aggr)
+            if attr == "any_value":
+                # Any value of each group may be chosen
+                assert result.nvals == g.agg(agg.count).nvals
+                continue
+            for group in range(g.ngroups):
+                if rowwise:
+                    keep = row_labels[rows] == group
+                else:
+                    li, lv = col_labels.to_values()
+                    keep = np.isin(cols, li[lv == group])
+                B = Matrix.from_values(rows[keep], cols[keep], values[keep], nrows=7, ncols=7)
+                if rowwise:
+                    expected = B.reduce_columnwise(aggr).new()
+                    got = result[group, :].new()
+                else:
+                    expected = B.reduce_rowwise(aggr).new()
+                    got = result[:, group].new()
+                assert got.dtype == expected.dtype, attr
+                got_indices, got_values = got.to_values()
+                indices, expected_values = expected.to_values()
+                assert_array_equal(got_indices, indices)
+                np.testing.assert_allclose(got_values, expected_values, err_msg=attr)
+    # Louvain-style community graph: sum of edge weights between communities
+    C = A.groupby_rows(row_labels).agg().groupby_columns(row_labels).agg(monoid.plus)
+    P = A.groupby_rows(row_labels).assignment
+    assert C.isequal(semiring.plus_times(semiring.plus_times(P @ A).new() @ P.T).new())
+    expected = A.T.new().groupby_rows(row_labels).agg(agg.varp)
+    assert A.T.groupby_rows(row_labels).agg(agg.varp).isequal(expected)
+    with pytest.raises(DimensionMismatch):
+        A.groupby_rows([0, 1])
+    with pytest.raises(TypeError, match="integers"):
+        A.groupby_rows([0.5] * 7)
+    with pytest.raises(TypeError, match="Monoid"):
+        A.groupby_columns([0] * 7).agg(binary.minus)
+
+
 def test_reduce_row_udf(A):
     result = Vector.from_values([0, 1, 2, 3, 4, 5, 6], [5, 12, 1, 6, 7, 1, 15])
     binop = grblas.operator.BinaryOp.register_anonymous(lambda x, y: x + y)
@@ -2445,6 +2646,36 @@ def test_concat(A, v):
         grblas.ss.concat([[v], v])
 
 
+def test_mxv_vxm_many(A, v):
+    vectors = [v, Vector.from_values([0, 5], [2, -1], size=7), Vector.new(int, size=7)]
+    for op in [semiring.plus_times, "min_first", "max_second", "plus_minus"]:
+        results = A.ss.mxv_many(vectors, op)
+        assert len(results) == 3
+        for vector, result in zip(vectors, results):
+            assert result.isequal(A.mxv(vector, op).new(), check_dtype=True)
+        results = A.ss.vxm_many(vectors, op, name="w")
+        assert [result.name for result in results] == ["w_0", "w_1", "w_2"]
+        for vector, result in zip(vectors, results):
+            assert result.isequal(vector.vxm(A, op).new(), check_dtype=True)
+    # Vectors are cast to a common dtype
+    results = A.ss.mxv_many([v, Vector.from_values([0], [0.5], size=7)])
+    assert results[0].dtype == "FP64"
+    assert results[0].isequal(A.mxv(v).new())
+
+    with pytest.raises(TypeError, match="vectors argument must be list or tuple"):
+        A.ss.mxv_many(v)
+    with pytest.raises(ValueError, match="vectors argument must not be empty"):
+        A.ss.vxm_many([])
+    with pytest.raises(TypeError, match="Bad type for argument `vectors`"):
+        A.ss.mxv_many([A])
+    with pytest.raises(DimensionMismatch, match="position 1 has size 8"):
+        A.ss.vxm_many([v, Vector.new(int, size=8)])
+    with pytest.raises(TypeError, match="Expected type: Semiring"):
+        A.ss.mxv_many([v], binary.plus)
+    with pytest.raises(ValueError, match="does not support positional semirings"):
+        A.ss.mxv_many([v], semiring.min_secondj)
+
+
 def test_nbytes(A):
     assert A.ss.nbytes > 0
 
@@ -2570,6 +2801,7 @@ def test_expr_is_like_matrix(A):
         "_prep_for_assign",
         "_prep_for_extract",
         "_update",
+        "_version",
         "build",
         "clear",
         "from_pygraphblas",
@@ -2606,6 +2838,7 @@ def test_index_expr_is_like_matrix(A):
         "_prep_for_assign",
         "_prep_for_extract",
         "_update",
+        "_version",
         "build",
         "clear",
         "from_pygraphblas",
@@ -0,0 +1,75 @@
+import pytest
+
+from grblas import Matrix, Vector, metrics
+
+
+@pytest.fixture
+def A():
+    return Matrix.from_values([0, 0, 1, 2], [1, 2, 2, 0], [1, 2, 3, 4], nrows=3, ncols=3, name="A")
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    enabled = metrics.is_enabled()
+    metrics.enable()
+    metrics.reset()
+    yield
+    if not enabled:  # pragma: no cover
+        metrics.disable()
+
+
+def test_metrics(A):
+    for _ in range(3):
+        A.mxm(A).new()
+    data = metrics.snapshot()
+    assert data["calls"]["GrB_mxm"] == 3
+    assert data["time"]["GrB_mxm"] > 0
+    assert data["total_calls"] == sum(data["calls"].values())
+    assert data["total_time"] == pytest.approx(sum(data["time"].values()))
+    assert data["imported_bytes"] == data["exported_bytes"] == 0
+
+    pieces = A.ss.export("csr")
+    nbytes = pieces["indptr"].nbytes + pieces["col_indices"].nbytes + pieces["values"].nbytes
+    assert metrics.snapshot()["exported_bytes"] == nbytes
+    Matrix.ss.import_csr(**pieces, take_ownership=True)
+    assert metrics.snapshot()["imported_bytes"] == nbytes
+    v = Vector.from_values([0, 2], [1.0, 2.0], size=3)
+    pieces = v.ss.unpack("bitmap")
+    # Whole buffers are counted, which may be larger than the arrays
+    exported = metrics.snapshot()["exported_bytes"]
+    assert exported >= nbytes + pieces["bitmap"].nbytes + pieces["values"].nbytes
+    v.ss.pack_bitmap(**pieces)
+    imported = metrics.snapshot()["imported_bytes"]
+    assert imported == nbytes + pieces["bitmap"].nbytes + pieces["values"].nbytes
+
+    metrics.disable()
+    assert not metrics.is_enabled()
+    A.mxm(A).new()
+    A.ss.export()
+    data = metrics.snapshot()
+    assert data["calls"]["GrB_mxm"] == 3
+    assert data["exported_bytes"] == exported
+    metrics.enable()
+    assert metrics.is_enabled()
+    A.mxm(A).new()
+    assert metrics.snapshot()["calls"]["GrB_mxm"] == 4
+    metrics.reset()
+    data = metrics.snapshot()
+    assert data["calls"] == {}
+    assert data["total_calls"] == data["imported_bytes"] == 0
+
+
+def test_to_prometheus(A):
+    A.mxm(A).new()
+    text = metrics.to_prometheus()
+    assert text.endswith("\n")
+    lines = text.splitlines()
+    assert "# TYPE grblas_calls_total counter" in lines
+    assert 'grblas_calls_total{cfunc="GrB_mxm"} 1' in lines
+    assert any(line.startswith('grblas_call_seconds_total{cfunc="GrB_mxm"} ') for line in lines)
+    assert "grblas_imported_bytes_total 0" in lines
+    assert "# TYPE myapp_exported_bytes_total counter" in metrics.to_prometheus("myapp")
+    for line in lines:
+        if not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            float(value)
@@ -1,4 +1,6 @@
+import gc
 import itertools
+import weakref
 
 import numpy as np
 import pytest
@@ -113,6 +115,42 @@ def test_get_typed_op():
     assert (
         operator.get_typed_op("count", dtypes.INT64, kind="binary|aggregator") is agg.count["INT64"]
     )
+
+
+def test_get_typed_op_cache():
+    def plus_two(x):
+        return x + 2  # pragma: no cover
+
+    operator.get_typed_op.cache_clear()
+    assert operator.get_typed_op("+", dtypes.INT64, kind="binary") is binary.plus["INT64"]
+    assert operator.get_typed_op("+", dtypes.INT64, kind="binary") is binary.plus["INT64"]
+    info = operator.get_typed_op.cache_info()
+    assert info.hits == 1
+    assert info.misses == 2  # Also resolves binary.plus
+    # Errors are not cached
+    for _ in range(2):
+        with pytest.raises(KeyError, match="bor does not work with FP64"):
+            operator.get_typed_op(binary.bor, dtypes.FP64)
+    assert operator.get_typed_op.cache_info().misses == 4
+    # Adding or removing typed ops clears the cache
+    with gb.config.set(lazy_udf=True):
+        op = UnaryOp.register_anonymous(plus_two)
+    assert operator.get_typed_op.cache_info().currsize > 0
+    op[dtypes.INT8]
+    assert operator.get_typed_op.cache_info().currsize == 0
+    assert operator.get_typed_op(op, dtypes.INT16) is operator.get_typed_op(op, dtypes.INT16)
+    del op[dtypes.INT16]
+    assert operator.get_typed_op.cache_info().currsize == 0
+    with pytest.raises(KeyError, match="does not work with INT16"):
+        operator.get_typed_op(op, dtypes.INT16)
+    # Anonymous ops are not cached, so they can be freed
+    operator.get_typed_op.cache_clear()
+    assert operator.get_typed_op(op, dtypes.INT8) is op[dtypes.INT8]
+    assert operator.get_typed_op.cache_info().currsize == 0
+    ref = weakref.ref(op)
+    del op
+    gc.collect()
+    assert ref() is None
     with pytest.raises(ValueError, match="Unknown binary or aggregator"):
         operator.get_typed_op("bad_op_name", dtypes.INT64, kind="binary|aggregator")
     with pytest.raises(Exception):
@@ -1171,3 +1209,61 @@ def test_binaryop_commute_exists():
             missing.add(commutes_to.name)
     if missing:
         raise AssertionError("Missing binaryops: " + ", ".join(sorted(missing)))
+
+
+def test_udf_cache(tmp_path):
+    from grblas import _udf_cache
+
+    def times_plus_one(x, y):
+        return x * y + 1  # pragma: no cover
+
+    with gb.config.set(udf_cache=True, udf_cache_dir=tmp_path):
+        op1 = BinaryOp.register_anonymous(times_plus_one)
+        assert len(list(tmp_path.glob("grblas_udf_binary_*.json"))) == 1
+        # The second time uses the cached return types and compiled wrappers
+        op2 = BinaryOp.register_anonymous(times_plus_one)
+        assert not op2._numba_func.overloads
+        assert set(op2.types) == set(op1.types)
+        assert op2.types[BOOL] == op1.types[BOOL]
+    v = Vector.from_values([0, 1, 3], [1, 2, -4], dtype=dtypes.INT32)
+    w = v.ewise_mult(v, op2).new()
+    assert w.isequal(Vector.from_values([0, 1, 3], [2, 5, 17], dtype=dtypes.INT32))
+    w = v.apply(op2, right=2).new()
+    assert w.isequal(Vector.from_values([0, 1, 3], [3, 5, -7], dtype=dtypes.INT32))
+
+    # Closures over values that can't be identified aren't cached
+    array = np.arange(3)
+
+    def plus_array(x):
+        return x + array[0]  # pragma: no cover
+
+    with gb.config.set(udf_cache_dir=tmp_path):
+        assert _udf_cache.lookup("unary", plus_array, None) is None
+
+
+def test_lazy_udf():
+    def times_plus_one(x, y):
+        return x * y + 1  # pragma: no cover
+
+    def bad(x):
+        return x.bad_attr  # pragma: no cover
+
+    with gb.config.set(lazy_udf=True):
+        op = BinaryOp.register_anonymous(times_plus_one)
+        bad_op = UnaryOp.register_anonymous(bad)
+    assert not op._typed_ops
+    v = Vector.from_values([0, 1, 3], [1, 2, -4], dtype=dtypes.INT32)
+    w = v.ewise_mult(v, op).new()
+    assert w.isequal(Vector.from_values([0, 1, 3], [2, 5, 17], dtype=dtypes.INT32))
+    assert set(op._typed_ops) == {INT32}
+    # Return types depend on the return types of other types
+    assert op[UINT64].return_type == UINT64
+    assert op[BOOL].return_type == INT8
+    assert set(op._typed_ops) == {INT8, INT32, INT64, UINT64, BOOL}
+    # Getting all the types compiles the rest
+    assert op.types == BinaryOp.register_anonymous(times_plus_one).types
+    assert set(op.types) == set(op._typed_ops)
+    assert op._lazy_udf is None
+    with pytest.raises(KeyError, match="does not work"):
+        bad_op[INT64]
+    assert bad_op.types == {}
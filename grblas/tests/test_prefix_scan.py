@@ -79,3 +79,71 @@ def test_bad_scan():
     v = Vector.from_values(range(10), range(10))
     with pytest.raises(TypeError, match="Bad type for argument `op`"):
         v.ss.scan(op=binary.first)
+
+
+@pytest.mark.parametrize("dtype", ["BOOL", "INT8", "UINT64", "FP32", "FP64"])
+def test_scan_values(dtype, monkeypatch):
+    from grblas._ss import prefix_scan
+
+    rng = np.random.default_rng(42)
+    values = rng.integers(-3, 20, 300)
+    if dtype.startswith("FP"):
+        values = values.astype(float)
+        values[::7] = np.nan
+    A = Matrix.from_values(
+        rng.integers(0, 10, 300),
+        rng.integers(0, 1000, 300),
+        values,
+        dtype=dtype,
+        nrows=10,
+        ncols=1000,
+        dup_op=binary.first,
+    )
+    ops = [op for op in [monoid.plus, monoid.times, monoid.min, monoid.max] if A.dtype in op]
+    if dtype == "BOOL":
+        ops += [monoid.land, monoid.lor]
+    results = {}
+    for op in ops:
+        for fmt in ["csr", "hypercsc", "bitmapr"]:
+            B = Matrix.ss.import_any(**A.ss.export(fmt))
+            results[op.name, fmt, "rowwise"] = B.ss.scan_rowwise(op, name="R")
+            results[op.name, fmt, "columnwise"] = B.ss.scan_columnwise(op)
+            results[op.name, fmt, "vector"] = B[3, :].new().ss.scan(op)
+    assert results["min", "csr", "rowwise"].name == "R"
+
+    monkeypatch.setattr(prefix_scan, "_can_scan_values", lambda monoid: False)
+    for (name, fmt, method), result in results.items():
+        B = Matrix.ss.import_any(**A.ss.export(fmt))
+        op = getattr(monoid, name)
+        if method == "rowwise":
+            expected = B.ss.scan_rowwise(op)
+        elif method == "columnwise":
+            expected = B.ss.scan_columnwise(op)
+        else:
+            expected = B[3, :].new().ss.scan(op)
+        assert result.dtype == expected.dtype
+        *indices, values = result.to_values()
+        *expected_indices, expected_values = expected.to_values()
+        for index, expected_index in zip(indices, expected_indices):
+            np.testing.assert_array_equal(index, expected_index)
+        # Products may be rounded differently
+        np.testing.assert_allclose(values, expected_values, rtol=1e-5)
+
+
+def test_scan_iso():
+    A = Matrix.new(int, nrows=3, ncols=4)
+    A.ss.build_scalar([0, 0, 1, 2, 2], [0, 3, 1, 0, 2], 7)
+    expected = Matrix.from_values([0, 0, 1, 2, 2], [0, 3, 1, 0, 2], [7, 14, 7, 7, 14])
+    assert A.ss.scan_rowwise().isequal(expected, check_dtype=True)
+    v = Vector.new(int, size=4)
+    v.ss.build_scalar([1, 2], 3)
+    assert v.ss.scan(monoid.times).isequal(Vector.from_values([1, 2], [3, 9], size=4))
+
+
+def test_scan_recorded():
+    v = Vector.from_values([0, 2, 3], [1, 2, 3])
+    with gb.Recorder() as rec:
+        r = v.ss.scan()
+    # Values aren't exported while recording, so scans can be replayed
+    assert any(line.startswith("GrB_vxm") for line in rec.data)
+    assert r.isequal(Vector.from_values([0, 2, 3], [1, 3, 6]))
@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+from grblas import Matrix, Vector, binary
+from grblas.profiler import Profiler
+
+
+@pytest.fixture
+def A():
+    return Matrix.from_values([0, 0, 1, 2], [1, 2, 2, 0], [1, 2, 3, 4], nrows=3, ncols=3, name="A")
+
+
+@pytest.fixture
+def v():
+    return Vector.from_values([0, 2], [5, 6], size=3, name="v")
+
+
+def test_profiler(A, v, tmp_path):
+    with Profiler() as prof:
+        assert prof.is_profiling
+        for _ in range(3):
+            C = A.mxm(A.T).new(name="C")
+        w = Vector.new(A.dtype, 3, name="w")
+        w(v.S, binary.plus) << A.mxv(v)
+    assert not prof.is_profiling
+    C << A.mxm(A)
+    assert prof.stats["GrB_mxm"]["calls"] == 3
+    assert prof.stats["GrB_mxv"]["calls"] == 1
+    assert prof.stats["GrB_Matrix_new"]["calls"] == 3
+    assert prof.stats["GrB_mxm"]["time"] >= prof.stats["GrB_mxm"]["max_time"] > 0
+    assert prof.stats["GrB_mxm"]["memory_delta"] > 0
+    [event] = [event for event in prof.events if event["name"] == "GrB_mxv"]
+    assert event["output"] == {"name": "w", "shape": [3], "nvals": 2, "format": "bitmap"}
+    assert [info["name"] for info in event["inputs"]] == ["v", "A", "v"]
+    assert event["inputs"][1] == {"name": "A", "shape": [3, 3], "nvals": 4, "format": "bitmapr"}
+    assert event["time"] > 0
+    assert isinstance(event["memory_delta"], int)
+    assert "GrB_mxm" in repr(prof)
+    assert "not profiling" in repr(prof)
+
+    path = tmp_path / "trace.json"
+    trace = prof.to_chrome_trace(path)
+    with open(path) as f:
+        assert json.load(f) == trace
+    assert len(trace["traceEvents"]) == len(prof.events)
+    [event] = [event for event in trace["traceEvents"] if event["name"] == "GrB_mxv"]
+    assert event["ph"] == "X"
+    assert event["dur"] > 0
+    assert event["args"]["output"]["name"] == "w"
+
+    prof.clear()
+    assert not prof.events
+    assert not prof.stats
+    assert repr(prof).endswith("0 calls)\n----------------------------------------")
+
+
+def test_profiler_max_events(A):
+    with Profiler(max_events=2) as prof:
+        for _ in range(3):
+            A.mxm(A).new()
+    assert len(prof.events) == 2
+    assert prof.stats["GrB_mxm"]["calls"] == 3
@@ -1,3 +1,11 @@
+import gc
+import glob
+import os
+import re
+import shutil
+import subprocess
+import sys
+
 import pytest
 
 import grblas as gb
@@ -248,3 +256,263 @@ def test_record_inner(switch):
             "  GrB_vxm((GrB_Vector)s_0, NULL, NULL, GrB_PLUS_TIMES_SEMIRING_INT64, v_0, "
             "(GrB_Matrix)v_0, NULL);"
         )
+
+
+def test_call_fast_path(monkeypatch):
+    from grblas.recorder import skip_record
+
+    # Pretend a recorder has never been started
+    monkeypatch.setattr(gb.base, "_recorder_started", False)
+    v = gb.Vector.from_values([0, 1], [1, 2])
+    assert v.nvals == 2
+    assert gb.base._cfuncs["GrB_Vector_nvals"] is gb.lib.GrB_Vector_nvals
+    with skip_record:
+        repr(v)
+    assert not gb.base._recorder_started
+    with gb.Recorder() as rec:
+        v.nvals
+    assert gb.base._recorder_started
+    assert len(rec.data) == 1
+    assert rec.data[0].startswith("GrB_Vector_nvals(&s_nvals, ")
+
+
+def test_replay():
+    A = gb.Matrix.from_values([0, 0, 1, 2], [1, 2, 2, 0], [1.0, 2, 3, 4], name="A")
+    r = gb.Vector.from_values([0, 1, 2], [1.0, 1, 1], name="r")
+
+    def step(A, r):
+        t = A.mxv(r).new(name="t")
+        temp = t.apply(gb.binary.times, 0.5).new(name="temp")
+        r(gb.binary.plus) << temp
+        return t
+
+    with gb.Recorder(replayable=True) as rec:
+        step(A, r)
+    program = rec.program
+    assert len(program) == 5
+    assert program.inputs == {"A": A, "r": r}
+    assert program.outputs == []
+    assert repr(program) == ("grblas.recorder.Program (5 calls, inputs: ['A', 'r'], outputs: [])")
+    expected = r.dup()
+    for _ in range(3):
+        assert program.replay() == {}
+        step(A, expected)
+        assert r.isequal(expected)
+
+    # Objects that still exist are outputs
+    with gb.Recorder(replayable=True) as rec:
+        t = step(A, r)
+    program = rec.program
+    assert program.outputs == [t.name]
+    r2 = r.dup()
+    expected = r.dup()
+    result = program.replay(r=r2)
+    assert list(result) == ["t"]
+    assert result["t"].isequal(step(A, expected))
+    assert result["t"].size == 3
+    assert r2.isequal(expected)
+    # Inputs must match
+    with pytest.raises(TypeError, match="Unknown inputs"):
+        program.replay(B=r2)
+    with pytest.raises(TypeError, match="must be a Vector"):
+        program.replay(r=A)
+    with pytest.raises(TypeError, match="must have dtype FP64"):
+        program.replay(r=gb.Vector.new(int, 3))
+    with pytest.raises(gb.exceptions.DimensionMismatch, match="must have shape"):
+        program.replay(r=gb.Vector.new(float, 4))
+    del A
+    gc.collect()
+    with pytest.raises(ValueError, match="'A' has been deleted"):
+        program.replay()
+    rec.clear()
+    assert len(rec.program) == 0
+
+    with pytest.raises(ValueError, match="replayable=True"):
+        gb.Recorder().program
+
+
+def test_replay_matrix_scalar():
+    A = gb.Matrix.from_values([0, 1], [1, 0], [1, 2], name="A")
+    with gb.Recorder(replayable=True) as rec:
+        B = A.mxm(A.T).new(name="B")
+        s = B.reduce_scalar(gb.monoid.plus).new(is_cscalar=False, name="s")
+    result = rec.program.replay()
+    assert result["B"].isequal(B)
+    assert result["B"].shape == (2, 2)
+    assert result["s"].is_grbscalar
+    assert result["s"] == s
+
+
+def test_replay_errors():
+    A = gb.Matrix.from_values([0, 1], [1, 0], [1, 2], name="A")
+    with gb.Recorder(replayable=True) as rec:
+        A.ss.split(1)
+    with pytest.raises(ValueError, match="can't be replayed"):
+        rec.program
+    # Data moved to and from numpy arrays by SuiteSparse can't be replayed
+    v = gb.Vector.from_values([0], [1], size=2, name="v")
+    for f in [
+        lambda: gb.Matrix.ss.import_any(**A.ss.export()).T.new(),
+        lambda: A.ss.pack_any(**A.ss.unpack()),
+        lambda: A.ss.export("coo", give_ownership=True),
+        lambda: gb.Vector.ss.import_any(**v.ss.export()),
+        lambda: v.ss.pack_any(**v.ss.unpack()),
+    ]:
+        with gb.Recorder(replayable=True) as rec:
+            f()
+        with pytest.raises(ValueError, match="C library"):
+            rec.program
+    A = gb.Matrix.from_values([0, 1], [1, 0], [1, 2], name="A")
+    # Inputs and outputs are found by name
+    A2 = A.dup(name="A")
+    with gb.Recorder(replayable=True) as rec:
+        A.mxm(A2).new(name="B")
+    with pytest.raises(ValueError, match=r"inputs with the same name: \['A'\]"):
+        rec.program
+    with gb.Recorder(replayable=True) as rec:
+        B = A.mxm(A).new(name="B")
+        B2 = A.mxm(A.T).new(name="B")  # noqa
+    with pytest.raises(ValueError, match=r"outputs with the same name: \['B'\]"):
+        rec.program
+    del B, B2
+    with gb.Recorder(replayable=True) as rec:
+        A.mxm(A).new(name="B")
+    program = rec.program
+    # Make the recorded call fail by changing the shape behind Python's back
+    A.resize(3, 3)
+    with pytest.raises(gb.exceptions.DimensionMismatch, match="must have shape"):
+        program.replay()
+    C = gb.Matrix.new(A.dtype, 2, 2, name="A")
+    C.resize(2, 3)
+    C._nrows, C._ncols = 2, 2
+    with pytest.raises(gb.exceptions.DimensionMismatch, match="Error replaying GrB_mxm"):
+        program.replay(A=C)
+
+
+def test_replay_updates_inputs():
+    A = gb.Matrix.from_values([0, 1, 1], [0, 0, 1], [1, 1, 1], name="A")
+    w = gb.Vector.from_values([0, 1], [1, 1], name="w")
+    with gb.Recorder(replayable=True) as rec:
+        w << A.mxv(w)
+    program = rec.program
+    assert w.isequal(gb.Vector.from_values([0, 1], [1, 2]))
+    with gb.ExpressionCache() as cache:
+        assert A.mxv(w).new().isequal(gb.Vector.from_values([0, 1], [1, 3]))
+        program.replay()
+        # w was changed by replaying, so the cached result is stale
+        hits = cache.hits
+        assert A.mxv(w).new().isequal(gb.Vector.from_values([0, 1], [1, 4]))
+        assert cache.hits == hits
+
+    B = gb.Matrix.from_values([0, 1], [1, 0], [1, 2], name="B")
+    with gb.Recorder(replayable=True) as rec:
+        B.resize(3, 3)
+    B.resize(2, 2)
+    rec.program.replay()
+    assert B.shape == (3, 3)
+    assert B.mxm(B).new().shape == (3, 3)
+
+
+def _compile_c(source, tmp_path):
+    """Compile C source against the installed SuiteSparse:GraphBLAS and load it with cffi"""
+    cffi = pytest.importorskip("cffi")
+    ssgb = pytest.importorskip("suitesparse_graphblas")
+    cc = shutil.which(os.environ.get("CC", "cc"))
+    if cc is None:  # pragma: no cover
+        pytest.skip("C compiler not found")
+    libs = glob.glob(
+        os.path.join(os.path.dirname(ssgb.__file__), os.pardir, "suitesparse_graphblas.libs", "*")
+    )
+    if libs:
+        # Wheels don't include GraphBLAS.h, so make it from the cffi declarations
+        with open(os.path.join(os.path.dirname(ssgb.__file__), "suitesparse_graphblas.h")) as f:
+            header = re.sub(
+                r"^#define (\w+) \.\.\.$",
+                lambda m: f"#define {m.group(1)} {int(getattr(gb.lib, m.group(1)))}",
+                f.read(),
+                flags=re.M,
+            )
+        with open(tmp_path / "GraphBLAS.h", "w") as f:
+            f.write("#include <stdbool.h>\n#include <stddef.h>\n#include <stdio.h>\n")
+            f.write(header)
+        libdir, libname = os.path.split(libs[0])
+        flags = [f"-I{tmp_path}", f"-L{libdir}", f"-l:{libname}", f"-Wl,-rpath,{libdir}"]
+    elif os.path.exists(os.path.join(sys.prefix, "include", "GraphBLAS.h")):  # pragma: no cover
+        libdir = os.path.join(sys.prefix, "lib")
+        flags = [f"-I{sys.prefix}/include", f"-L{libdir}", "-lgraphblas", f"-Wl,-rpath,{libdir}"]
+    else:  # pragma: no cover
+        pytest.skip("GraphBLAS.h not found")
+    with open(tmp_path / "program.c", "w") as f:
+        f.write(source)
+    target = str(tmp_path / "libprogram.so")
+    subprocess.run(
+        [cc, "-shared", "-fPIC", "-Wall", "-Werror", "-o", target, str(tmp_path / "program.c")]
+        + flags,
+        check=True,
+    )
+    return cffi.FFI(), target
+
+
+def test_to_c(tmp_path):
+    A = gb.Matrix.from_values([0, 0, 1, 2], [1, 2, 2, 0], [1.0, 2, 3, 4], name="A")
+    r = gb.Vector.from_values([0, 1, 2], [1.0, 1, 1], name="r")
+    with gb.Recorder(replayable=True) as rec:
+        t = A.mxv(r).new(name="t")
+        t(accum=gb.binary.plus) << 0.15
+        s = t.reduce(gb.monoid.max).new(name="s")
+        C = gb.Matrix.new(A.dtype, 3, 3, name="C")
+        C(~A.S, replace=True, axb_method="dot", nthreads=1) << A.mxm(A.T, gb.semiring.min_plus)
+        D = A[[0, 2], 1:].new(name="D")
+        n = D.nvals
+        del s
+    program = rec.program
+    assert program.outputs == ["t", "C", "D"]
+    source = program.to_c("step")
+    assert "GrB_Info step(GrB_Matrix A, GrB_Vector r, GrB_Vector *t, GrB_Matrix *C, " in source
+    assert "GrB_Scalar_free(&s);" in source
+    assert "GxB_Desc_set(desc, GxB_AxB_METHOD, (int) GxB_AxB_DOT)" in source
+    assert '#include "my/GraphBLAS.h"' in program.to_c(header="my/GraphBLAS.h")
+
+    cffi_, target = _compile_c(source, tmp_path)
+    cffi_.cdef("int step(void *A, void *r, void **t, void **C, void **D);")
+    lib = cffi_.dlopen(target)
+    handles = [cffi_.new("void**") for _ in program.outputs]
+    r2 = r.dup()  # r isn't changed, but pass a copy anyway
+    args = [cffi_.cast("void*", int(gb.ffi.cast("uintptr_t", x.gb_obj[0]))) for x in [A, r2]]
+    assert lib.step(*args, *handles) == gb.lib.GrB_SUCCESS
+    results = {}
+    for index, name, handle in zip(program._outputs, program.outputs, handles):
+        slot = program._slots[index]
+        gb_handle = gb.ffi.new(f"{slot.ctype}*")
+        gb_handle[0] = gb.ffi.cast(slot.ctype, int(cffi_.cast("uintptr_t", handle[0])))
+        results[name] = program._wrap(index, gb_handle)
+    assert results["t"].isequal(t)
+    assert results["C"].isequal(C)
+    assert results["D"].isequal(D)
+    assert n == 2
+    # The C function can be called again with other inputs
+    B = gb.Matrix.from_values([0, 1, 2], [0, 1, 2], [1.0, 1, 1], name="B")
+    args[0] = cffi_.cast("void*", int(gb.ffi.cast("uintptr_t", B.gb_obj[0])))
+    assert lib.step(*args, *handles) == gb.lib.GrB_SUCCESS
+    gb_handle = gb.ffi.new("GrB_Vector*")
+    gb_handle[0] = gb.ffi.cast("GrB_Vector", int(cffi_.cast("uintptr_t", handles[0][0])))
+    assert program._wrap(0, gb_handle).isequal(program.replay(A=B)["t"])
+    # Errors are returned
+    args[0] = cffi_.cast("void*", int(gb.ffi.cast("uintptr_t", C.gb_obj[0])))
+    C.resize(2, 2)
+    assert lib.step(*args, *handles) == gb.lib.GrB_DIMENSION_MISMATCH
+    # Outputs are freed if there is an error
+    assert all(handle[0] == cffi_.NULL for handle in handles)
+    assert "    if (info != GrB_SUCCESS) {\n        GrB_Vector_free(t);\n" in source
+
+
+def test_to_c_errors():
+    A = gb.Matrix.from_values([0, 1], [1, 0], [1, 2], name="A")
+    with gb.Recorder(replayable=True) as rec:
+        A.apply(gb.operator.UnaryOp.register_anonymous(lambda x: x + 1)).new()
+    with pytest.raises(ValueError, match="user-defined"):
+        rec.program.to_c()
+    with gb.Recorder(replayable=True) as rec:
+        A.apply(gb.binary.plus, 1 + 2j).new()
+    with pytest.raises(ValueError, match="FC64"):
+        rec.program.to_c()
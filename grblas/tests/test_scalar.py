@@ -319,6 +319,7 @@ def test_expr_is_like_scalar(s):
         "_expr_name_html",
         "_name_counter",
         "_update",
+        "_version",
         "clear",
         "from_pygraphblas",
         "from_value",
@@ -345,6 +346,7 @@ def test_index_expr_is_like_scalar(s):
         "_expr_name_html",
         "_name_counter",
         "_update",
+        "_version",
         "clear",
         "from_pygraphblas",
         "from_value",
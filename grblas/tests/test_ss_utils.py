@@ -2,6 +2,7 @@ import numpy as np
 import pytest
 from numpy.testing import assert_array_equal
 
+import grblas as gb
 from grblas import Matrix, Vector
 
 
@@ -166,3 +167,164 @@ def test_matrix_head(do_iso):
             assert_array_equal(vals, values4[:2])
             assert rows.dtype == cols.dtype == np.uint64
             assert vals.dtype == expected_dtype
+
+
+@pytest.mark.parametrize("do_iso", [False, True])
+def test_vector_to_values(do_iso):
+    values = [1, 1, 1] if do_iso else [10, 20, 30]
+    for indices in [[0, 1, 2], [1, 3, 5], [100, 200, 300]]:  # full, bitmap, sparse
+        v = Vector.from_values(indices, values)
+        assert v.ss.is_iso is do_iso
+        for dtype in [None, np.float64]:
+            expected_dtype = np.int64 if dtype is None else dtype
+            idx, vals = v.ss.to_values(dtype, sort=True)
+            assert_array_equal(idx, indices)
+            assert_array_equal(vals, values)
+            assert idx.dtype == np.uint64
+            assert vals.dtype == expected_dtype
+            assert v.nvals == 3
+        w = v.dup()
+        idx, vals = w.ss.to_values(give_ownership=True)
+        assert w.nvals == 0
+        assert w.size == v.size
+        assert_array_equal(np.sort(idx), indices)
+        assert_array_equal(vals, values)
+    idx, vals = Vector.new(int, 5).ss.to_values(give_ownership=True)
+    assert idx.size == vals.size == 0
+
+
+@pytest.mark.parametrize("do_iso", [False, True])
+def test_matrix_to_values(do_iso):
+    values = [1, 1, 1] if do_iso else [1, 2, 3]
+    A1 = Matrix.from_values([0, 0, 1], [0, 1, 1], values)  # bitmap
+    A2 = Matrix.from_values([5, 5, 10], [4, 5, 10], values)  # csr
+    A3 = Matrix.from_values([500, 500, 1000], [400, 500, 1000], values)  # hypercsr
+    A4 = Matrix.ss.import_csc(**A2.ss.export("csc"))
+    assert A4.ss.format == "csc"
+    for A in [A1, A2, A3, A4]:
+        expected = A.to_values()
+        assert A.ss.is_iso is do_iso
+        for dtype in [None, np.float64]:
+            expected_dtype = np.int64 if dtype is None else dtype
+            rows, cols, vals = A.ss.to_values(dtype, sort=True)
+            if A.ss.orientation == "rowwise":
+                assert_array_equal(rows, expected[0])
+                assert_array_equal(cols, expected[1])
+                assert_array_equal(vals, expected[2])
+            assert rows.dtype == cols.dtype == np.uint64
+            assert vals.dtype == expected_dtype
+            assert Matrix.from_values(rows, cols, vals).isequal(
+                A.dup(dtype=dtype), check_dtype=True
+            )
+            assert A.nvals == 3
+        B = A.dup()
+        rows, cols, vals = B.ss.to_values(give_ownership=True)
+        assert B.nvals == 0
+        assert B.shape == A.shape
+        assert Matrix.from_values(rows, cols, vals, nrows=A.nrows, ncols=A.ncols).isequal(A)
+        if do_iso:
+            assert not vals.flags.writeable
+
+
+@pytest.mark.parametrize("do_iso", [False, True])
+def test_matrix_iter_chunks(do_iso):
+    values = [1, 1, 1, 1, 1] if do_iso else [1, 2, 3, 4, 5]
+    rows = [0, 0, 1, 3, 3]
+    cols = [1, 3, 0, 2, 3]
+    A1 = Matrix.from_values(rows, cols, values)  # bitmapr
+    A2 = Matrix.from_values(rows, cols, values, nrows=1000, ncols=1000)  # csr
+    A3 = Matrix.from_values(rows, cols, values, nrows=10**9, ncols=10**9)  # hypercsr
+    A4 = Matrix.ss.import_csc(**A2.ss.export("csc"))
+    A5 = Matrix.ss.import_hypercsc(**A3.ss.export("hypercsc"))
+    for A in [A1, A2, A3, A4, A5]:
+        expected = A.dup()
+        for chunk_nvals in [1, 2, 5, 100]:
+            chunks = list(A.ss.iter_chunks(chunk_nvals, sort=True))
+            assert len(chunks) == -(-5 // chunk_nvals)
+            assert all(r.size <= chunk_nvals for r, c, v in chunks)
+            r, c, v = (np.concatenate(x) for x in zip(*chunks))
+            assert r.dtype == c.dtype == np.uint64
+            assert v.dtype == np.int64
+            B = Matrix.from_values(r, c, v, nrows=A.nrows, ncols=A.ncols)
+            assert B.isequal(expected, check_dtype=True)
+            if A.ss.orientation == "rowwise":
+                assert_array_equal(r, rows)
+                assert_array_equal(c, cols)
+            else:
+                assert_array_equal(c, sorted(cols))
+            assert A.isequal(expected)
+        r, c, v = next(A.ss.iter_chunks(dtype=float))
+        assert v.dtype == np.float64
+        # The Matrix is empty while iterating, and restored when done
+        it = A.ss.iter_chunks(2)
+        next(it)
+        assert A.nvals == 0
+        it.close()
+        assert A.isequal(expected)
+        assert list(A) == list(zip(*A.to_values()[:2]))
+    assert list(Matrix.new(int, 2, 3).ss.iter_chunks()) == []
+    with pytest.raises(ValueError, match="chunk_nvals"):
+        next(A1.ss.iter_chunks(0))
+
+
+def test_global_config():
+    config = gb.ss.config
+    assert set(config) == {
+        "nthreads",
+        "chunk",
+        "hyper_switch",
+        "bitmap_switch",
+        "orientation",
+        "burble",
+    }
+    orig = dict(config)
+    assert orig["orientation"] == "rowwise"
+    assert orig["burble"] is False
+    assert len(orig["bitmap_switch"]) == 8
+    with config(nthreads=orig["nthreads"] + 1, hyper_switch=0.5, bitmap_switch=0.25) as c:
+        assert c is config
+        assert config["nthreads"] == orig["nthreads"] + 1
+        assert config["hyper_switch"] == 0.5
+        assert config["bitmap_switch"] == [0.25] * 8
+        with config(orientation="columnwise"):
+            assert Matrix.new(int, 2, 3).ss.orientation == "columnwise"
+        assert Matrix.new(int, 2, 3).ss.orientation == "rowwise"
+    assert dict(config) == orig
+    config["chunk"] = 1000
+    assert config["chunk"] == 1000
+    config["chunk"] = orig["chunk"]
+
+    with pytest.raises(KeyError, match="Unknown global option: 'bad_option'"):
+        config["bad_option"]
+    with pytest.raises(ValueError, match="sequence of 8 numbers"):
+        config(nthreads=orig["nthreads"] + 1, bitmap_switch=[0.5, 0.5])
+    assert dict(config) == orig
+    with pytest.raises(ValueError, match="orientation must be"):
+        config["orientation"] = "diagonal"
+
+
+def test_set_options():
+    A = Matrix.from_values([0, 1], [1, 2], [1, 2])
+    assert A.ss.get_options()["sparsity"] == "auto"
+    A.ss.set_options(orientation="columnwise", sparsity=["sparse", "bitmap"], hyper_switch=0.5)
+    options = A.ss.get_options()
+    assert options["orientation"] == A.ss.orientation == "columnwise"
+    assert options["sparsity"] == ["sparse", "bitmap"]
+    assert options["hyper_switch"] == 0.5
+    A.ss.set_options(sparsity="sparse")
+    assert A.ss.format == "csc"
+    A.ss.set_options(sparsity="bitmap", bitmap_switch=0.25)
+    assert A.ss.format == "bitmapc"
+    assert A.ss.get_options()["bitmap_switch"] == 0.25
+    assert A.isequal(Matrix.from_values([0, 1], [1, 2], [1, 2]))
+    with pytest.raises(ValueError, match="sparsity must be"):
+        A.ss.set_options(sparsity="dense")
+
+    v = Vector.from_values([0, 1, 2], [1, 2, 3])
+    assert v.ss.get_options()["sparsity"] == "auto"
+    v.ss.set_options(sparsity="sparse")
+    assert v.ss.format == "sparse"
+    assert v.ss.get_options() == {
+        "sparsity": "sparse",
+        "bitmap_switch": v.ss.get_options()["bitmap_switch"],
+    }
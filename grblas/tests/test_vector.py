@@ -785,6 +785,64 @@ def test_reduce_agg_empty():
         assert compute(s.value) is None
 
 
+def test_groupby(v):
+    labels = [0, 0, 1, 1, 1, 2, 2]
+    g = v.groupby(labels)
+    assert g.ngroups == 3
+    assert g.assignment.T.ss.is_iso
+    assert g.agg().isequal(Vector.from_values([0, 1, 2], [1, 3, 0]))
+    assert g.agg(binary.max).isequal(Vector.from_values([0, 1, 2], [1, 2, 0]))
+    assert g.agg(agg.count).isequal(Vector.from_values([0, 1, 2], [1, 2, 1]), check_dtype=True)
+    assert g.agg(agg.argmax).isequal(Vector.from_values([0, 1, 2], [1, 4, 6]))
+    expected = Vector.from_values([0, 1, 2], [1.0, 1.5, 0.0])
+    assert g.agg(agg.mean, name="means").isequal(expected, check_dtype=True)
+    assert g.agg(agg.mean, name="means").name == "means"
+    g = v.groupby(np.array(labels), ngroups=5)
+    assert g.agg(agg.sum).isequal(Vector.from_values([0, 1, 2], [1, 3, 0], size=5))
+    # Values without labels are ignored
+    labels = Vector.from_values([1, 3, 4], [1, 0, 0], size=7)
+    assert v.groupby(labels).agg().isequal(Vector.from_values([0, 1], [3, 1]))
+    with pytest.raises(DimensionMismatch):
+        v.groupby([0, 1])
+    with pytest.raises(DimensionMismatch):
+        v.groupby(Vector.new(int, size=3))
+    with pytest.raises(TypeError, match="integers"):
+        v.groupby(np.zeros(7))
+    with pytest.raises(TypeError, match="integers; got dtype float64"):
+        v.groupby([0.5] * 7)
+    with pytest.raises(TypeError, match="integers; got dtype FP64"):
+        v.groupby(Vector.from_values([0], [0.5], size=7))
+    with pytest.raises(ValueError, match="nonnegative"):
+        v.groupby([0, 0, 0, 0, 0, 0, -1])
+    with pytest.raises(ValueError, match="ngroups"):
+        v.groupby([0, 0, 0, 0, 0, 0, 3], ngroups=3)
+    with pytest.raises(TypeError, match="Monoid"):
+        v.groupby([0] * 7).agg(binary.minus)
+
+
+def test_groupby_agg():
+    values = np.array([5, -1, 3, 2, 0, 7, 3, 4, -6, 2])
+    labels = np.array([2, 0, 2, 1, 0, 2, 4, 1, 0, 2])
+    v = Vector.from_values(np.arange(10), values)
+    g = v.groupby(labels)
+    for attr, aggr in vars(agg).items():
+        if not isinstance(aggr, agg.Aggregator) or v.dtype not in aggr:
+            continue
+        result = g.agg(aggr)
+        assert result.size == 5
+        assert result.dtype == v.reduce(aggr).new().dtype
+        for group in range(5):
+            indices = np.flatnonzero(labels == group)
+            if attr == "any_value":
+                # Any value of the group may be chosen
+                value = compute(result[group].new().value)
+                assert value is None if indices.size == 0 else value in values[indices]
+                continue
+            expected = Vector.from_values(indices, values[indices], size=10).reduce(aggr).new()
+            expected = pytest.approx(compute(expected.value), nan_ok=True)
+            assert compute(result[group].new().value) == expected, attr
+
+
 def test_reduce_coerce_dtype(v):
     assert v.dtype == dtypes.INT64
     s = v.reduce().new(dtype=float)
@@ -1381,6 +1439,7 @@ def test_expr_is_like_vector(v):
         "_prep_for_assign",
         "_prep_for_extract",
         "_update",
+        "_version",
         "build",
         "clear",
         "from_pygraphblas",
@@ -1410,6 +1469,7 @@ def test_index_expr_is_like_vector(v):
         "_prep_for_assign",
         "_prep_for_extract",
         "_update",
+        "_version",
         "build",
         "clear",
         "from_pygraphblas",
@@ -2,7 +2,7 @@ import itertools
 
 import numpy as np
 
-from . import _automethods, backend, binary, ffi, lib, monoid, semiring, utils
+from . import _automethods, backend, binary, ffi, lib, monoid, utils
 from ._ss.vector import ss
 from .base import BaseExpression, BaseType, call
 from .dtypes import _INDEX, lookup_dtype, unify
@@ -226,10 +226,12 @@ class Vector(BaseType):
         return n[0]
 
     def clear(self):
+        self._version += 1
         call("GrB_Vector_clear", [self])
 
     def resize(self, size):
         size = _as_scalar(size, _INDEX, is_cscalar=True)
+        self._version += 1
         call("GrB_Vector_resize", [self, size])
         self._size = size.value
 
@@ -288,6 +290,7 @@ class Vector(BaseType):
         indices = _CArray(indices)
         values = _CArray(values, self.dtype)
         dtype_name = "UDT" if self.dtype._is_udt else self.dtype.name
+        self._version += 1
         call(
             f"GrB_Vector_build_{dtype_name}",
             [self, indices, values, _as_scalar(n, _INDEX, is_cscalar=True), dup_op],
@@ -566,7 +569,7 @@ class Vector(BaseType):
             expr.new(name="")  # incompatible shape; raise now
         return expr
 
-    def vxm(self, other, op=semiring.plus_times):
+    def vxm(self, other, op="plus_times"):
         """
         GrB_vxm
         Vector-Matrix multiplication. Result is a Vector.
@@ -731,7 +734,7 @@ class Vector(BaseType):
         )
 
     # Unofficial methods
-    def inner(self, other, op=semiring.plus_times):
+    def inner(self, other, op="plus_times"):
         """
         Vector-vector inner (or dot) product. Result is a Scalar.
 
@@ -782,6 +785,25 @@ class Vector(BaseType):
         )
         return expr
 
+    def groupby(self, labels, *, ngroups=None):
+        """
+        Group the values of this Vector by integer labels to aggregate each group.
+
+        ``labels`` is a Vector or 1-D array of nonnegative integers with the same size as
+        this Vector.  Values without a label (missing from a labels Vector) are ignored.
+        ``ngroups`` is the size of aggregated results and defaults to ``max(labels) + 1``.
+
+        >>> v.groupby(labels).agg(agg.mean)
+
+        Groups are aggregated with sparse products with an iso-valued assignment
+        Matrix, which is reused by each call to ``agg``.
+
+        *This is not a standard GraphBLAS function*
+        """
+        from ._groupby import VectorGroupBy
+
+        return VectorGroupBy(self, labels, ngroups)
+
     ##################################
     # Extract and Assign index methods
     ##################################
@@ -1049,6 +1071,7 @@ class VectorExpression(BaseExpression):
     ewise_mult = wrapdoc(Vector.ewise_mult)(property(_automethods.ewise_mult))
     ewise_union = wrapdoc(Vector.ewise_union)(property(_automethods.ewise_union))
     gb_obj = wrapdoc(Vector.gb_obj)(property(_automethods.gb_obj))
+    groupby = wrapdoc(Vector.groupby)(property(_automethods.groupby))
     inner = wrapdoc(Vector.inner)(property(_automethods.inner))
     isclose = wrapdoc(Vector.isclose)(property(_automethods.isclose))
     isequal = wrapdoc(Vector.isequal)(property(_automethods.isequal))
@@ -1119,6 +1142,7 @@ class VectorIndexExpr(AmbiguousAssignOrExtract):
     ewise_mult = wrapdoc(Vector.ewise_mult)(property(_automethods.ewise_mult))
     ewise_union = wrapdoc(Vector.ewise_union)(property(_automethods.ewise_union))
     gb_obj = wrapdoc(Vector.gb_obj)(property(_automethods.gb_obj))
+    groupby = wrapdoc(Vector.groupby)(property(_automethods.groupby))
     inner = wrapdoc(Vector.inner)(property(_automethods.inner))
     isclose = wrapdoc(Vector.isclose)(property(_automethods.isclose))
     isequal = wrapdoc(Vector.isequal)(property(_automethods.isequal))